@@ -0,0 +1,197 @@
+from src.database.Models import Actor, Movie, MovieActor, Show, ShowActor, Role
+from sqlalchemy import Engine, and_, func, literal, or_, select, tuple_, union_all
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import Session
+from typing import Dict, Any, Optional
+from app.common.CrudOperations import CrudOperations
+from app.common.pagination import encode_cursor, decode_cursor
+
+class ActorCrud:
+    """
+    A class to look up actors and their filmography across movies and shows.
+
+    Attributes:
+    -----------
+    engine : Engine
+        The database engine.
+    async_engine : Optional[AsyncEngine]
+        The asyncio database engine.
+    cd : CrudOperations
+        An instance of the CrudOperations class for session handling.
+    """
+
+    def __init__(self, engine: Engine, async_engine: Optional[AsyncEngine] = None):
+        """
+        Initializes the ActorCrud with the given database engines.
+
+        Parameters:
+        -----------
+        engine : Engine
+            The database engine.
+        async_engine : Optional[AsyncEngine], optional
+            The asyncio database engine (default is None).
+        """
+        self.engine = engine
+        self.async_engine = async_engine
+        self.cd = CrudOperations(self.engine, self.async_engine)
+
+    def get_actor_by_id(self, id: int) -> Optional[Dict[str, Any]]:
+        """
+        Retrieves an actor and the number of movies and shows they appear in.
+
+        Parameters:
+        -----------
+        id : int
+            The ID of the actor.
+
+        Returns:
+        --------
+        Optional[Dict[str, Any]]
+            A dictionary representing the actor, or None if not found.
+        """
+        with Session(bind=self.engine) as session:
+            return self._get_actor_by_id(session, id)
+
+    async def get_actor_by_id_async(self, id: int) -> Optional[Dict[str, Any]]:
+        """
+        Retrieves an actor and their title counts without blocking the event loop.
+
+        Parameters:
+        -----------
+        id : int
+            The ID of the actor.
+
+        Returns:
+        --------
+        Optional[Dict[str, Any]]
+            A dictionary representing the actor, or None if not found.
+        """
+        async with self.cd.async_session() as session:
+            return await session.run_sync(self._get_actor_by_id, id)
+
+    def _get_actor_by_id(self, session: Session, id: int) -> Optional[Dict[str, Any]]:
+        """
+        Retrieves an actor and their title counts using an open session.
+
+        Parameters:
+        -----------
+        session : Session
+            The database session.
+        id : int
+            The ID of the actor.
+
+        Returns:
+        --------
+        Optional[Dict[str, Any]]
+            A dictionary representing the actor, or None if not found.
+        """
+        movie_count = select(func.count(func.distinct(MovieActor.movie_id))).where(MovieActor.name == Actor.id).scalar_subquery()
+        show_count = select(func.count(func.distinct(ShowActor.show_id))).where(ShowActor.name == Actor.id).scalar_subquery()
+        row = session.execute(
+            select(Actor.id, Actor.name, movie_count.label('movie_count'), show_count.label('show_count')).where(Actor.id == id)
+        ).first()
+        return dict(row._mapping) if row is not None else None
+
+    def get_actor_titles_page(self, id: int, limit: int, after: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Retrieves one page of the movies and shows an actor appears in.
+
+        Parameters:
+        -----------
+        id : int
+            The ID of the actor.
+        limit : int
+            The maximum number of titles on the page.
+        after : Optional[str], optional
+            The cursor returned by the previous page (default is None).
+
+        Returns:
+        --------
+        Dict[str, Any]
+            A dictionary with the page ``items`` and the ``next_cursor``, which is None on the last page.
+        """
+        with Session(bind=self.engine) as session:
+            return self._get_actor_titles_page(session, id, limit, after)
+
+    async def get_actor_titles_page_async(self, id: int, limit: int, after: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Retrieves one page of an actor's titles without blocking the event loop.
+
+        Parameters:
+        -----------
+        id : int
+            The ID of the actor.
+        limit : int
+            The maximum number of titles on the page.
+        after : Optional[str], optional
+            The cursor returned by the previous page (default is None).
+
+        Returns:
+        --------
+        Dict[str, Any]
+            A dictionary with the page ``items`` and the ``next_cursor``, which is None on the last page.
+        """
+        async with self.cd.async_session() as session:
+            return await session.run_sync(self._get_actor_titles_page, id, limit, after)
+
+    def _get_actor_titles_page(self, session: Session, id: int, limit: int, after: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Retrieves one page of an actor's titles using an open session.
+
+        Movie and show credits are combined with a single ``UNION ALL`` query whose branches are
+        served by the indexes on ``movie_actor.name`` and ``show_actor.name``. Titles are ordered by
+        release year, newest first, then by title ID and role, and pages are located with a keyset
+        predicate on that order, so deep pages of prolific actors cost the same as the first one.
+
+        Parameters:
+        -----------
+        session : Session
+            The database session.
+        id : int
+            The ID of the actor.
+        limit : int
+            The maximum number of titles on the page.
+        after : Optional[str], optional
+            The cursor returned by the previous page (default is None).
+
+        Returns:
+        --------
+        Dict[str, Any]
+            A dictionary with the page ``items`` and the ``next_cursor``, which is None on the last page.
+
+        Raises:
+        -------
+        ValueError
+            If the cursor is malformed.
+        """
+        branches = [
+            select(literal(kind).label('type'), title_model.id, title_model.title, title_model.release_year, title_model.imdb_score,
+                   func.coalesce(title_model.release_year, 0).label('sort_year'), Role.role)
+            .select_from(actor_model)
+            .join(title_model, getattr(actor_model, title_key) == title_model.id)
+            .join(Role, actor_model.role == Role.id)
+            .where(actor_model.name == id)
+            for kind, title_model, actor_model, title_key in [('movie', Movie, MovieActor, 'movie_id'), ('show', Show, ShowActor, 'show_id')]
+        ]
+        titles = union_all(*branches).subquery()
+        statement = select(titles)
+        if after is not None:
+            cursor = decode_cursor(after, list)
+            if [type(value) for value in cursor] != [int, str, str]:
+                raise ValueError(f"Invalid cursor: {after}")
+            sort_year, title_id, role = cursor
+            statement = statement.where(or_(
+                titles.c.sort_year < sort_year,
+                and_(titles.c.sort_year == sort_year, tuple_(titles.c.id, titles.c.role) > tuple_(title_id, role)),
+            ))
+        statement = statement.order_by(titles.c.sort_year.desc(), titles.c.id, titles.c.role).limit(limit + 1)
+        rows = session.execute(statement).all()
+        next_cursor = None
+        if len(rows) > limit:
+            last = rows[limit - 1]
+            next_cursor = encode_cursor([last.sort_year, last.id, last.role])
+        items = [
+            {'type': row.type, 'id': row.id, 'title': row.title, 'release_year': row.release_year, 'imdb_score': row.imdb_score, 'role': row.role}
+            for row in rows[:limit]
+        ]
+        return {'items': items, 'next_cursor': next_cursor}
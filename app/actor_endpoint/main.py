@@ -0,0 +1,24 @@
+from fastapi import APIRouter, HTTPException, Query, Request
+from .crud import ActorCrud
+from app.common.deps import engine, async_engine
+from app.common.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from app.common.etag import conditional_response
+from typing import Optional
+
+router = APIRouter(
+    prefix='/actor'
+)
+
+actor_crud: ActorCrud = ActorCrud(engine, async_engine)
+
+@router.get('/{actor_id}/titles',tags=['actor'])
+async def get_actor_titles(request: Request, actor_id: int, limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE), after: Optional[str] = None):
+    try:
+        page = await actor_crud.get_actor_titles_page_async(actor_id, limit, after)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return conditional_response(request, page)
+
+@router.get('/{actor_id}',tags=['actor'])
+async def get_actor_by_id(request: Request, actor_id: int):
+    return conditional_response(request, await actor_crud.get_actor_by_id_async(actor_id))
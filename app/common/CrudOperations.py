@@ -1,28 +1,74 @@
-from typing import Dict, Any, Type, List
-from sqlalchemy.orm import Session
-from sqlalchemy.sql import func
-from src.database.Models import Movie, Actor, Show, MovieGenres, MovieProductionCountry
+import operator
+from typing import Dict, Any, Type, List, Optional, Iterator, AsyncIterator, Set
+from sqlalchemy import func, insert, literal, literal_column, null, select, true, union_all
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session, joinedload, selectinload
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from src.database.Models import Actor, Role
+from app.common.pagination import encode_cursor, decode_cursor
+from app.common.cache import TTLCache
+from app.common.dimension import DimensionCache
+from app.common.search import SEARCH_FILTERS, parse_sort
+
+# The role written for actors that are posted without one
+DEFAULT_ACTOR_ROLE = 'ACTOR'
+
+# The dialect inserts that support ON CONFLICT DO NOTHING for upserting dimension names
+UPSERT_INSERTS = {'postgresql': pg_insert, 'sqlite': sqlite_insert}
 
 class CrudOperations:
     """
     A class to perform CRUD operations on a database using SQLAlchemy.
 
+    Every operation is implemented once against a session and exposed both as a
+    synchronous method and as an ``_async`` coroutine running on the asyncio engine.
+
     Attributes:
     -----------
     engine : Any
         The database engine.
+    async_engine : Optional[AsyncEngine]
+        The asyncio database engine used by the ``_async`` methods.
+    cache : Optional[TTLCache]
+        The cache placed in front of ``get_item_by_id``.
+    dimension_cache : Optional[DimensionCache]
+        The name to ID cache for actors, roles, genres and production countries used on write.
     """
 
-    def __init__(self, engine):
+    def __init__(self, engine, async_engine: Optional[AsyncEngine] = None, cache: Optional[TTLCache] = None, dimension_cache: Optional[DimensionCache] = None):
         """
-        Initializes the CrudOperations with the given database engine.
+        Initializes the CrudOperations with the given database engines.
 
         Parameters:
         -----------
         engine : Any
             The database engine.
+        async_engine : Optional[AsyncEngine], optional
+            The asyncio database engine (default is None).
+        cache : Optional[TTLCache], optional
+            The cache for item details, keyed by table name and ID (default is None).
+        dimension_cache : Optional[DimensionCache], optional
+            The name to ID cache for dimension tables (default is None).
         """
         self.engine = engine
+        self.async_engine = async_engine
+        self.cache = cache
+        self.dimension_cache = dimension_cache
+
+    def async_session(self) -> AsyncSession:
+        """
+        Creates a new async session bound to the asyncio engine.
+
+        Returns:
+        --------
+        AsyncSession
+            The async database session.
+        """
+        if self.async_engine is None:
+            raise RuntimeError("CrudOperations was created without an async engine")
+        return AsyncSession(bind=self.async_engine, expire_on_commit=False)
 
     def get_all_items(self, item_class: Type[Any]) -> List[Dict[str, Any]]:
         """
@@ -39,12 +85,318 @@ class CrudOperations:
             A list of dictionaries representing the items.
         """
         with Session(bind=self.engine) as session:
-            items = session.query(item_class).all()
-            return items
+            return self._get_all_items(session, item_class)
+
+    async def get_all_items_async(self, item_class: Type[Any]) -> List[Dict[str, Any]]:
+        """
+        Retrieves all items of a given class from the database without blocking the event loop.
+
+        Parameters:
+        -----------
+        item_class : Type[Any]
+            The class of the items to retrieve.
+
+        Returns:
+        --------
+        List[Dict[str, Any]]
+            A list of dictionaries representing the items.
+        """
+        async with self.async_session() as session:
+            return await session.run_sync(self._get_all_items, item_class)
+
+    def _get_all_items(self, session: Session, item_class: Type[Any]) -> List[Dict[str, Any]]:
+        """
+        Retrieves all items of a given class using an open session, ordered by ID.
+
+        Parameters:
+        -----------
+        session : Session
+            The database session.
+        item_class : Type[Any]
+            The class of the items to retrieve.
+
+        Returns:
+        --------
+        List[Dict[str, Any]]
+            A list of dictionaries representing the items.
+        """
+        items = session.query(item_class).order_by(item_class.id).all()
+        return [self.to_dict(item) for item in items]
+
+    def get_items_version(self, item_class: Type[Any]) -> List[Any]:
+        """
+        Reads a version key of a table that changes whenever its rows do.
+
+        Parameters:
+        -----------
+        item_class : Type[Any]
+            The class of the items.
+
+        Returns:
+        --------
+        List[Any]
+            The version key, see ``_get_items_version``.
+        """
+        with Session(bind=self.engine) as session:
+            return self._get_items_version(session, item_class)
+
+    async def get_items_version_async(self, item_class: Type[Any]) -> List[Any]:
+        """
+        Reads a version key of a table without blocking the event loop.
+
+        Parameters:
+        -----------
+        item_class : Type[Any]
+            The class of the items.
+
+        Returns:
+        --------
+        List[Any]
+            The version key, see ``_get_items_version``.
+        """
+        async with self.async_session() as session:
+            return await session.run_sync(self._get_items_version, item_class)
+
+    def _get_items_version(self, session: Session, item_class: Type[Any]) -> List[Any]:
+        """
+        Reads a version key of a table using an open session.
+
+        The key is the row count, the largest ID and, on PostgreSQL, the newest row version
+        (``xmin``), aggregated in the database without transferring any row. Inserts and deletes
+        change the key everywhere; updates in place change it on PostgreSQL only.
+
+        Parameters:
+        -----------
+        session : Session
+            The database session.
+        item_class : Type[Any]
+            The class of the items.
+
+        Returns:
+        --------
+        List[Any]
+            The values of the version key.
+        """
+        columns = [func.count(), func.max(item_class.id)]
+        if session.get_bind().dialect.name == 'postgresql':
+            columns.append(func.max(literal_column('xmin::text::bigint')))
+        return list(session.execute(select(*columns).select_from(item_class)).one())
+
+    def get_items_page(self, item_class: Type[Any], limit: int, after: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Retrieves one page of items ordered by ID, continuing after the given cursor.
+
+        Parameters:
+        -----------
+        item_class : Type[Any]
+            The class of the items to retrieve.
+        limit : int
+            The maximum number of items on the page.
+        after : Optional[str], optional
+            The cursor returned by the previous page (default is None).
+
+        Returns:
+        --------
+        Dict[str, Any]
+            A dictionary with the page ``items`` and the ``next_cursor``, which is None on the last page.
+        """
+        with Session(bind=self.engine) as session:
+            return self._get_items_page(session, item_class, limit, after)
 
-    def get_item_by_id(self, item_class: Type[Any], id: str, actor_class: Type[Any], actor_relation: Type[Any], production_country_class: Type[Any], production_relation: Any) -> Dict[str, Any]:
+    async def get_items_page_async(self, item_class: Type[Any], limit: int, after: Optional[str] = None) -> Dict[str, Any]:
         """
-        Retrieves an item by its ID from the database, including related actors and production countries.
+        Retrieves one page of items ordered by ID without blocking the event loop.
+
+        Parameters:
+        -----------
+        item_class : Type[Any]
+            The class of the items to retrieve.
+        limit : int
+            The maximum number of items on the page.
+        after : Optional[str], optional
+            The cursor returned by the previous page (default is None).
+
+        Returns:
+        --------
+        Dict[str, Any]
+            A dictionary with the page ``items`` and the ``next_cursor``, which is None on the last page.
+        """
+        async with self.async_session() as session:
+            return await session.run_sync(self._get_items_page, item_class, limit, after)
+
+    def _get_items_page(self, session: Session, item_class: Type[Any], limit: int, after: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Retrieves one page of items using an open session.
+
+        The page is located with a keyset predicate on the primary key, so the cost per page
+        does not depend on how deep into the table the page is.
+
+        Parameters:
+        -----------
+        session : Session
+            The database session.
+        item_class : Type[Any]
+            The class of the items to retrieve.
+        limit : int
+            The maximum number of items on the page.
+        after : Optional[str], optional
+            The cursor returned by the previous page (default is None).
+
+        Returns:
+        --------
+        Dict[str, Any]
+            A dictionary with the page ``items`` and the ``next_cursor``, which is None on the last page.
+        """
+        query = session.query(item_class)
+        if after is not None:
+            query = query.filter(item_class.id > decode_cursor(after))
+        items = query.order_by(item_class.id).limit(limit + 1).all()
+        next_cursor = encode_cursor(items[limit - 1].id) if len(items) > limit else None
+        return {'items': [self.to_dict(item) for item in items[:limit]], 'next_cursor': next_cursor}
+
+    def search_items(self, item_class: Type[Any], filters: Dict[str, Any], sort: str, limit: int) -> List[Dict[str, Any]]:
+        """
+        Retrieves the items matching the given filters, sorted and limited in the database.
+
+        Parameters:
+        -----------
+        item_class : Type[Any]
+            The class of the items to search.
+        filters : Dict[str, Any]
+            The filter values by query parameter name, see ``SEARCH_FILTERS``; None values are ignored.
+        sort : str
+            The column to sort by, prefixed with ``-`` for descending order.
+        limit : int
+            The maximum number of items returned.
+
+        Returns:
+        --------
+        List[Dict[str, Any]]
+            Dictionaries representing the matching items.
+        """
+        with Session(bind=self.engine) as session:
+            return self._search_items(session, item_class, filters, sort, limit)
+
+    async def search_items_async(self, item_class: Type[Any], filters: Dict[str, Any], sort: str, limit: int) -> List[Dict[str, Any]]:
+        """
+        Retrieves the items matching the given filters without blocking the event loop.
+
+        Parameters:
+        -----------
+        item_class : Type[Any]
+            The class of the items to search.
+        filters : Dict[str, Any]
+            The filter values by query parameter name, see ``SEARCH_FILTERS``; None values are ignored.
+        sort : str
+            The column to sort by, prefixed with ``-`` for descending order.
+        limit : int
+            The maximum number of items returned.
+
+        Returns:
+        --------
+        List[Dict[str, Any]]
+            Dictionaries representing the matching items.
+        """
+        async with self.async_session() as session:
+            return await session.run_sync(self._search_items, item_class, filters, sort, limit)
+
+    def _search_items(self, session: Session, item_class: Type[Any], filters: Dict[str, Any], sort: str, limit: int) -> List[Dict[str, Any]]:
+        """
+        Retrieves the items matching the given filters using an open session.
+
+        Every filter becomes a predicate of a single ``SELECT``, ordered by the sort column with the
+        ID as tie breaker. Items without a value in the sort column come last. On PostgreSQL the
+        descending score and year orders, including the default ``-imdb_score``, match the
+        ``ix_<table>_imdb_score_desc_id`` and ``ix_<table>_release_year_desc_id`` indexes, so those
+        searches read the first matches in index order; other orders are sorted after filtering.
+
+        Parameters:
+        -----------
+        session : Session
+            The database session.
+        item_class : Type[Any]
+            The class of the items to search.
+        filters : Dict[str, Any]
+            The filter values by query parameter name, see ``SEARCH_FILTERS``; None values are ignored.
+        sort : str
+            The column to sort by, prefixed with ``-`` for descending order.
+        limit : int
+            The maximum number of items returned.
+
+        Returns:
+        --------
+        List[Dict[str, Any]]
+            Dictionaries representing the matching items.
+
+        Raises:
+        -------
+        ValueError
+            If a filter or the sort column is unknown.
+        """
+        statement = select(item_class.__table__)
+        for name, value in filters.items():
+            if value is None:
+                continue
+            if name not in SEARCH_FILTERS:
+                raise ValueError(f"Unknown filter: {name}")
+            column, comparison = SEARCH_FILTERS[name]
+            statement = statement.where(getattr(operator, comparison)(getattr(item_class, column), value))
+        sort_column, descending = parse_sort(sort)
+        if descending:
+            statement = statement.order_by(getattr(item_class, sort_column).desc().nulls_last(), item_class.id.desc())
+        else:
+            statement = statement.order_by(getattr(item_class, sort_column).asc().nulls_last(), item_class.id)
+        return [dict(row._mapping) for row in session.execute(statement.limit(limit))]
+
+    def stream_all_items(self, item_class: Type[Any], chunk_size: int = 1000) -> Iterator[Dict[str, Any]]:
+        """
+        Streams all items of a given class from the database with a server-side cursor.
+
+        Rows are fetched ``chunk_size`` at a time and yielded as plain dictionaries, so memory
+        use does not grow with the size of the table.
+
+        Parameters:
+        -----------
+        item_class : Type[Any]
+            The class of the items to retrieve.
+        chunk_size : int, optional
+            The number of rows fetched per round trip (default is 1000).
+
+        Yields:
+        -------
+        Iterator[Dict[str, Any]]
+            Dictionaries representing the items, ordered by ID.
+        """
+        statement = select(item_class.__table__).order_by(item_class.id).execution_options(yield_per=chunk_size)
+        with Session(bind=self.engine) as session:
+            for row in session.execute(statement):
+                yield dict(row._mapping)
+
+    async def stream_all_items_async(self, item_class: Type[Any], chunk_size: int = 1000) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Streams all items of a given class from the database with a server-side cursor without blocking the event loop.
+
+        Parameters:
+        -----------
+        item_class : Type[Any]
+            The class of the items to retrieve.
+        chunk_size : int, optional
+            The number of rows fetched per round trip (default is 1000).
+
+        Yields:
+        -------
+        AsyncIterator[Dict[str, Any]]
+            Dictionaries representing the items, ordered by ID.
+        """
+        statement = select(item_class.__table__).order_by(item_class.id).execution_options(yield_per=chunk_size)
+        async with self.async_session() as session:
+            result = await session.stream(statement)
+            async for row in result:
+                yield dict(row._mapping)
+
+    def get_item_by_id(self, item_class: Type[Any], id: str, actors: Any, genres: Any, production_countries: Any) -> Dict[str, Any]:
+        """
+        Retrieves an item by its ID from the database, including its actors with roles, genres and production countries.
 
         Parameters:
         -----------
@@ -52,83 +404,297 @@ class CrudOperations:
             The class of the item to retrieve.
         id : str
             The ID of the item.
-        actor_class : Type[Any]
-            The class of the actors related to the item.
-        actor_relation : Type[Any]
-            The relation class for actors.
-        production_country_class : Type[Any]
-            The class of the production countries related to the item.
-        production_relation : Any
-            The relation table for production countries.
+        actors : Any
+            The relationship attribute from the item to its actor relation rows.
+        genres : Any
+            The relationship attribute from the item to its genres.
+        production_countries : Any
+            The relationship attribute from the item to its production countries.
 
         Returns:
         --------
         Dict[str, Any]
             A dictionary representing the item, or None if not found.
         """
-        with Session(bind=self.engine) as session:
-            item = session.query(item_class).filter(item_class.id == id).first()
-            if item:
-                item_dict = self.to_dict(item)
-                item_dict['actors'] = self.get_item_actors(item.id, actor_class, actor_relation)
-                item_dict['production_countries'] = self.get_item_production_countries(item.id, production_country_class, production_relation)
-                return item_dict
-            return None
+        item_dict = self.get_cached_item(item_class, id)
+        if item_dict is None:
+            with Session(bind=self.engine) as session:
+                item_dict = self._get_item_by_id(session, item_class, id, actors, genres, production_countries)
+            self.set_cached_item(item_class, id, item_dict)
+        return item_dict
 
-    def get_item_actors(self, item_id: str, actor_class: Type[Any], actor_relation: Type[Any]) -> List[Dict[str, Any]]:
+    async def get_item_by_id_async(self, item_class: Type[Any], id: str, actors: Any, genres: Any, production_countries: Any) -> Dict[str, Any]:
         """
-        Retrieves the actors related to a given item ID.
+        Retrieves an item by its ID without blocking the event loop, including its actors with roles, genres and production countries.
 
         Parameters:
         -----------
-        item_id : str
+        item_class : Type[Any]
+            The class of the item to retrieve.
+        id : str
+            The ID of the item.
+        actors : Any
+            The relationship attribute from the item to its actor relation rows.
+        genres : Any
+            The relationship attribute from the item to its genres.
+        production_countries : Any
+            The relationship attribute from the item to its production countries.
+
+        Returns:
+        --------
+        Dict[str, Any]
+            A dictionary representing the item, or None if not found.
+        """
+        item_dict = self.get_cached_item(item_class, id)
+        if item_dict is None:
+            async with self.async_session() as session:
+                item_dict = await session.run_sync(self._get_item_by_id, item_class, id, actors, genres, production_countries)
+            self.set_cached_item(item_class, id, item_dict)
+        return item_dict
+
+    def _get_item_by_id(self, session: Session, item_class: Type[Any], id: str, actors: Any, genres: Any, production_countries: Any) -> Dict[str, Any]:
+        """
+        Retrieves an item by its ID using an open session.
+
+        The actors with their roles, the genres and the production countries are combined with
+        ``UNION ALL`` and left-joined onto the item, so the whole detail is fetched by one statement
+        returning one row per related row, not the product of the three collections.
+
+        Parameters:
+        -----------
+        session : Session
+            The database session.
+        item_class : Type[Any]
+            The class of the item to retrieve.
+        id : str
             The ID of the item.
-        actor_class : Type[Any]
-            The class of the actors.
-        actor_relation : Type[Any]
-            The relation class for actors.
+        actors : Any
+            The relationship attribute from the item to its actor relation rows.
+        genres : Any
+            The relationship attribute from the item to its genres.
+        production_countries : Any
+            The relationship attribute from the item to its production countries.
+
+        Returns:
+        --------
+        Dict[str, Any]
+            A dictionary representing the item, or None if not found.
+        """
+        item_key = f'{item_class.__tablename__}_id'
+        actor_relation = actors.property.mapper.class_
+        branches = [
+            select(literal('actors').label('kind'), actor_relation.id.label('position'), Actor.id.label('related_id'),
+                   Actor.name.label('value'), Role.role.label('related_role'))
+            .select_from(actor_relation)
+            .join(Actor, actor_relation.name == Actor.id)
+            .outerjoin(Role, actor_relation.role == Role.id)
+            .where(getattr(actor_relation, item_key) == id)
+        ]
+        value_columns: Dict[str, str] = {}
+        for kind, relationship in [('genres', genres), ('production_countries', production_countries)]:
+            link_table, dimension_model = relationship.property.secondary, relationship.property.mapper.class_
+            value_column = next(column for column in dimension_model.__table__.columns if not column.primary_key)
+            value_columns[kind] = value_column.name
+            branches.append(
+                select(literal(kind).label('kind'), link_table.c.id.label('position'), dimension_model.id.label('related_id'),
+                       value_column.label('value'), null().label('related_role'))
+                .select_from(link_table.join(dimension_model, relationship.property.secondaryjoin))
+                .where(link_table.c[item_key] == id)
+            )
+        related = union_all(*branches).subquery()
+        statement = (
+            select(item_class.__table__, related)
+            .outerjoin(related, true())
+            .where(item_class.id == id)
+            .order_by(related.c.kind, related.c.position)
+        )
+        rows = session.execute(statement).all()
+        if not rows:
+            return None
+        item_dict = {column.name: rows[0]._mapping[column] for column in item_class.__table__.columns}
+        item_dict.update({'actors': [], 'genres': [], 'production_countries': []})
+        for row in rows:
+            if row.kind == 'actors':
+                item_dict['actors'].append({'id': row.related_id, 'name': row.value, 'role': row.related_role})
+            elif row.kind is not None:
+                item_dict[row.kind].append({'id': row.related_id, value_columns[row.kind]: row.value})
+        return item_dict
+
+    def get_items_by_ids(self, item_class: Type[Any], ids: List[str], actors: Any, genres: Any, production_countries: Any) -> List[Dict[str, Any]]:
+        """
+        Retrieves several items by their IDs, including their actors with roles, genres and production countries.
+
+        Parameters:
+        -----------
+        item_class : Type[Any]
+            The class of the items to retrieve.
+        ids : List[str]
+            The IDs of the items.
+        actors : Any
+            The relationship attribute from the item to its actor relation rows.
+        genres : Any
+            The relationship attribute from the item to its genres.
+        production_countries : Any
+            The relationship attribute from the item to its production countries.
 
         Returns:
         --------
         List[Dict[str, Any]]
-            A list of dictionaries representing the actors.
+            Dictionaries representing the items found, in the order of ``ids``.
         """
         with Session(bind=self.engine) as session:
-            if hasattr(actor_relation, 'movie_id'):
-                filter_condition = actor_relation.movie_id == item_id
-            else:
-                filter_condition = actor_relation.show_id == item_id
+            return self._get_items_by_ids(session, item_class, ids, actors, genres, production_countries)
 
-            actors = session.query(actor_class).join(actor_relation, actor_class.id == actor_relation.id).filter(filter_condition).all()
-            return [self.to_dict(actor) for actor in actors]
+    async def get_items_by_ids_async(self, item_class: Type[Any], ids: List[str], actors: Any, genres: Any, production_countries: Any) -> List[Dict[str, Any]]:
+        """
+        Retrieves several items by their IDs without blocking the event loop.
 
-    def get_item_production_countries(self, item_id: str, production_country_class: Type[Any], production_relation: Any) -> List[Dict[str, Any]]:
+        Parameters:
+        -----------
+        item_class : Type[Any]
+            The class of the items to retrieve.
+        ids : List[str]
+            The IDs of the items.
+        actors : Any
+            The relationship attribute from the item to its actor relation rows.
+        genres : Any
+            The relationship attribute from the item to its genres.
+        production_countries : Any
+            The relationship attribute from the item to its production countries.
+
+        Returns:
+        --------
+        List[Dict[str, Any]]
+            Dictionaries representing the items found, in the order of ``ids``.
         """
-        Retrieves the production countries related to a given item ID.
+        async with self.async_session() as session:
+            return await session.run_sync(self._get_items_by_ids, item_class, ids, actors, genres, production_countries)
+
+    def _get_items_by_ids(self, session: Session, item_class: Type[Any], ids: List[str], actors: Any, genres: Any, production_countries: Any) -> List[Dict[str, Any]]:
+        """
+        Retrieves several items by their IDs using an open session.
+
+        Related rows are select-in loaded, so the lookup costs one ``IN (...)`` query for the
+        items plus one per relationship, regardless of how many IDs are requested.
 
         Parameters:
         -----------
-        item_id : str
-            The ID of the item.
-        production_country_class : Type[Any]
-            The class of the production countries.
-        production_relation : Any
-            The relation table for production countries.
+        session : Session
+            The database session.
+        item_class : Type[Any]
+            The class of the items to retrieve.
+        ids : List[str]
+            The IDs of the items.
+        actors : Any
+            The relationship attribute from the item to its actor relation rows.
+        genres : Any
+            The relationship attribute from the item to its genres.
+        production_countries : Any
+            The relationship attribute from the item to its production countries.
 
         Returns:
         --------
         List[Dict[str, Any]]
-            A list of dictionaries representing the production countries.
+            Dictionaries representing the items found, in the order of ``ids``.
         """
-        if hasattr(production_relation.c, 'movie_id'):
-            filter_condition = production_relation.c.movie_id == item_id
-        else:
-            filter_condition = production_relation.c.show_id == item_id
-        with Session(bind=self.engine) as session:
-            production_countries = session.query(production_country_class).join(production_relation, production_country_class.id == production_relation.c.production_country_id).filter(filter_condition).all()
-            return [self.to_dict(production_country) for production_country in production_countries]
+        actor_relation = actors.property.mapper.class_
+        statement = (
+            select(item_class)
+            .where(item_class.id.in_(ids))
+            .options(
+                selectinload(actors).joinedload(actor_relation.actor),
+                selectinload(actors).joinedload(actor_relation.actor_role),
+                selectinload(genres),
+                selectinload(production_countries),
+            )
+        )
+        items = {item.id: item for item in session.scalars(statement)}
+        return [self.item_detail_to_dict(items[id], actors, genres, production_countries) for id in ids if id in items]
+
+    def get_cached_item(self, item_class: Type[Any], id: str) -> Optional[Dict[str, Any]]:
+        """
+        Returns the cached detail of an item, or None if there is no cache or no valid entry.
+
+        Parameters:
+        -----------
+        item_class : Type[Any]
+            The class of the item.
+        id : str
+            The ID of the item.
+
+        Returns:
+        --------
+        Optional[Dict[str, Any]]
+            The cached dictionary representing the item, or None.
+        """
+        if self.cache is None:
+            return None
+        return self.cache.get((item_class.__tablename__, id))
+
+    def set_cached_item(self, item_class: Type[Any], id: str, item_dict: Optional[Dict[str, Any]]) -> None:
+        """
+        Stores the detail of an item in the cache. Missing items are not cached.
+
+        Parameters:
+        -----------
+        item_class : Type[Any]
+            The class of the item.
+        id : str
+            The ID of the item.
+        item_dict : Optional[Dict[str, Any]]
+            The dictionary representing the item, or None if it was not found.
+        """
+        if self.cache is not None and item_dict is not None:
+            self.cache.set((item_class.__tablename__, id), item_dict)
 
-    def insert_item_into_database(self, item: Any, item_model: Type[Any], actor_model: Type[Any], actor_relation_model: Type[Any], genre_model: Type[Any], genre_relation_table: Any, production_country_model: Type[Any], production_country_relation_table: Any) -> None:
+    def invalidate_cached_item(self, item_class: Type[Any], id: str) -> None:
+        """
+        Removes the cached detail of an item after it has been written.
+
+        Parameters:
+        -----------
+        item_class : Type[Any]
+            The class of the item.
+        id : str
+            The ID of the item.
+        """
+        if self.cache is not None:
+            self.cache.invalidate((item_class.__tablename__, id))
+
+    def item_detail_to_dict(self, item: Any, actors: Any, genres: Any, production_countries: Any) -> Dict[str, Any]:
+        """
+        Converts a loaded item and its related rows to a dictionary.
+
+        Parameters:
+        -----------
+        item : Any
+            The SQLAlchemy model instance with its relationships loaded.
+        actors : Any
+            The relationship attribute from the item to its actor relation rows.
+        genres : Any
+            The relationship attribute from the item to its genres.
+        production_countries : Any
+            The relationship attribute from the item to its production countries.
+
+        Returns:
+        --------
+        Dict[str, Any]
+            A dictionary representing the item with ``actors``, ``genres`` and ``production_countries``.
+        """
+        item_dict = self.to_dict(item)
+        item_dict['actors'] = [
+            {
+                'id': actor_relation.actor.id,
+                'name': actor_relation.actor.name,
+                'role': actor_relation.actor_role.role if actor_relation.actor_role else None,
+            }
+            for actor_relation in getattr(item, actors.key)
+        ]
+        item_dict['genres'] = [self.to_dict(genre) for genre in getattr(item, genres.key)]
+        item_dict['production_countries'] = [self.to_dict(production_country) for production_country in getattr(item, production_countries.key)]
+        return item_dict
+
+    def insert_item_into_database(self, item: Any, item_model: Type[Any], actor_model: Type[Any], genre_model: Type[Any], genre_relation_table: Any, production_country_model: Type[Any], production_country_relation_table: Any) -> None:
         """
         Inserts a new item into the database, including related actors, genres, and production countries.
 
@@ -139,9 +705,7 @@ class CrudOperations:
         item_model : Type[Any]
             The model class for the item.
         actor_model : Type[Any]
-            The model class for actors.
-        actor_relation_model : Type[Any]
-            The relation model class for actors.
+            The model class relating actors to the item.
         genre_model : Type[Any]
             The model class for genres.
         genre_relation_table : Any
@@ -151,236 +715,370 @@ class CrudOperations:
         production_country_relation_table : Any
             The relation table for production countries.
         """
-        db_item = item_model(**item.model_dump(exclude={"actors", "genres", "production_countries"}))
         with Session(bind=self.engine) as session:
-            session.add(db_item)
-            session.commit()
-            session.refresh(db_item)
-            for actor in item.actors:
-                db_actor = self.add_actor(session, actor)
-                item_actor = self.create_actor_relation(actor_relation_model, db_item.id, db_actor.id, item_model)
-                self.add_actor_relation(session, item_actor, actor_model)
-            self.add_genre_relation(session, item.genres, db_item.id, genre_model, genre_relation_table)
-            self.add_production_country_relation(session, item.production_countries, db_item.id, production_country_model, production_country_relation_table)
+            self._insert_item_into_database(session, item, item_model, actor_model, genre_model, genre_relation_table, production_country_model, production_country_relation_table)
+        self.invalidate_cached_item(item_model, item.id)
 
-    def create_actor_relation(self, actor_relation_model: Type[Any], item_id: int, actor_id: int, item_type: Any) -> Any:
+    async def insert_item_into_database_async(self, item: Any, item_model: Type[Any], actor_model: Type[Any], genre_model: Type[Any], genre_relation_table: Any, production_country_model: Type[Any], production_country_relation_table: Any) -> None:
         """
-        Creates a new actor relation for a given item.
+        Inserts a new item into the database without blocking the event loop, including related actors, genres, and production countries.
 
         Parameters:
         -----------
-        actor_relation_model : Type[Any]
-            The relation model class for actors.
-        item_id : int
-            The ID of the item.
-        actor_id : int
-            The ID of the actor.
-        item_type : Any
-            The type of the item (Movie or Show).
+        item : Any
+            The item to insert.
+        item_model : Type[Any]
+            The model class for the item.
+        actor_model : Type[Any]
+            The model class relating actors to the item.
+        genre_model : Type[Any]
+            The model class for genres.
+        genre_relation_table : Any
+            The relation table for genres.
+        production_country_model : Type[Any]
+            The model class for production countries.
+        production_country_relation_table : Any
+            The relation table for production countries.
+        """
+        async with self.async_session() as session:
+            await session.run_sync(self._insert_item_into_database, item, item_model, actor_model, genre_model, genre_relation_table, production_country_model, production_country_relation_table)
+        self.invalidate_cached_item(item_model, item.id)
 
-        Returns:
-        --------
-        Any
-            The created actor relation.
+    def _insert_item_into_database(self, session: Session, item: Any, item_model: Type[Any], actor_model: Type[Any], genre_model: Type[Any], genre_relation_table: Any, production_country_model: Type[Any], production_country_relation_table: Any) -> None:
         """
-        if item_type == Movie:
-            return actor_relation_model(movie_id=item_id, name=actor_id, role=1)
-        elif item_type == Show:
-            return actor_relation_model(show_id=item_id, name=actor_id, role=1)
-        else:
-            raise ValueError("Unknown item type")
-        
-    def create_genre_relation(self, actor_relation_model: Type[Any], item_id: int, actor_id: int, item_type: Any) -> Any:
+        Inserts a new item using an open session, including related actors, genres, and production countries.
+
+        The whole item graph is written in one transaction with a single commit.
+
+        Parameters:
+        -----------
+        session : Session
+            The database session.
+        item : Any
+            The item to insert.
+        item_model : Type[Any]
+            The model class for the item.
+        actor_model : Type[Any]
+            The model class relating actors to the item.
+        genre_model : Type[Any]
+            The model class for genres.
+        genre_relation_table : Any
+            The relation table for genres.
+        production_country_model : Type[Any]
+            The model class for production countries.
+        production_country_relation_table : Any
+            The relation table for production countries.
+        """
+        try:
+            self._write_items(session, [item], item_model, actor_model, genre_model, genre_relation_table, production_country_model, production_country_relation_table)
+            self.commit_session(session)
+        except SQLAlchemyError:
+            self.rollback_session(session)
+            raise
+
+    def bulk_insert_items(self, items: List[Any], item_model: Type[Any], actor_model: Type[Any], genre_model: Type[Any], genre_relation_table: Any, production_country_model: Type[Any], production_country_relation_table: Any) -> Dict[str, Any]:
         """
-        Creates a new genre relation for a given item.
+        Inserts many new items and their related actors, genres and production countries in one transaction.
 
         Parameters:
         -----------
-        actor_relation_model : Type[Any]
-            The relation model class for genres.
-        item_id : int
-            The ID of the item.
-        actor_id : int
-            The ID of the genre.
-        item_type : Any
-            The type of the item (Movie or Show).
+        items : List[Any]
+            The items to insert.
+        item_model : Type[Any]
+            The model class for the items.
+        actor_model : Type[Any]
+            The model class relating actors to the items.
+        genre_model : Type[Any]
+            The model class for genres.
+        genre_relation_table : Any
+            The relation table for genres.
+        production_country_model : Type[Any]
+            The model class for production countries.
+        production_country_relation_table : Any
+            The relation table for production countries.
 
         Returns:
         --------
-        Any
-            The created genre relation.
+        Dict[str, Any]
+            The IDs that were ``inserted`` and the per-item ``errors`` with the item's index, ID and reason.
         """
-        if item_type == Movie:
-            return actor_relation_model(movie_id=item_id, name=actor_id, role=1)
-        elif item_type == Show:
-            return actor_relation_model(show_id=item_id, name=actor_id, role=1)
-        else:
-            raise ValueError("Unknown item type")
+        with Session(bind=self.engine) as session:
+            result = self._bulk_insert_items(session, items, item_model, actor_model, genre_model, genre_relation_table, production_country_model, production_country_relation_table)
+        for id in result['inserted']:
+            self.invalidate_cached_item(item_model, id)
+        return result
 
-    def add_actor(self, session: Session, actor: Any) -> Any:
+    async def bulk_insert_items_async(self, items: List[Any], item_model: Type[Any], actor_model: Type[Any], genre_model: Type[Any], genre_relation_table: Any, production_country_model: Type[Any], production_country_relation_table: Any) -> Dict[str, Any]:
         """
-        Adds a new actor to the database, or retrieves the existing one.
+        Inserts many new items in one transaction without blocking the event loop.
 
         Parameters:
         -----------
-        session : Session
-            The database session.
-        actor : Any
-            The actor to add.
+        items : List[Any]
+            The items to insert.
+        item_model : Type[Any]
+            The model class for the items.
+        actor_model : Type[Any]
+            The model class relating actors to the items.
+        genre_model : Type[Any]
+            The model class for genres.
+        genre_relation_table : Any
+            The relation table for genres.
+        production_country_model : Type[Any]
+            The model class for production countries.
+        production_country_relation_table : Any
+            The relation table for production countries.
 
         Returns:
         --------
-        Any
-            The added or existing actor.
-        """
-        db_actor = session.query(Actor).filter(Actor.name == actor.name).first()
-        if db_actor:
-            return db_actor
-        db_actor = Actor(**actor.model_dump())
-        db_actor.id = self.get_max_id(session, Actor) + 1
-        session.add(db_actor)
-        session.commit()
-        session.refresh(db_actor)
-        return db_actor
-    
-    def add_actor_relation(self, session: Session, actor_relation: Any, actor_model: Type[Any]) -> None:
+        Dict[str, Any]
+            The IDs that were ``inserted`` and the per-item ``errors`` with the item's index, ID and reason.
+        """
+        async with self.async_session() as session:
+            result = await session.run_sync(self._bulk_insert_items, items, item_model, actor_model, genre_model, genre_relation_table, production_country_model, production_country_relation_table)
+        for id in result['inserted']:
+            self.invalidate_cached_item(item_model, id)
+        return result
+
+    def _bulk_insert_items(self, session: Session, items: List[Any], item_model: Type[Any], actor_model: Type[Any], genre_model: Type[Any], genre_relation_table: Any, production_country_model: Type[Any], production_country_relation_table: Any) -> Dict[str, Any]:
         """
-        Adds a new actor relation to the database.
+        Inserts many new items using an open session.
+
+        Items whose ID is repeated in the batch or already stored are reported and skipped.
+        The rest are written with multi-row inserts in one savepoint; if the database rejects
+        that batch, each item is retried in its own savepoint so only the failing items are
+        reported and the valid ones are still committed.
 
         Parameters:
         -----------
         session : Session
             The database session.
-        actor_relation : Any
-            The actor relation to add.
+        items : List[Any]
+            The items to insert.
+        item_model : Type[Any]
+            The model class for the items.
         actor_model : Type[Any]
-            The model class for actors.
+            The model class relating actors to the items.
+        genre_model : Type[Any]
+            The model class for genres.
+        genre_relation_table : Any
+            The relation table for genres.
+        production_country_model : Type[Any]
+            The model class for production countries.
+        production_country_relation_table : Any
+            The relation table for production countries.
+
+        Returns:
+        --------
+        Dict[str, Any]
+            The IDs that were ``inserted`` and the per-item ``errors`` with the item's index, ID and reason.
         """
-        db_actor_relation = actor_model(**actor_relation.model_dump())
-        db_actor_relation.id = self.get_max_id(session, actor_model) + 1
-        session.add(db_actor_relation)
-        session.commit()
+        errors: List[Dict[str, Any]] = []
+        accepted: List[Any] = []
+        accepted_indices: List[int] = []
+        existing_ids = set(session.scalars(select(item_model.id).where(item_model.id.in_([item.id for item in items]))))
+        seen_ids = set()
+        for index, item in enumerate(items):
+            if item.id in seen_ids:
+                errors.append({'index': index, 'id': item.id, 'error': 'Duplicate id in request'})
+            elif item.id in existing_ids:
+                errors.append({'index': index, 'id': item.id, 'error': 'Item already exists'})
+            else:
+                accepted.append(item)
+                accepted_indices.append(index)
+            seen_ids.add(item.id)
+        if not accepted:
+            return {'inserted': [], 'errors': errors}
 
-    def add_genre_relation(self, session: Session, genres_list: List[Any], item_id: int, genre_model: Type[Any], genre_relation_table: Any) -> None:
+        relations = (item_model, actor_model, genre_model, genre_relation_table, production_country_model, production_country_relation_table)
+        try:
+            self._write_in_savepoint(session, accepted, *relations)
+            inserted = list(zip(accepted_indices, accepted))
+        except SQLAlchemyError:
+            inserted = []
+            for index, item in zip(accepted_indices, accepted):
+                try:
+                    self._write_in_savepoint(session, [item], *relations)
+                    inserted.append((index, item))
+                except SQLAlchemyError as e:
+                    errors.append({'index': index, 'id': item.id, 'error': str(getattr(e, 'orig', None) or e)})
+        try:
+            self.commit_session(session)
+        except SQLAlchemyError as e:
+            self.rollback_session(session)
+            reason = f'Batch rolled back: {getattr(e, "orig", None) or e}'
+            errors.extend({'index': index, 'id': item.id, 'error': reason} for index, item in inserted)
+            inserted = []
+        errors.sort(key=lambda error: error['index'])
+        return {'inserted': [item.id for _, item in inserted], 'errors': errors}
+
+    def _write_in_savepoint(self, session: Session, items: List[Any], *relations: Any) -> None:
         """
-        Adds new genre relations to the database for a given item.
+        Writes items inside a savepoint, so a database error only discards these items.
+
+        The dimension IDs resolved inside a rolled back savepoint are discarded as well,
+        as the rows they refer to no longer exist.
 
         Parameters:
         -----------
         session : Session
             The database session.
-        genres_list : List[Any]
-            The list of genres.
-        item_id : int
-            The ID of the item.
-        genre_model : Type[Any]
-            The model class for genres.
-        genre_relation_table : Any
-            The relation table for genres.
+        items : List[Any]
+            The items to write.
+        relations : Any
+            The item model, relation models and relation tables passed on to ``_write_items``.
         """
-        for genre_name in genres_list:
-            genre = session.query(genre_model).filter(genre_model.genre == genre_name.genre).first()
-            
-            if not genre:
-                genre = genre_model()
-                genre.genre = genre_name.genre
-                genre.id = self.get_max_id(session, genre_model) + 1
-                session.add(genre)
-                session.commit()
-            self.execution_statment_genre(genre_model, session, genre_relation_table, item_id, genre)
-            session.commit()
+        resolved = {table_name: dict(ids) for table_name, ids in session.info.get('resolved_dimension_ids', {}).items()}
+        try:
+            with session.begin_nested():
+                self._write_items(session, items, *relations)
+        except SQLAlchemyError:
+            session.info['resolved_dimension_ids'] = resolved
+            raise
 
-    def add_production_country_relation(self, session: Session, production_countries_list: List[Any], item_id: int, production_country_model: Type[Any], production_country_relation_table: Any) -> None:
+    def _write_items(self, session: Session, items: List[Any], item_model: Type[Any], actor_model: Type[Any], genre_model: Type[Any], genre_relation_table: Any, production_country_model: Type[Any], production_country_relation_table: Any) -> None:
         """
-        Adds new production country relations to the database for a given item.
+        Writes items and their relation rows without committing.
+
+        Actors, roles, genres and production countries are resolved for all items at once, and every
+        table is written with a single multi-row insert. Repeated genres and production countries
+        of an item are written once, as the link tables are unique per pair.
 
         Parameters:
         -----------
         session : Session
             The database session.
-        production_countries_list : List[Any]
-            The list of production countries.
-        item_id : int
-            The ID of the item.
+        items : List[Any]
+            The items to insert.
+        item_model : Type[Any]
+            The model class for the items.
+        actor_model : Type[Any]
+            The model class relating actors to the items.
+        genre_model : Type[Any]
+            The model class for genres.
+        genre_relation_table : Any
+            The relation table for genres.
         production_country_model : Type[Any]
             The model class for production countries.
         production_country_relation_table : Any
             The relation table for production countries.
         """
-        for production_country in production_countries_list:
-            pc = session.query(production_country_model).filter(production_country_model.production_country == production_country.production_country).first()
-            
-            if not pc:
-                pc = production_country_model()
-                pc.production_country = production_country.production_country
-                pc.id = self.get_max_id(session, production_country_model) + 1
-                session.add(pc)
-                session.commit()
-            self.execution_statment_pc(production_country_model, session, production_country_relation_table, item_id, pc)
-            session.commit()
+        item_key = f'{item_model.__tablename__}_id'
+        actor_ids = self.resolve_names(session, Actor, Actor.name, {actor.name for item in items for actor in item.actors or []})
+        role_ids = self.resolve_names(session, Role, Role.role, {actor.role or DEFAULT_ACTOR_ROLE for item in items for actor in item.actors or []})
+        genre_ids = self.resolve_names(session, genre_model, genre_model.genre, {genre.genre for item in items for genre in item.genres or []})
+        production_country_ids = self.resolve_names(session, production_country_model, production_country_model.production_country,
+                                                    {pc.production_country for item in items for pc in item.production_countries or []})
 
-    def execution_statment_genre(self, item_type: Type[Any], session: Session, genre_relation_table: Any, item_id: int, genre: Any) -> None:
+        session.execute(insert(item_model), [self.item_to_row(item_model, item) for item in items])
+        actor_rows = [{item_key: item.id, 'name': actor_ids[actor.name], 'role': role_ids[actor.role or DEFAULT_ACTOR_ROLE]} for item in items for actor in item.actors or []]
+        if actor_rows:
+            session.execute(insert(actor_model), actor_rows)
+        genre_pairs = dict.fromkeys((item.id, genre_ids[genre.genre]) for item in items for genre in item.genres or [])
+        genre_rows = [{item_key: item_id, 'genre_id': genre_id} for item_id, genre_id in genre_pairs]
+        if genre_rows:
+            session.execute(genre_relation_table.insert(), genre_rows)
+        production_country_pairs = dict.fromkeys((item.id, production_country_ids[pc.production_country])
+                                                 for item in items for pc in item.production_countries or [])
+        production_country_rows = [{item_key: item_id, 'production_country_id': production_country_id}
+                                   for item_id, production_country_id in production_country_pairs]
+        if production_country_rows:
+            session.execute(production_country_relation_table.insert(), production_country_rows)
+
+    def resolve_names(self, session: Session, model: Type[Any], column: Any, names: Set[str]) -> Dict[str, int]:
         """
-        Executes the statement to add a genre relation to the database.
+        Maps names in a dimension table to their IDs, inserting the names that are missing.
+
+        Names are answered from the dimension cache first. The rest are looked up in one query
+        and the ones still missing are upserted with ``INSERT ... ON CONFLICT DO NOTHING RETURNING``
+        on the table's unique name constraint, so concurrent writers never create duplicates.
+        IDs resolved from the database reach the cache once the session commits.
 
         Parameters:
         -----------
-        item_type : Type[Any]
-            The type of the item (MovieGenres or ShowGenres).
         session : Session
             The database session.
-        genre_relation_table : Any
-            The relation table for genres.
-        item_id : int
-            The ID of the item.
-        genre : Any
-            The genre to relate.
+        model : Type[Any]
+            The model class of the dimension table.
+        column : Any
+            The name column of the dimension table.
+        names : Set[str]
+            The names to resolve.
+
+        Returns:
+        --------
+        Dict[str, int]
+            The ID of every requested name.
         """
-        if item_type == MovieGenres:
-            session.execute(genre_relation_table.insert().values(movie_id=item_id, genre_id=genre.id))
+        if not names:
+            return {}
+        if self.dimension_cache is not None:
+            ids, missing = self.dimension_cache.lookup(model.__tablename__, names)
         else:
-            session.execute(genre_relation_table.insert().values(show_id=item_id, genre_id=genre.id))
+            ids, missing = {}, list(names)
+        if not missing:
+            return ids
 
-    def execution_statment_pc(self, item_type: Type[Any], session: Session, production_country_relation_table: Any, item_id: int, pc: Any) -> None:
+        resolved = dict(session.execute(select(column, model.id).where(column.in_(missing))).all())
+        to_insert = sorted(name for name in missing if name not in resolved)
+        if to_insert:
+            dialect_insert = UPSERT_INSERTS.get(session.get_bind().dialect.name)
+            if dialect_insert is not None:
+                statement = dialect_insert(model).on_conflict_do_nothing(index_elements=[column.key]).returning(column, model.id)
+            else:
+                statement = insert(model).returning(column, model.id)
+            resolved.update(dict(session.execute(statement, [{column.key: name} for name in to_insert]).all()))
+            conflicted = [name for name in to_insert if name not in resolved]
+            if conflicted:
+                resolved.update(dict(session.execute(select(column, model.id).where(column.in_(conflicted))).all()))
+        session.info.setdefault('resolved_dimension_ids', {}).setdefault(model.__tablename__, {}).update(resolved)
+        ids.update(resolved)
+        return ids
+
+    def commit_session(self, session: Session) -> None:
         """
-        Executes the statement to add a production country relation to the database.
+        Commits a session and publishes the dimension IDs it resolved to the dimension cache.
 
         Parameters:
         -----------
-        item_type : Type[Any]
-            The type of the item (MovieProductionCountry or ShowProductionCountry).
         session : Session
             The database session.
-        production_country_relation_table : Any
-            The relation table for production countries.
-        item_id : int
-            The ID of the item.
-        pc : Any
-            The production country to relate.
         """
-        if item_type == MovieProductionCountry:
-            session.execute(production_country_relation_table.insert().values(movie_id=item_id, production_country_id=pc.id))
-        else:
-            session.execute(production_country_relation_table.insert().values(show_id=item_id, production_country_id=pc.id))
+        session.commit()
+        resolved = session.info.pop('resolved_dimension_ids', {})
+        if self.dimension_cache is not None:
+            for table_name, ids in resolved.items():
+                self.dimension_cache.update(table_name, ids)
 
-    def get_max_id(self, session: Session, model: Type[Any]) -> int:
+    def rollback_session(self, session: Session) -> None:
         """
-        Retrieves the maximum ID value for a given model from the database.
+        Rolls a session back and discards the dimension IDs it resolved.
 
         Parameters:
         -----------
         session : Session
             The database session.
-        model : Type[Any]
-            The model class to query.
+        """
+        session.rollback()
+        session.info.pop('resolved_dimension_ids', None)
+
+    def item_to_row(self, item_model: Type[Any], item: Any) -> Dict[str, Any]:
+        """
+        Converts an input model to a dictionary of the columns stored for it.
+
+        Parameters:
+        -----------
+        item_model : Type[Any]
+            The model class for the item.
+        item : Any
+            The Pydantic model of the item.
 
         Returns:
         --------
-        int
-            The maximum ID value.
+        Dict[str, Any]
+            A dictionary with one entry per column of the item's table.
         """
-        max_id = session.query(func.max(model.id)).scalar()
-        return max_id
+        return {column.name: getattr(item, column.name) for column in item_model.__table__.columns}
 
     def to_dict(self, obj: Any) -> Dict[str, Any]:
         """
@@ -0,0 +1,29 @@
+from typing import List
+
+MAX_BATCH_SIZE: int = 100
+
+def parse_id_list(ids: str) -> List[str]:
+    """
+    Parses a comma separated list of IDs, dropping blanks and duplicates while keeping order.
+
+    Parameters:
+    -----------
+    ids : str
+        The comma separated IDs, e.g. ``tm1,tm2,ts3``.
+
+    Returns:
+    --------
+    List[str]
+        The distinct IDs in the order they were given.
+
+    Raises:
+    -------
+    ValueError
+        If no IDs are given or more than ``MAX_BATCH_SIZE`` are requested.
+    """
+    parsed = list(dict.fromkeys(id.strip() for id in ids.split(',') if id.strip()))
+    if not parsed:
+        raise ValueError("At least one id is required")
+    if len(parsed) > MAX_BATCH_SIZE:
+        raise ValueError(f"At most {MAX_BATCH_SIZE} ids can be requested at once")
+    return parsed
@@ -0,0 +1,121 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+class TTLCache:
+    """
+    A bounded in-memory cache with least-recently-used eviction and a time-to-live per entry.
+
+    Attributes:
+    -----------
+    max_size : int
+        The maximum number of entries kept before the least recently used one is evicted.
+    ttl : float
+        The number of seconds an entry stays valid after it is stored.
+    hits : int
+        The number of lookups answered from the cache.
+    misses : int
+        The number of lookups that found no valid entry.
+    evictions : int
+        The number of entries dropped because the cache was full or the entry expired.
+    """
+
+    def __init__(self, max_size: int = 10000, ttl: float = 300.0) -> None:
+        """
+        Initializes the TTLCache with its size and time-to-live limits.
+
+        Parameters:
+        -----------
+        max_size : int, optional
+            The maximum number of entries (default is 10000).
+        ttl : float, optional
+            The number of seconds an entry stays valid (default is 300).
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Returns the cached value for a key, or None if it is missing or expired.
+
+        Parameters:
+        -----------
+        key : Hashable
+            The cache key.
+
+        Returns:
+        --------
+        Optional[Any]
+            The cached value, or None.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                self.evictions += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Stores a value, evicting the least recently used entries if the cache is full.
+
+        Parameters:
+        -----------
+        key : Hashable
+            The cache key.
+        value : Any
+            The value to store.
+        """
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, key: Hashable) -> None:
+        """
+        Removes a key from the cache if it is present.
+
+        Parameters:
+        -----------
+        key : Hashable
+            The cache key.
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """
+        Removes every entry from the cache.
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Returns the cache counters.
+
+        Returns:
+        --------
+        Dict[str, int]
+            The current size, hits, misses and evictions.
+        """
+        with self._lock:
+            return {'size': len(self._entries), 'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions}
@@ -1,21 +1,47 @@
+import os
 from src.database.PostgresConnection import PostgresConnection
+from app.common.cache import TTLCache
+from app.common.dimension import DimensionCache
+from app.common.search_index import TrigramSearchIndex
 from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
 from sqlalchemy import Engine
-from typing import Generator
+from typing import Generator, AsyncGenerator
 
 # Create a PostgresConnection instance
 pc: PostgresConnection = PostgresConnection()
 
-# Get the SQLAlchemy engine from the PostgresConnection instance
+# Get the shared, pooled SQLAlchemy engine used by every router
 engine: Engine = pc.get_engine()
 
+# Get the shared asyncio engine used by the async route handlers
+async_engine: AsyncEngine = pc.get_async_engine()
+
 # Configure the sessionmaker with the engine
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Configure the async sessionmaker with the async engine
+AsyncSessionLocal = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+
+# Shared cache for movie and show details, sized through DETAIL_CACHE_SIZE and DETAIL_CACHE_TTL
+detail_cache: TTLCache = TTLCache(max_size=int(os.getenv('DETAIL_CACHE_SIZE', '10000')), ttl=float(os.getenv('DETAIL_CACHE_TTL', '300')))
+
+# Shared name to ID cache for actors, genres and production countries, warmed at startup
+dimension_cache: DimensionCache = DimensionCache()
+
+# In-process title and actor name index for /search on databases without pg_trgm, rebuilt after SEARCH_INDEX_TTL seconds
+search_index: TrigramSearchIndex = TrigramSearchIndex(ttl=float(os.getenv('SEARCH_INDEX_TTL', '300')))
+
+# Serve the catalog from pre-encoded JSON snapshots when CATALOG_SNAPSHOT is enabled
+catalog_snapshot_enabled: bool = os.getenv('CATALOG_SNAPSHOT', 'false').lower() in ('1', 'true', 'yes')
+
+# The number of seconds a catalog snapshot is served before it is reloaded from the database
+catalog_snapshot_ttl: float = float(os.getenv('CATALOG_SNAPSHOT_TTL', '300'))
+
 def get_db() -> Generator[Session, None, None]:
     """
     Provides a database session for use in a context where it will be automatically closed after use.
-    
+
     Yields:
     -------
     Generator[Session, None, None]
@@ -26,3 +52,15 @@ def get_db() -> Generator[Session, None, None]:
         yield db
     finally:
         db.close()
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Provides an async database session for use in a context where it will be automatically closed after use.
+
+    Yields:
+    -------
+    AsyncGenerator[AsyncSession, None]
+        A SQLAlchemy AsyncSession object.
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
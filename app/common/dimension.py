@@ -0,0 +1,89 @@
+import threading
+from typing import Any, Dict, Iterable, List, Tuple
+from sqlalchemy import select
+from sqlalchemy.engine import Engine
+from src.database.Models import Actor, Role, MovieGenres, ShowGenres, MovieProductionCountry, ShowProductionCountry
+
+# The name column of every dimension table resolved on write
+DIMENSION_COLUMNS: List[Any] = [
+    Actor.name,
+    Role.role,
+    MovieGenres.genre,
+    ShowGenres.genre,
+    MovieProductionCountry.production_country,
+    ShowProductionCountry.production_country,
+]
+
+class DimensionCache:
+    """
+    An in-process name to ID dictionary for the actor, role, genre and production country tables.
+
+    Entries are only added for rows that are known to be committed, so a rolled back
+    insert never leaves an ID in the cache that does not exist in the database.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes an empty DimensionCache.
+        """
+        self._ids: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+
+    def warm(self, engine: Engine, columns: Iterable[Any] = DIMENSION_COLUMNS) -> None:
+        """
+        Loads every name and ID of the given dimension columns.
+
+        Parameters:
+        -----------
+        engine : Engine
+            The database engine.
+        columns : Iterable[Any], optional
+            The name columns of the dimension tables (default is ``DIMENSION_COLUMNS``).
+        """
+        with engine.connect() as connection:
+            for column in columns:
+                model = column.class_
+                rows = connection.execute(select(column, model.id).where(column.is_not(None))).all()
+                self.update(model.__tablename__, dict(rows))
+
+    def lookup(self, table_name: str, names: Iterable[str]) -> Tuple[Dict[str, int], List[str]]:
+        """
+        Splits names into the ones with a cached ID and the ones that must be resolved.
+
+        Parameters:
+        -----------
+        table_name : str
+            The name of the dimension table.
+        names : Iterable[str]
+            The names to look up.
+
+        Returns:
+        --------
+        Tuple[Dict[str, int], List[str]]
+            The cached IDs by name, and the names that were not cached.
+        """
+        with self._lock:
+            table_ids = self._ids.get(table_name, {})
+            found = {name: table_ids[name] for name in names if name in table_ids}
+        return found, [name for name in names if name not in found]
+
+    def update(self, table_name: str, ids: Dict[str, int]) -> None:
+        """
+        Adds committed names and IDs of a dimension table to the cache.
+
+        Parameters:
+        -----------
+        table_name : str
+            The name of the dimension table.
+        ids : Dict[str, int]
+            The IDs by name.
+        """
+        with self._lock:
+            self._ids.setdefault(table_name, {}).update(ids)
+
+    def clear(self) -> None:
+        """
+        Removes every entry from the cache.
+        """
+        with self._lock:
+            self._ids.clear()
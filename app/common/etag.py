@@ -0,0 +1,91 @@
+import hashlib
+from typing import Any, Optional
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+from app.common.snapshot import dumps
+
+def compute_etag(payload: Any) -> str:
+    """
+    Computes a strong ETag from an encoded response body or from a version key.
+
+    Bytes are hashed as they are; anything else, such as the version key returned by
+    ``CrudOperations.get_items_version``, is hashed through its JSON encoding.
+
+    Parameters:
+    -----------
+    payload : Any
+        The encoded body, or a JSON-encodable value that changes whenever the body does.
+
+    Returns:
+    --------
+    str
+        The quoted ETag value.
+    """
+    data = payload if isinstance(payload, bytes) else dumps(payload)
+    digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+    return f'"{digest}"'
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Checks whether an ``If-None-Match`` header matches an ETag, using weak comparison.
+
+    Parameters:
+    -----------
+    if_none_match : Optional[str]
+        The value of the request's ``If-None-Match`` header.
+    etag : str
+        The current ETag of the resource.
+
+    Returns:
+    --------
+    bool
+        True if the client already holds the current representation.
+    """
+    if not if_none_match:
+        return False
+    candidates = [candidate.strip() for candidate in if_none_match.split(',')]
+    return '*' in candidates or etag in (candidate[2:] if candidate.startswith('W/') else candidate for candidate in candidates)
+
+def not_modified(request: Request, etag: str) -> Optional[Response]:
+    """
+    Returns an empty 304 if the client's copy matches the ETag, before the response body is loaded.
+
+    Parameters:
+    -----------
+    request : Request
+        The incoming request.
+    etag : str
+        The current ETag of the resource.
+
+    Returns:
+    --------
+    Optional[Response]
+        A 304 response without a body, or None if the body must be sent.
+    """
+    if etag_matches(request.headers.get('if-none-match'), etag):
+        return Response(status_code=304, headers={'ETag': etag})
+    return None
+
+def conditional_response(request: Request, payload: Any, etag: Optional[str] = None) -> Response:
+    """
+    Builds a JSON response carrying an ETag, or an empty 304 if the client's copy is current.
+
+    The payload is encoded once, and the ETag is computed from the encoded body unless given.
+
+    Parameters:
+    -----------
+    request : Request
+        The incoming request.
+    payload : Any
+        The data to return, or an already encoded JSON body.
+    etag : Optional[str], optional
+        A precomputed ETag for the payload (default is computed from the encoded body).
+
+    Returns:
+    --------
+    Response
+        A 304 response without a body, or a JSON response with the ETag header set.
+    """
+    body = payload if isinstance(payload, bytes) else dumps(jsonable_encoder(payload))
+    etag = etag or compute_etag(body)
+    return not_modified(request, etag) or Response(content=body, media_type='application/json', headers={'ETag': etag})
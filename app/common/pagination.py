@@ -0,0 +1,53 @@
+import base64
+import json
+from typing import Any
+
+DEFAULT_PAGE_SIZE: int = 100
+MAX_PAGE_SIZE: int = 1000
+
+def encode_cursor(last_id: Any) -> str:
+    """
+    Encodes the last seen primary key of a page into an opaque cursor.
+
+    Parameters:
+    -----------
+    last_id : Any
+        The primary key of the last item on the page.
+
+    Returns:
+    --------
+    str
+        A URL-safe cursor string.
+    """
+    payload = json.dumps({'id': last_id}, separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(payload).decode('ascii').rstrip('=')
+
+def decode_cursor(cursor: str, expected_type: type = str) -> Any:
+    """
+    Decodes an opaque cursor back into the primary key it was built from.
+
+    Parameters:
+    -----------
+    cursor : str
+        The cursor returned as ``next_cursor`` by a previous page.
+    expected_type : type, optional
+        The type the decoded key must have (default is str, the type of title IDs).
+
+    Returns:
+    --------
+    Any
+        The primary key to continue after.
+
+    Raises:
+    -------
+    ValueError
+        If the cursor is malformed or its key is not of the expected type.
+    """
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        last_id = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))['id']
+    except (ValueError, KeyError, TypeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+    if not isinstance(last_id, expected_type):
+        raise ValueError(f"Invalid cursor: {cursor}")
+    return last_id
@@ -0,0 +1,42 @@
+from typing import Dict, Tuple
+
+# The column and comparison of every search filter, by query parameter
+SEARCH_FILTERS: Dict[str, Tuple[str, str]] = {
+    'main_genre'        : ('main_genre', 'eq'),
+    'main_production'   : ('main_production', 'eq'),
+    'age_certification' : ('age_certification', 'eq'),
+    'min_year'          : ('release_year', 'ge'),
+    'max_year'          : ('release_year', 'le'),
+    'min_score'         : ('imdb_score', 'ge'),
+    'max_score'         : ('imdb_score', 'le'),
+    'min_runtime'       : ('runtime', 'ge'),
+    'max_runtime'       : ('runtime', 'le'),
+}
+
+# The columns a search can be sorted by; a leading '-' sorts descending
+SORT_PATTERN: str = '^-?(imdb_score|release_year|runtime|title|id)$'
+DEFAULT_SORT: str = '-imdb_score'
+
+def parse_sort(sort: str) -> Tuple[str, bool]:
+    """
+    Parses a sort parameter such as ``-imdb_score`` into a column name and direction.
+
+    Parameters:
+    -----------
+    sort : str
+        The column name, prefixed with ``-`` for descending order.
+
+    Returns:
+    --------
+    Tuple[str, bool]
+        The column name and whether the order is descending.
+
+    Raises:
+    -------
+    ValueError
+        If the column cannot be sorted by.
+    """
+    column, descending = (sort[1:], True) if sort.startswith('-') else (sort, False)
+    if column not in ('imdb_score', 'release_year', 'runtime', 'title', 'id'):
+        raise ValueError(f"Cannot sort by {column}")
+    return column, descending
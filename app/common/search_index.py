@@ -0,0 +1,138 @@
+import bisect
+import re
+import threading
+import time
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Set, Tuple
+
+# The minimum trigram similarity of a match, the same default as pg_trgm
+SIMILARITY_THRESHOLD: float = 0.3
+
+# Added to the similarity of names starting with the query, so prefix matches rank first
+PREFIX_BOOST: float = 1.0
+
+def trigrams(text: str) -> Set[str]:
+    """
+    Splits a text into the trigrams pg_trgm would extract from it.
+
+    Every word is lowercased and padded with two spaces in front and one behind.
+
+    Parameters:
+    -----------
+    text : str
+        The text to split.
+
+    Returns:
+    --------
+    Set[str]
+        The distinct trigrams of the text.
+    """
+    result: Set[str] = set()
+    for word in re.findall(r'\w+', text.lower()):
+        padded = f'  {word} '
+        result.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return result
+
+class TrigramSearchIndex:
+    """
+    An in-process trigram and prefix index over names, ranking matches the way the PostgreSQL search does.
+
+    It serves searches on databases without pg_trgm. The index is rebuilt from the database once it
+    is older than its time-to-live.
+
+    Attributes:
+    -----------
+    ttl : float
+        The number of seconds a built index is used before it is rebuilt.
+    built_at : Optional[float]
+        The monotonic time the index was last built, or None if it was never built.
+    """
+
+    def __init__(self, ttl: float = 300.0) -> None:
+        """
+        Initializes an empty TrigramSearchIndex.
+
+        Parameters:
+        -----------
+        ttl : float, optional
+            The number of seconds a built index is used (default is 300).
+        """
+        self.ttl = ttl
+        self.built_at = None
+        self._entries: List[Tuple[str, Any, str]] = []
+        self._trigram_counts: List[int] = []
+        self._postings: Dict[str, List[int]] = {}
+        self._prefixes: List[Tuple[str, int]] = []
+        self._lock = threading.Lock()
+
+    def is_stale(self) -> bool:
+        """
+        Tells whether the index must be (re)built before it is searched.
+
+        Returns:
+        --------
+        bool
+            True if the index was never built or is older than its time-to-live.
+        """
+        return self.built_at is None or time.monotonic() - self.built_at > self.ttl
+
+    def build(self, entries: Iterable[Tuple[str, Any, str]]) -> None:
+        """
+        Replaces the indexed names.
+
+        Parameters:
+        -----------
+        entries : Iterable[Tuple[str, Any, str]]
+            The type, ID and name of every searchable row.
+        """
+        indexed = [(kind, id, name) for kind, id, name in entries if name]
+        trigram_counts: List[int] = []
+        postings: Dict[str, List[int]] = {}
+        for position, (_, _, name) in enumerate(indexed):
+            name_trigrams = trigrams(name)
+            trigram_counts.append(len(name_trigrams))
+            for trigram in name_trigrams:
+                postings.setdefault(trigram, []).append(position)
+        prefixes = sorted((name.lower(), position) for position, (_, _, name) in enumerate(indexed))
+        with self._lock:
+            self._entries, self._trigram_counts, self._postings, self._prefixes = indexed, trigram_counts, postings, prefixes
+            self.built_at = time.monotonic()
+
+    def search(self, query: str, limit: int) -> List[Dict[str, Any]]:
+        """
+        Returns the names most similar to the query.
+
+        Names sharing enough trigrams with the query are scored by trigram similarity, and names
+        starting with the query get ``PREFIX_BOOST`` on top.
+
+        Parameters:
+        -----------
+        query : str
+            The text to search for.
+        limit : int
+            The maximum number of matches returned.
+
+        Returns:
+        --------
+        List[Dict[str, Any]]
+            The ``type``, ``id``, ``name`` and ``score`` of the best matches, best first.
+        """
+        with self._lock:
+            entries, trigram_counts, postings, prefixes = self._entries, self._trigram_counts, self._postings, self._prefixes
+        query_trigrams = trigrams(query)
+        shared: Counter = Counter()
+        for trigram in query_trigrams:
+            shared.update(postings.get(trigram, ()))
+        scores: Dict[int, float] = {}
+        for position, count in shared.items():
+            similarity = count / (len(query_trigrams) + trigram_counts[position] - count)
+            if similarity >= SIMILARITY_THRESHOLD:
+                scores[position] = similarity
+        prefix = query.lower()
+        start = bisect.bisect_left(prefixes, (prefix, -1))
+        for name, position in prefixes[start:]:
+            if not name.startswith(prefix):
+                break
+            scores[position] = scores.get(position, 0.0) + PREFIX_BOOST
+        best = sorted(scores.items(), key=lambda item: (-item[1], entries[item[0]][2]))[:limit]
+        return [{'type': entries[position][0], 'id': entries[position][1], 'name': entries[position][2], 'score': score} for position, score in best]
@@ -0,0 +1,163 @@
+import json
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def dumps(obj: Any) -> bytes:
+    """
+    Encodes an object to JSON bytes, using orjson when it is installed.
+
+    Parameters:
+    -----------
+    obj : Any
+        The object to encode.
+
+    Returns:
+    --------
+    bytes
+        The UTF-8 encoded JSON document.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, default=str)
+    return json.dumps(obj, default=str, separators=(',', ':')).encode('utf-8')
+
+class CatalogSnapshot:
+    """
+    Keeps pre-encoded JSON bytes of every title in a catalog listing and of the titles' details.
+
+    The listing body is assembled from the per-title bytes and reused until a title changes,
+    so serving ``/all`` does not encode any rows. The listing is reloaded and the details are dropped
+    once they are older than the time-to-live, so data loaded by other means is eventually served.
+
+    Attributes:
+    -----------
+    ttl : float
+        The number of seconds the listing and details are used before they are reloaded.
+    loaded : bool
+        Whether the listing rows have been loaded.
+    loaded_at : Optional[float]
+        The monotonic time the listing was last loaded, or None if it was never loaded.
+    """
+
+    def __init__(self, ttl: float = 300.0) -> None:
+        """
+        Initializes an empty CatalogSnapshot.
+
+        Parameters:
+        -----------
+        ttl : float, optional
+            The number of seconds the listing and details are used (default is 300).
+        """
+        self.ttl = ttl
+        self.loaded = False
+        self.loaded_at = None
+        self._rows: Dict[Any, bytes] = {}
+        self._details: Dict[Any, bytes] = {}
+        self._details_since = time.monotonic()
+        self._listing: Optional[bytes] = None
+        self._lock = threading.Lock()
+
+    def is_stale(self) -> bool:
+        """
+        Tells whether the listing must be (re)loaded before it is served.
+
+        Returns:
+        --------
+        bool
+            True if the listing was never loaded or is older than the time-to-live.
+        """
+        return not self.loaded or time.monotonic() - self.loaded_at > self.ttl
+
+    def load(self, rows: List[Dict[str, Any]]) -> None:
+        """
+        Replaces the listing with the given rows.
+
+        Parameters:
+        -----------
+        rows : List[Dict[str, Any]]
+            Dictionaries representing every title in the listing.
+        """
+        encoded = {row['id']: dumps(row) for row in rows}
+        with self._lock:
+            self._rows = encoded
+            self._details.clear()
+            self._details_since = time.monotonic()
+            self._listing = None
+            self.loaded = True
+            self.loaded_at = self._details_since
+
+    def listing(self) -> bytes:
+        """
+        Returns the JSON array of every title ordered by ID, assembling it if a title changed since the last call.
+
+        Returns:
+        --------
+        bytes
+            The encoded listing.
+        """
+        with self._lock:
+            if self._listing is None:
+                self._listing = b'[' + b','.join(self._rows[id] for id in sorted(self._rows)) + b']'
+            return self._listing
+
+    def get_detail(self, id: Any) -> Optional[bytes]:
+        """
+        Returns the encoded detail of a title, or None if it has not been stored or has expired.
+
+        Parameters:
+        -----------
+        id : Any
+            The ID of the title.
+
+        Returns:
+        --------
+        Optional[bytes]
+            The encoded detail, or None.
+        """
+        with self._lock:
+            if time.monotonic() - self._details_since > self.ttl:
+                self._details.clear()
+                self._details_since = time.monotonic()
+            return self._details.get(id)
+
+    def set_detail(self, id: Any, detail: Dict[str, Any]) -> bytes:
+        """
+        Encodes and stores the detail of a title.
+
+        Parameters:
+        -----------
+        id : Any
+            The ID of the title.
+        detail : Dict[str, Any]
+            The dictionary representing the title with its related rows.
+
+        Returns:
+        --------
+        bytes
+            The encoded detail.
+        """
+        encoded = dumps(detail)
+        with self._lock:
+            self._details[id] = encoded
+        return encoded
+
+    def upsert(self, row: Dict[str, Any]) -> None:
+        """
+        Re-encodes a single written title and drops its stale detail.
+
+        Parameters:
+        -----------
+        row : Dict[str, Any]
+            The dictionary representing the title's stored columns.
+        """
+        encoded = dumps(row)
+        with self._lock:
+            self._details.pop(row['id'], None)
+            if self.loaded:
+                self._rows[row['id']] = encoded
+                self._listing = None
@@ -0,0 +1,21 @@
+import json
+from typing import Any, AsyncIterator, Dict
+
+NDJSON_MEDIA_TYPE: str = 'application/x-ndjson'
+
+async def to_ndjson(rows: AsyncIterator[Dict[str, Any]]) -> AsyncIterator[bytes]:
+    """
+    Serializes rows to newline-delimited JSON as they arrive.
+
+    Parameters:
+    -----------
+    rows : AsyncIterator[Dict[str, Any]]
+        The rows to serialize.
+
+    Yields:
+    -------
+    AsyncIterator[bytes]
+        One encoded JSON document per row, each terminated by a newline.
+    """
+    async for row in rows:
+        yield (json.dumps(row, default=str, separators=(',', ':')) + '\n').encode('utf-8')
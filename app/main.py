@@ -1,9 +1,21 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from starlette.middleware.cors import CORSMiddleware
+from src.database.PostgresConnection import PostgresConnection
+from .common.deps import engine, dimension_cache
 from .movie_endpoint.main import router as movie_router
 from .show_endpoint.main import router as show_router
+from .search_endpoint.main import router as search_router
+from .actor_endpoint.main import router as actor_router
 
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    dimension_cache.warm(engine)
+    yield
+    await PostgresConnection.dispose_async_engines()
+    PostgresConnection.dispose_engines()
+
+app = FastAPI(lifespan=lifespan)
 
 origins = [
     "http://localhost",
@@ -18,10 +30,13 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["GET", "POST"],
     allow_headers=["*"],
+    expose_headers=["ETag"],
 )
 
 app.include_router(movie_router)
 app.include_router(show_router)
+app.include_router(search_router)
+app.include_router(actor_router)
 
 @app.get("/")
 async def root():
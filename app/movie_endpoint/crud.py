@@ -1,8 +1,12 @@
-from src.database.Models import Movie, MovieActor, Actor, MovieProductionCountry, MovieGenres, movie_production_country, movie_genres
+from src.database.Models import Movie, MovieActor, MovieProductionCountry, MovieGenres, movie_production_country, movie_genres
 from sqlalchemy import Engine
-from typing import List, Dict, Any
-from .model import MovieModel, MovieActorModel
+from sqlalchemy.ext.asyncio import AsyncEngine
+from typing import List, Dict, Any, Optional, AsyncIterator
+from .model import MovieModel
 from app.common.CrudOperations import CrudOperations
+from app.common.cache import TTLCache
+from app.common.snapshot import CatalogSnapshot
+from app.common.dimension import DimensionCache
 
 class MovieCrud:
     """
@@ -12,21 +16,42 @@ class MovieCrud:
     -----------
     engine : Engine
         The database engine.
+    async_engine : Optional[AsyncEngine]
+        The asyncio database engine.
+    cache : Optional[TTLCache]
+        The cache for movie details.
+    snapshot : Optional[CatalogSnapshot]
+        The pre-encoded movie listing and details, if snapshot mode is enabled.
+    dimension_cache : Optional[DimensionCache]
+        The name to ID cache for actors, genres and production countries.
     cd : CrudOperations
         An instance of the CrudOperations class for generic CRUD operations.
     """
 
-    def __init__(self, engine: Engine):
+    def __init__(self, engine: Engine, async_engine: Optional[AsyncEngine] = None, cache: Optional[TTLCache] = None, snapshot: Optional[CatalogSnapshot] = None,
+                 dimension_cache: Optional[DimensionCache] = None):
         """
-        Initializes the MovieCrud with the given database engine.
+        Initializes the MovieCrud with the given database engines.
 
         Parameters:
         -----------
         engine : Engine
             The database engine.
+        async_engine : Optional[AsyncEngine], optional
+            The asyncio database engine (default is None).
+        cache : Optional[TTLCache], optional
+            The cache for movie details (default is None).
+        snapshot : Optional[CatalogSnapshot], optional
+            The pre-encoded movie listing and details (default is None).
+        dimension_cache : Optional[DimensionCache], optional
+            The name to ID cache for dimension tables (default is None).
         """
         self.engine = engine
-        self.cd = CrudOperations(self.engine)
+        self.async_engine = async_engine
+        self.cache = cache
+        self.snapshot = snapshot
+        self.dimension_cache = dimension_cache
+        self.cd = CrudOperations(self.engine, self.async_engine, self.cache, self.dimension_cache)
 
     def get_all_movies(self) -> List[Dict[str, Any]]:
         """
@@ -39,6 +64,44 @@ class MovieCrud:
         """
         return self.cd.get_all_items(Movie)
         
+    def get_movies_page(self, limit: int, after: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Retrieves one page of movies ordered by ID.
+
+        Parameters:
+        -----------
+        limit : int
+            The maximum number of movies on the page.
+        after : Optional[str], optional
+            The cursor returned by the previous page (default is None).
+
+        Returns:
+        --------
+        Dict[str, Any]
+            A dictionary with the page ``items`` and the ``next_cursor``.
+        """
+        return self.cd.get_items_page(Movie, limit, after)
+
+    def search_movies(self, filters: Dict[str, Any], sort: str, limit: int) -> List[Dict[str, Any]]:
+        """
+        Retrieves the movies matching the given filters.
+
+        Parameters:
+        -----------
+        filters : Dict[str, Any]
+            The filter values by query parameter name.
+        sort : str
+            The column to sort by, prefixed with ``-`` for descending order.
+        limit : int
+            The maximum number of movies returned.
+
+        Returns:
+        --------
+        List[Dict[str, Any]]
+            Dictionaries representing the matching movies.
+        """
+        return self.cd.search_items(Movie, filters, sort, limit)
+
     def get_movie_by_id(self, id: str) -> Dict[str, Any]:
         """
         Retrieves a movie by its ID from the database.
@@ -53,8 +116,24 @@ class MovieCrud:
         Dict[str, Any]
             A dictionary representing the movie, or None if not found.
         """
-        return self.cd.get_item_by_id(Movie, id, Actor, MovieActor, MovieProductionCountry, movie_production_country)
+        return self.cd.get_item_by_id(Movie, id, Movie.movie_actor, Movie.movie_genres, Movie.movie_production_countries)
         
+    def get_movies_by_ids(self, ids: List[str]) -> List[Dict[str, Any]]:
+        """
+        Retrieves several movies by their IDs from the database.
+
+        Parameters:
+        -----------
+        ids : List[str]
+            The IDs of the movies.
+
+        Returns:
+        --------
+        List[Dict[str, Any]]
+            Dictionaries representing the movies found, in the order of ``ids``.
+        """
+        return self.cd.get_items_by_ids(Movie, ids, Movie.movie_actor, Movie.movie_genres, Movie.movie_production_countries)
+
     def insert_movie_into_database(self, movie: MovieModel) -> None:
         """
         Inserts a new movie into the database.
@@ -64,4 +143,216 @@ class MovieCrud:
         movie : MovieModel
             The movie model to insert.
         """
-        self.cd.insert_item_into_database(movie, Movie, MovieActor, MovieActorModel, MovieGenres, movie_genres, MovieProductionCountry, movie_production_country)
+        self.cd.insert_item_into_database(movie, Movie, MovieActor, MovieGenres, movie_genres, MovieProductionCountry, movie_production_country)
+        if self.snapshot is not None:
+            self.snapshot.upsert(self.cd.item_to_row(Movie, movie))
+
+    def bulk_insert_movies_into_database(self, movies: List[MovieModel]) -> Dict[str, Any]:
+        """
+        Inserts many new movies into the database in one transaction.
+
+        Parameters:
+        -----------
+        movies : List[MovieModel]
+            The movie models to insert.
+
+        Returns:
+        --------
+        Dict[str, Any]
+            The IDs that were ``inserted`` and the per-movie ``errors``.
+        """
+        result = self.cd.bulk_insert_items(movies, Movie, MovieActor, MovieGenres, movie_genres, MovieProductionCountry, movie_production_country)
+        self.upsert_snapshot_rows(movies, result['inserted'])
+        return result
+
+    async def get_all_movies_async(self) -> List[Dict[str, Any]]:
+        """
+        Retrieves all movies from the database without blocking the event loop.
+
+        Returns:
+        --------
+        List[Dict[str, Any]]
+            A list of dictionaries representing all movies.
+        """
+        return await self.cd.get_all_items_async(Movie)
+
+    async def get_movies_version_async(self) -> List[Any]:
+        """
+        Reads a version key of the movie table that changes whenever its rows do, without loading them.
+
+        Returns:
+        --------
+        List[Any]
+            The version key of the movie table.
+        """
+        return await self.cd.get_items_version_async(Movie)
+
+    async def get_movies_page_async(self, limit: int, after: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Retrieves one page of movies ordered by ID without blocking the event loop.
+
+        Parameters:
+        -----------
+        limit : int
+            The maximum number of movies on the page.
+        after : Optional[str], optional
+            The cursor returned by the previous page (default is None).
+
+        Returns:
+        --------
+        Dict[str, Any]
+            A dictionary with the page ``items`` and the ``next_cursor``.
+        """
+        return await self.cd.get_items_page_async(Movie, limit, after)
+
+    def stream_all_movies_async(self, chunk_size: int = 1000) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Streams all movies from the database with a server-side cursor.
+
+        Parameters:
+        -----------
+        chunk_size : int, optional
+            The number of rows fetched per round trip (default is 1000).
+
+        Returns:
+        --------
+        AsyncIterator[Dict[str, Any]]
+            An async iterator of dictionaries representing the movies.
+        """
+        return self.cd.stream_all_items_async(Movie, chunk_size)
+
+    async def search_movies_async(self, filters: Dict[str, Any], sort: str, limit: int) -> List[Dict[str, Any]]:
+        """
+        Retrieves the movies matching the given filters without blocking the event loop.
+
+        Parameters:
+        -----------
+        filters : Dict[str, Any]
+            The filter values by query parameter name.
+        sort : str
+            The column to sort by, prefixed with ``-`` for descending order.
+        limit : int
+            The maximum number of movies returned.
+
+        Returns:
+        --------
+        List[Dict[str, Any]]
+            Dictionaries representing the matching movies.
+        """
+        return await self.cd.search_items_async(Movie, filters, sort, limit)
+
+    async def get_movie_by_id_async(self, id: str) -> Dict[str, Any]:
+        """
+        Retrieves a movie by its ID from the database without blocking the event loop.
+
+        Parameters:
+        -----------
+        id : str
+            The ID of the movie.
+
+        Returns:
+        --------
+        Dict[str, Any]
+            A dictionary representing the movie, or None if not found.
+        """
+        return await self.cd.get_item_by_id_async(Movie, id, Movie.movie_actor, Movie.movie_genres, Movie.movie_production_countries)
+
+    async def get_movies_by_ids_async(self, ids: List[str]) -> List[Dict[str, Any]]:
+        """
+        Retrieves several movies by their IDs from the database without blocking the event loop.
+
+        Parameters:
+        -----------
+        ids : List[str]
+            The IDs of the movies.
+
+        Returns:
+        --------
+        List[Dict[str, Any]]
+            Dictionaries representing the movies found, in the order of ``ids``.
+        """
+        return await self.cd.get_items_by_ids_async(Movie, ids, Movie.movie_actor, Movie.movie_genres, Movie.movie_production_countries)
+
+    async def insert_movie_into_database_async(self, movie: MovieModel) -> None:
+        """
+        Inserts a new movie into the database without blocking the event loop.
+
+        Parameters:
+        -----------
+        movie : MovieModel
+            The movie model to insert.
+        """
+        await self.cd.insert_item_into_database_async(movie, Movie, MovieActor, MovieGenres, movie_genres, MovieProductionCountry, movie_production_country)
+        if self.snapshot is not None:
+            self.snapshot.upsert(self.cd.item_to_row(Movie, movie))
+
+    async def bulk_insert_movies_into_database_async(self, movies: List[MovieModel]) -> Dict[str, Any]:
+        """
+        Inserts many new movies into the database in one transaction without blocking the event loop.
+
+        Parameters:
+        -----------
+        movies : List[MovieModel]
+            The movie models to insert.
+
+        Returns:
+        --------
+        Dict[str, Any]
+            The IDs that were ``inserted`` and the per-movie ``errors``.
+        """
+        result = await self.cd.bulk_insert_items_async(movies, Movie, MovieActor, MovieGenres, movie_genres, MovieProductionCountry, movie_production_country)
+        self.upsert_snapshot_rows(movies, result['inserted'])
+        return result
+
+    async def get_all_movies_json_async(self) -> bytes:
+        """
+        Returns the pre-encoded JSON listing of all movies, (re)loading the snapshot when it is stale.
+
+        Returns:
+        --------
+        bytes
+            The encoded JSON array of all movies.
+        """
+        if self.snapshot.is_stale():
+            self.snapshot.load(await self.get_all_movies_async())
+        return self.snapshot.listing()
+
+    async def get_movie_by_id_json_async(self, id: str) -> Optional[bytes]:
+        """
+        Returns the pre-encoded JSON detail of a movie, encoding it on first use.
+
+        Parameters:
+        -----------
+        id : str
+            The ID of the movie.
+
+        Returns:
+        --------
+        Optional[bytes]
+            The encoded movie detail, or None if not found.
+        """
+        encoded = self.snapshot.get_detail(id)
+        if encoded is None:
+            movie_dict = await self.get_movie_by_id_async(id)
+            if movie_dict is None:
+                return None
+            encoded = self.snapshot.set_detail(id, movie_dict)
+        return encoded
+
+    def upsert_snapshot_rows(self, movies: List[MovieModel], inserted_ids: List[str]) -> None:
+        """
+        Re-encodes the inserted movies in the snapshot, if snapshot mode is enabled.
+
+        Parameters:
+        -----------
+        movies : List[MovieModel]
+            The movie models that were submitted.
+        inserted_ids : List[str]
+            The IDs of the movies that were written.
+        """
+        if self.snapshot is None:
+            return
+        inserted = set(inserted_ids)
+        for movie in movies:
+            if movie.id in inserted:
+                self.snapshot.upsert(self.cd.item_to_row(Movie, movie))
@@ -1,26 +1,73 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
 from .crud import MovieCrud
-from src.database.PostgresConnection import PostgresConnection
-from sqlalchemy import Engine
-from .model import MovieModel,ActorModel
-from typing import Union
+from app.common.deps import engine, async_engine, detail_cache, dimension_cache, catalog_snapshot_enabled, catalog_snapshot_ttl
+from app.common.snapshot import CatalogSnapshot
+from app.common.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from app.common.streaming import NDJSON_MEDIA_TYPE, to_ndjson
+from app.common.batch import parse_id_list
+from app.common.search import DEFAULT_SORT, SORT_PATTERN
+from app.common.etag import compute_etag, conditional_response, not_modified
+from .model import MovieModel
+from typing import Optional, List
 
 router = APIRouter(
     prefix='/movie'
 )
 
-pc: PostgresConnection = PostgresConnection()
-engine: Engine = pc.get_engine()
-movie_crud: MovieCrud = MovieCrud(engine)
+movie_crud: MovieCrud = MovieCrud(engine, async_engine, detail_cache, CatalogSnapshot(catalog_snapshot_ttl) if catalog_snapshot_enabled else None, dimension_cache)
 
 @router.get('/all',tags=['movie'])
-async def get_all_movies():
-    return movie_crud.get_all_movies()
+async def get_all_movies(request: Request, limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE), after: Optional[str] = None,
+                         format: str = Query('json', pattern='^(json|ndjson)$')):
+    if format == 'ndjson':
+        return StreamingResponse(to_ndjson(movie_crud.stream_all_movies_async()), media_type=NDJSON_MEDIA_TYPE)
+    if limit is None and after is None:
+        if movie_crud.snapshot is not None:
+            return conditional_response(request, await movie_crud.get_all_movies_json_async())
+        etag = compute_etag(await movie_crud.get_movies_version_async())
+        return not_modified(request, etag) or conditional_response(request, await movie_crud.get_all_movies_async(), etag)
+    try:
+        page = await movie_crud.get_movies_page_async(limit or DEFAULT_PAGE_SIZE, after)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return conditional_response(request, page)
+
+@router.get('/batch',tags=['movie'])
+async def get_movies_by_ids(request: Request, ids: str):
+    try:
+        movie_ids = parse_id_list(ids)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return conditional_response(request, await movie_crud.get_movies_by_ids_async(movie_ids))
+
+@router.get('/search',tags=['movie'])
+async def search_movies(request: Request, main_genre: Optional[str] = None, main_production: Optional[str] = None,
+                        age_certification: Optional[str] = None, min_year: Optional[int] = None, max_year: Optional[int] = None,
+                        min_score: Optional[float] = Query(None, ge=0, le=10), max_score: Optional[float] = Query(None, ge=0, le=10),
+                        min_runtime: Optional[int] = Query(None, ge=0), max_runtime: Optional[int] = Query(None, ge=0),
+                        sort: str = Query(DEFAULT_SORT, pattern=SORT_PATTERN), limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE)):
+    filters = {
+        'main_genre': main_genre, 'main_production': main_production, 'age_certification': age_certification,
+        'min_year': min_year, 'max_year': max_year, 'min_score': min_score, 'max_score': max_score,
+        'min_runtime': min_runtime, 'max_runtime': max_runtime,
+    }
+    try:
+        movies = await movie_crud.search_movies_async(filters, sort, limit)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return conditional_response(request, movies)
 
 @router.get('/{movie_id}',tags=['movie'])
-async def get_movie_by_id(movie_id:str):
-    return movie_crud.get_movie_by_id(movie_id)
+async def get_movie_by_id(request: Request, movie_id:str):
+    if movie_crud.snapshot is not None:
+        return conditional_response(request, await movie_crud.get_movie_by_id_json_async(movie_id))
+    return conditional_response(request, await movie_crud.get_movie_by_id_async(movie_id))
 
 @router.post('/',tags = ['movie'])
 async def post_movie(movie: MovieModel):
-    return movie_crud.insert_movie_into_database(movie)
\ No newline at end of file
+    return await movie_crud.insert_movie_into_database_async(movie)
+
+@router.post('/bulk',tags=['movie'])
+async def post_movies_bulk(movies: List[MovieModel]):
+    return await movie_crud.bulk_insert_movies_into_database_async(movies)
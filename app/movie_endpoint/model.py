@@ -20,15 +20,15 @@ class MovieModel(BaseModel):
         The runtime of the movie in minutes.
     imdb_id : Optional[str]
         The IMDb ID of the movie.
-    imdb_score : Optional[str]
+    imdb_score : Optional[float]
         The IMDb score of the movie.
     imdb_votes : Optional[int]
         The number of IMDb votes for the movie.
-    release_year : Optional[str]
+    release_year : Optional[int]
         The release year of the movie.
     duration : Optional[int]
         The duration of the movie.
-    is_movie_best_in_release_year : str
+    is_movie_best_in_release_year : bool
         Indicates if the movie is the best in its release year.
     main_genre : Optional[str]
         The main genre of the movie.
@@ -47,11 +47,11 @@ class MovieModel(BaseModel):
     age_certification: Optional[str] = None
     runtime: int
     imdb_id: Optional[str]
-    imdb_score: Optional[str]
+    imdb_score: Optional[float]
     imdb_votes: Optional[int] = None
-    release_year: Optional[str] = None
+    release_year: Optional[int] = None
     duration: Optional[int] = None
-    is_movie_best_in_release_year: str
+    is_movie_best_in_release_year: bool
     main_genre: Optional[str] = None
     main_production: Optional[str] = None
     actors: Optional[List[ActorModel]] = None
@@ -70,8 +70,11 @@ class ActorModel(BaseModel):
     -----------
     name : str
         The name of the actor.
+    role : Optional[str]
+        The role of the actor, ``ACTOR`` when omitted.
     """
     name: str
+    role: Optional[str] = None
 
     class Config:
         arbitrary_types_allowed = True
@@ -0,0 +1,150 @@
+from src.database.Models import Movie, Show, Actor
+from sqlalchemy import Engine, String, case, cast, literal, or_, select, union_all, func
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import Session
+from typing import List, Dict, Any, Optional, Tuple
+from app.common.CrudOperations import CrudOperations
+from app.common.search_index import PREFIX_BOOST, TrigramSearchIndex
+
+# The type, ID column and name column of everything /search looks through
+SEARCH_FIELDS: List[Tuple[str, Any, Any]] = [
+    ('movie', Movie.id, Movie.title),
+    ('show', Show.id, Show.title),
+    ('actor', Actor.id, Actor.name),
+]
+
+class SearchCrud:
+    """
+    A class to search movie and show titles and actor names.
+
+    On PostgreSQL the search runs as one query served by the pg_trgm indexes; on other databases
+    it is answered from an in-process trigram index.
+
+    Attributes:
+    -----------
+    engine : Engine
+        The database engine.
+    async_engine : Optional[AsyncEngine]
+        The asyncio database engine.
+    index : TrigramSearchIndex
+        The in-process index used when the database is not PostgreSQL.
+    cd : CrudOperations
+        An instance of the CrudOperations class for session handling.
+    """
+
+    def __init__(self, engine: Engine, async_engine: Optional[AsyncEngine] = None, index: Optional[TrigramSearchIndex] = None):
+        """
+        Initializes the SearchCrud with the given database engines.
+
+        Parameters:
+        -----------
+        engine : Engine
+            The database engine.
+        async_engine : Optional[AsyncEngine], optional
+            The asyncio database engine (default is None).
+        index : Optional[TrigramSearchIndex], optional
+            The in-process fallback index (default is None, a new index).
+        """
+        self.engine = engine
+        self.async_engine = async_engine
+        self.index = index if index is not None else TrigramSearchIndex()
+        self.cd = CrudOperations(self.engine, self.async_engine)
+
+    def search(self, query: str, limit: int) -> List[Dict[str, Any]]:
+        """
+        Searches titles and actor names for fuzzy and prefix matches.
+
+        Parameters:
+        -----------
+        query : str
+            The text to search for.
+        limit : int
+            The maximum number of matches returned.
+
+        Returns:
+        --------
+        List[Dict[str, Any]]
+            The ``type``, ``id``, ``name`` and ``score`` of the best matches, best first.
+        """
+        with Session(bind=self.engine) as session:
+            return self._search(session, query, limit)
+
+    async def search_async(self, query: str, limit: int) -> List[Dict[str, Any]]:
+        """
+        Searches titles and actor names without blocking the event loop.
+
+        Parameters:
+        -----------
+        query : str
+            The text to search for.
+        limit : int
+            The maximum number of matches returned.
+
+        Returns:
+        --------
+        List[Dict[str, Any]]
+            The ``type``, ``id``, ``name`` and ``score`` of the best matches, best first.
+        """
+        async with self.cd.async_session() as session:
+            return await session.run_sync(self._search, query, limit)
+
+    def _search(self, session: Session, query: str, limit: int) -> List[Dict[str, Any]]:
+        """
+        Searches titles and actor names using an open session.
+
+        Parameters:
+        -----------
+        session : Session
+            The database session.
+        query : str
+            The text to search for.
+        limit : int
+            The maximum number of matches returned.
+
+        Returns:
+        --------
+        List[Dict[str, Any]]
+            The ``type``, ``id``, ``name`` and ``score`` of the best matches, best first.
+        """
+        if session.get_bind().dialect.name != 'postgresql':
+            if self.index.is_stale():
+                self.index.build(self.read_search_entries(session))
+            return self.index.search(query, limit)
+        prefix = query.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%'
+        branches = []
+        for kind, id_column, name_column in SEARCH_FIELDS:
+            is_prefix = name_column.ilike(prefix, escape='\\')
+            score = (func.similarity(name_column, query) + case((is_prefix, PREFIX_BOOST), else_=0.0)).label('score')
+            branch = (
+                select(literal(kind).label('type'), cast(id_column, String).label('id'), name_column.label('name'), score)
+                .where(or_(name_column.bool_op('%')(query), is_prefix))
+                .order_by(score.desc())
+                .limit(limit)
+                .subquery()
+            )
+            branches.append(select(branch))
+        matches = union_all(*branches).subquery()
+        statement = select(matches).order_by(matches.c.score.desc(), matches.c.name).limit(limit)
+        return [
+            {'type': row.type, 'id': int(row.id) if row.type == 'actor' else row.id, 'name': row.name, 'score': float(row.score)}
+            for row in session.execute(statement)
+        ]
+
+    def read_search_entries(self, session: Session) -> List[Tuple[str, Any, str]]:
+        """
+        Reads every searchable title and actor name for the in-process index.
+
+        Parameters:
+        -----------
+        session : Session
+            The database session.
+
+        Returns:
+        --------
+        List[Tuple[str, Any, str]]
+            The type, ID and name of every searchable row.
+        """
+        entries: List[Tuple[str, Any, str]] = []
+        for kind, id_column, name_column in SEARCH_FIELDS:
+            entries.extend((kind, id, name) for id, name in session.execute(select(id_column, name_column).where(name_column.is_not(None))))
+        return entries
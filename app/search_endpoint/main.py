@@ -0,0 +1,14 @@
+from fastapi import APIRouter, Query, Request
+from .crud import SearchCrud
+from app.common.deps import engine, async_engine, search_index
+from app.common.etag import conditional_response
+
+router = APIRouter(
+    prefix='/search'
+)
+
+search_crud: SearchCrud = SearchCrud(engine, async_engine, search_index)
+
+@router.get('',tags=['search'])
+async def search(request: Request, q: str = Query(..., min_length=1, max_length=200), limit: int = Query(20, ge=1, le=100)):
+    return conditional_response(request, await search_crud.search_async(q, limit))
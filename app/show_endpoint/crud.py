@@ -1,8 +1,12 @@
-from src.database.Models import Show, ShowActor, Actor, ShowProductionCountry, ShowGenres, show_production_country, show_genres
+from src.database.Models import Show, ShowActor, ShowProductionCountry, ShowGenres, show_production_country, show_genres
 from sqlalchemy import Engine
-from typing import List, Dict, Any
+from sqlalchemy.ext.asyncio import AsyncEngine
+from typing import List, Dict, Any, Optional, AsyncIterator
 from app.common.CrudOperations import CrudOperations
-from .model import ShowModel, ShowActorModel
+from app.common.cache import TTLCache
+from app.common.snapshot import CatalogSnapshot
+from app.common.dimension import DimensionCache
+from .model import ShowModel
 
 class ShowCrud:
     """
@@ -12,21 +16,42 @@ class ShowCrud:
     -----------
     engine : Engine
         The database engine.
+    async_engine : Optional[AsyncEngine]
+        The asyncio database engine.
+    cache : Optional[TTLCache]
+        The cache for show details.
+    snapshot : Optional[CatalogSnapshot]
+        The pre-encoded show listing and details, if snapshot mode is enabled.
+    dimension_cache : Optional[DimensionCache]
+        The name to ID cache for actors, genres and production countries.
     cd : CrudOperations
         An instance of the CrudOperations class for generic CRUD operations.
     """
 
-    def __init__(self, engine: Engine):
+    def __init__(self, engine: Engine, async_engine: Optional[AsyncEngine] = None, cache: Optional[TTLCache] = None, snapshot: Optional[CatalogSnapshot] = None,
+                 dimension_cache: Optional[DimensionCache] = None):
         """
-        Initializes the ShowCrud with the given database engine.
+        Initializes the ShowCrud with the given database engines.
 
         Parameters:
         -----------
         engine : Engine
             The database engine.
+        async_engine : Optional[AsyncEngine], optional
+            The asyncio database engine (default is None).
+        cache : Optional[TTLCache], optional
+            The cache for show details (default is None).
+        snapshot : Optional[CatalogSnapshot], optional
+            The pre-encoded show listing and details (default is None).
+        dimension_cache : Optional[DimensionCache], optional
+            The name to ID cache for dimension tables (default is None).
         """
         self.engine = engine
-        self.cd = CrudOperations(self.engine)
+        self.async_engine = async_engine
+        self.cache = cache
+        self.snapshot = snapshot
+        self.dimension_cache = dimension_cache
+        self.cd = CrudOperations(self.engine, self.async_engine, self.cache, self.dimension_cache)
 
     def get_all_shows(self) -> List[Dict[str, Any]]:
         """
@@ -39,6 +64,44 @@ class ShowCrud:
         """
         return self.cd.get_all_items(Show)
         
+    def get_shows_page(self, limit: int, after: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Retrieves one page of shows ordered by ID.
+
+        Parameters:
+        -----------
+        limit : int
+            The maximum number of shows on the page.
+        after : Optional[str], optional
+            The cursor returned by the previous page (default is None).
+
+        Returns:
+        --------
+        Dict[str, Any]
+            A dictionary with the page ``items`` and the ``next_cursor``.
+        """
+        return self.cd.get_items_page(Show, limit, after)
+
+    def search_shows(self, filters: Dict[str, Any], sort: str, limit: int) -> List[Dict[str, Any]]:
+        """
+        Retrieves the shows matching the given filters.
+
+        Parameters:
+        -----------
+        filters : Dict[str, Any]
+            The filter values by query parameter name.
+        sort : str
+            The column to sort by, prefixed with ``-`` for descending order.
+        limit : int
+            The maximum number of shows returned.
+
+        Returns:
+        --------
+        List[Dict[str, Any]]
+            Dictionaries representing the matching shows.
+        """
+        return self.cd.search_items(Show, filters, sort, limit)
+
     def get_show_by_id(self, id: str) -> Dict[str, Any]:
         """
         Retrieves a show by its ID from the database.
@@ -53,8 +116,24 @@ class ShowCrud:
         Dict[str, Any]]
             A dictionary representing the show, or None if not found.
         """
-        return self.cd.get_item_by_id(Show, id, Actor, ShowActor, ShowProductionCountry, show_production_country)
+        return self.cd.get_item_by_id(Show, id, Show.show_actor, Show.show_genres, Show.show_production_countries)
     
+    def get_shows_by_ids(self, ids: List[str]) -> List[Dict[str, Any]]:
+        """
+        Retrieves several shows by their IDs from the database.
+
+        Parameters:
+        -----------
+        ids : List[str]
+            The IDs of the shows.
+
+        Returns:
+        --------
+        List[Dict[str, Any]]
+            Dictionaries representing the shows found, in the order of ``ids``.
+        """
+        return self.cd.get_items_by_ids(Show, ids, Show.show_actor, Show.show_genres, Show.show_production_countries)
+
     def insert_show_into_database(self, show: ShowModel) -> None:
         """
         Inserts a new show into the database.
@@ -64,4 +143,216 @@ class ShowCrud:
         show : ShowModel
             The show model to insert.
         """
-        self.cd.insert_item_into_database(show, Show, ShowActor, ShowActorModel, ShowGenres, show_genres, ShowProductionCountry, show_production_country)
+        self.cd.insert_item_into_database(show, Show, ShowActor, ShowGenres, show_genres, ShowProductionCountry, show_production_country)
+        if self.snapshot is not None:
+            self.snapshot.upsert(self.cd.item_to_row(Show, show))
+
+    def bulk_insert_shows_into_database(self, shows: List[ShowModel]) -> Dict[str, Any]:
+        """
+        Inserts many new shows into the database in one transaction.
+
+        Parameters:
+        -----------
+        shows : List[ShowModel]
+            The show models to insert.
+
+        Returns:
+        --------
+        Dict[str, Any]
+            The IDs that were ``inserted`` and the per-show ``errors``.
+        """
+        result = self.cd.bulk_insert_items(shows, Show, ShowActor, ShowGenres, show_genres, ShowProductionCountry, show_production_country)
+        self.upsert_snapshot_rows(shows, result['inserted'])
+        return result
+
+    async def get_all_shows_async(self) -> List[Dict[str, Any]]:
+        """
+        Retrieves all shows from the database without blocking the event loop.
+
+        Returns:
+        --------
+        List[Dict[str, Any]]
+            A list of dictionaries representing all shows.
+        """
+        return await self.cd.get_all_items_async(Show)
+
+    async def get_shows_version_async(self) -> List[Any]:
+        """
+        Reads a version key of the show table that changes whenever its rows do, without loading them.
+
+        Returns:
+        --------
+        List[Any]
+            The version key of the show table.
+        """
+        return await self.cd.get_items_version_async(Show)
+
+    async def get_shows_page_async(self, limit: int, after: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Retrieves one page of shows ordered by ID without blocking the event loop.
+
+        Parameters:
+        -----------
+        limit : int
+            The maximum number of shows on the page.
+        after : Optional[str], optional
+            The cursor returned by the previous page (default is None).
+
+        Returns:
+        --------
+        Dict[str, Any]
+            A dictionary with the page ``items`` and the ``next_cursor``.
+        """
+        return await self.cd.get_items_page_async(Show, limit, after)
+
+    def stream_all_shows_async(self, chunk_size: int = 1000) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Streams all shows from the database with a server-side cursor.
+
+        Parameters:
+        -----------
+        chunk_size : int, optional
+            The number of rows fetched per round trip (default is 1000).
+
+        Returns:
+        --------
+        AsyncIterator[Dict[str, Any]]
+            An async iterator of dictionaries representing the shows.
+        """
+        return self.cd.stream_all_items_async(Show, chunk_size)
+
+    async def search_shows_async(self, filters: Dict[str, Any], sort: str, limit: int) -> List[Dict[str, Any]]:
+        """
+        Retrieves the shows matching the given filters without blocking the event loop.
+
+        Parameters:
+        -----------
+        filters : Dict[str, Any]
+            The filter values by query parameter name.
+        sort : str
+            The column to sort by, prefixed with ``-`` for descending order.
+        limit : int
+            The maximum number of shows returned.
+
+        Returns:
+        --------
+        List[Dict[str, Any]]
+            Dictionaries representing the matching shows.
+        """
+        return await self.cd.search_items_async(Show, filters, sort, limit)
+
+    async def get_show_by_id_async(self, id: str) -> Dict[str, Any]:
+        """
+        Retrieves a show by its ID from the database without blocking the event loop.
+
+        Parameters:
+        -----------
+        id : str
+            The ID of the show.
+
+        Returns:
+        --------
+        Dict[str, Any]
+            A dictionary representing the show, or None if not found.
+        """
+        return await self.cd.get_item_by_id_async(Show, id, Show.show_actor, Show.show_genres, Show.show_production_countries)
+
+    async def get_shows_by_ids_async(self, ids: List[str]) -> List[Dict[str, Any]]:
+        """
+        Retrieves several shows by their IDs from the database without blocking the event loop.
+
+        Parameters:
+        -----------
+        ids : List[str]
+            The IDs of the shows.
+
+        Returns:
+        --------
+        List[Dict[str, Any]]
+            Dictionaries representing the shows found, in the order of ``ids``.
+        """
+        return await self.cd.get_items_by_ids_async(Show, ids, Show.show_actor, Show.show_genres, Show.show_production_countries)
+
+    async def insert_show_into_database_async(self, show: ShowModel) -> None:
+        """
+        Inserts a new show into the database without blocking the event loop.
+
+        Parameters:
+        -----------
+        show : ShowModel
+            The show model to insert.
+        """
+        await self.cd.insert_item_into_database_async(show, Show, ShowActor, ShowGenres, show_genres, ShowProductionCountry, show_production_country)
+        if self.snapshot is not None:
+            self.snapshot.upsert(self.cd.item_to_row(Show, show))
+
+    async def bulk_insert_shows_into_database_async(self, shows: List[ShowModel]) -> Dict[str, Any]:
+        """
+        Inserts many new shows into the database in one transaction without blocking the event loop.
+
+        Parameters:
+        -----------
+        shows : List[ShowModel]
+            The show models to insert.
+
+        Returns:
+        --------
+        Dict[str, Any]
+            The IDs that were ``inserted`` and the per-show ``errors``.
+        """
+        result = await self.cd.bulk_insert_items_async(shows, Show, ShowActor, ShowGenres, show_genres, ShowProductionCountry, show_production_country)
+        self.upsert_snapshot_rows(shows, result['inserted'])
+        return result
+
+    async def get_all_shows_json_async(self) -> bytes:
+        """
+        Returns the pre-encoded JSON listing of all shows, (re)loading the snapshot when it is stale.
+
+        Returns:
+        --------
+        bytes
+            The encoded JSON array of all shows.
+        """
+        if self.snapshot.is_stale():
+            self.snapshot.load(await self.get_all_shows_async())
+        return self.snapshot.listing()
+
+    async def get_show_by_id_json_async(self, id: str) -> Optional[bytes]:
+        """
+        Returns the pre-encoded JSON detail of a show, encoding it on first use.
+
+        Parameters:
+        -----------
+        id : str
+            The ID of the show.
+
+        Returns:
+        --------
+        Optional[bytes]
+            The encoded show detail, or None if not found.
+        """
+        encoded = self.snapshot.get_detail(id)
+        if encoded is None:
+            show_dict = await self.get_show_by_id_async(id)
+            if show_dict is None:
+                return None
+            encoded = self.snapshot.set_detail(id, show_dict)
+        return encoded
+
+    def upsert_snapshot_rows(self, shows: List[ShowModel], inserted_ids: List[str]) -> None:
+        """
+        Re-encodes the inserted shows in the snapshot, if snapshot mode is enabled.
+
+        Parameters:
+        -----------
+        shows : List[ShowModel]
+            The show models that were submitted.
+        inserted_ids : List[str]
+            The IDs of the shows that were written.
+        """
+        if self.snapshot is None:
+            return
+        inserted = set(inserted_ids)
+        for show in shows:
+            if show.id in inserted:
+                self.snapshot.upsert(self.cd.item_to_row(Show, show))
@@ -1,25 +1,73 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
 from .crud import ShowCrud
-from src.database.PostgresConnection import PostgresConnection
-from sqlalchemy import Engine
+from app.common.deps import engine, async_engine, detail_cache, dimension_cache, catalog_snapshot_enabled, catalog_snapshot_ttl
+from app.common.snapshot import CatalogSnapshot
+from app.common.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from app.common.streaming import NDJSON_MEDIA_TYPE, to_ndjson
+from app.common.batch import parse_id_list
+from app.common.search import DEFAULT_SORT, SORT_PATTERN
+from app.common.etag import compute_etag, conditional_response, not_modified
+from typing import Optional, List
 from .model import ShowModel
 
 router = APIRouter(
     prefix='/show'
 )
 
-pc: PostgresConnection = PostgresConnection()
-engine: Engine = pc.get_engine()
-show_crud: ShowCrud = ShowCrud(engine)
+show_crud: ShowCrud = ShowCrud(engine, async_engine, detail_cache, CatalogSnapshot(catalog_snapshot_ttl) if catalog_snapshot_enabled else None, dimension_cache)
 
 @router.get('/all',tags=['shows'])
-async def get_all_movies():
-    return show_crud.get_all_shows()
+async def get_all_movies(request: Request, limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE), after: Optional[str] = None,
+                         format: str = Query('json', pattern='^(json|ndjson)$')):
+    if format == 'ndjson':
+        return StreamingResponse(to_ndjson(show_crud.stream_all_shows_async()), media_type=NDJSON_MEDIA_TYPE)
+    if limit is None and after is None:
+        if show_crud.snapshot is not None:
+            return conditional_response(request, await show_crud.get_all_shows_json_async())
+        etag = compute_etag(await show_crud.get_shows_version_async())
+        return not_modified(request, etag) or conditional_response(request, await show_crud.get_all_shows_async(), etag)
+    try:
+        page = await show_crud.get_shows_page_async(limit or DEFAULT_PAGE_SIZE, after)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return conditional_response(request, page)
+
+@router.get('/batch',tags=['shows'])
+async def get_shows_by_ids(request: Request, ids: str):
+    try:
+        show_ids = parse_id_list(ids)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return conditional_response(request, await show_crud.get_shows_by_ids_async(show_ids))
+
+@router.get('/search',tags=['shows'])
+async def search_shows(request: Request, main_genre: Optional[str] = None, main_production: Optional[str] = None,
+                        age_certification: Optional[str] = None, min_year: Optional[int] = None, max_year: Optional[int] = None,
+                        min_score: Optional[float] = Query(None, ge=0, le=10), max_score: Optional[float] = Query(None, ge=0, le=10),
+                        min_runtime: Optional[int] = Query(None, ge=0), max_runtime: Optional[int] = Query(None, ge=0),
+                        sort: str = Query(DEFAULT_SORT, pattern=SORT_PATTERN), limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE)):
+    filters = {
+        'main_genre': main_genre, 'main_production': main_production, 'age_certification': age_certification,
+        'min_year': min_year, 'max_year': max_year, 'min_score': min_score, 'max_score': max_score,
+        'min_runtime': min_runtime, 'max_runtime': max_runtime,
+    }
+    try:
+        shows = await show_crud.search_shows_async(filters, sort, limit)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return conditional_response(request, shows)
 
 @router.get('/{show_id}',tags=['shows'])
-async def get_show_by_id(show_id:str):
-    return show_crud.get_show_by_id(show_id)
+async def get_show_by_id(request: Request, show_id:str):
+    if show_crud.snapshot is not None:
+        return conditional_response(request, await show_crud.get_show_by_id_json_async(show_id))
+    return conditional_response(request, await show_crud.get_show_by_id_async(show_id))
 
 @router.post('/',tags=['shows'])
 async def post_show(show: ShowModel):
-    return show_crud.insert_show_into_database(show)
+    return await show_crud.insert_show_into_database_async(show)
+
+@router.post('/bulk',tags=['shows'])
+async def post_shows_bulk(shows: List[ShowModel]):
+    return await show_crud.bulk_insert_shows_into_database_async(shows)
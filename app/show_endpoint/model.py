@@ -21,19 +21,19 @@ class ShowModel(BaseModel):
         The runtime of the show in minutes.
     seasons : int
         The number of seasons of the show.
-    number_of_seasons : Optional[str]
+    number_of_seasons : Optional[int]
         The number of seasons (nullable).
     imdb_id : Optional[str]
         The IMDb ID of the show.
-    imdb_score : Optional[str]
+    imdb_score : Optional[float]
         The IMDb score of the show.
     imdb_votes : Optional[int]
         The number of IMDb votes for the show.
-    release_year : Optional[str]
+    release_year : Optional[int]
         The release year of the show.
     duration : Optional[int]
         The duration of the show.
-    is_movie_best_in_release_year : str
+    is_movie_best_in_release_year : bool
         Indicates if the show is the best in its release year.
     main_genre : Optional[str]
         The main genre of the show.
@@ -52,13 +52,13 @@ class ShowModel(BaseModel):
     age_certification: Optional[str] = None
     runtime: int
     seasons: int
-    number_of_seasons: Optional[str]
+    number_of_seasons: Optional[int]
     imdb_id: Optional[str]
-    imdb_score: Optional[str]
+    imdb_score: Optional[float]
     imdb_votes: Optional[int] = None
-    release_year: Optional[str] = None
+    release_year: Optional[int] = None
     duration: Optional[int] = None
-    is_movie_best_in_release_year: str
+    is_movie_best_in_release_year: bool
     main_genre: Optional[str] = None
     main_production: Optional[str] = None
     actors: Optional[List[ActorModel]] = None
@@ -1,10 +1,11 @@
+import os
 import pandas as pd
 from src.DataHandler import CsvDataHandler
-from typing import List,Dict,Tuple
+from typing import Iterator,List,Dict,Tuple,Optional
 from src.database.Models import Base
 from sqlalchemy.engine import Engine
 from src.database.PostgresConnection import PostgresConnection
-from src.database.DatabaseManager import DatabaseTableManager
+from src.database.DatabaseManager import load_tables_concurrently, load_tables_delta, read_value_index, record_row_hashes, synchronize_id_sequences
 
 def create_joined_df(title_dh: CsvDataHandler, best_netflix_df: pd.DataFrame, best_by_year_netflix_df: pd.DataFrame, col_to_drop: List[str], col_to_rename: Dict[str,str]):
     raw_credits_best_netflix_df = title_dh.joining_dfs(best_netflix_df,'title')
@@ -12,19 +13,59 @@ def create_joined_df(title_dh: CsvDataHandler, best_netflix_df: pd.DataFrame, be
     raw_credits_best_years_netflix_df = raw_credits_best_netflix_dh.joining_dfs(best_by_year_netflix_df,'title')
     raw_credits_best_years_netflix_dh: CsvDataHandler = CsvDataHandler(df=raw_credits_best_years_netflix_df)
     raw_credits_best_years_netflix_df.replace('', pd.NA, inplace=True)
-    raw_credits_best_years_netflix_dh.change_values_to_flag('release_year')
+    raw_credits_best_years_netflix_dh.change_values_to_bool('release_year')
     raw_credits_best_years_netflix_dh.drop_columns(col_to_drop)
     raw_credits_best_years_netflix_dh.rename_columns(col_to_rename)
+    raw_credits_best_years_netflix_dh.change_column_type_to_numeric('imdb_score','Float64')
+    raw_credits_best_years_netflix_dh.change_column_type_to_numeric('release_year','Int16')
     return raw_credits_best_years_netflix_df
 
-def create_many_to_many_reliationship_df(joined_dh: CsvDataHandler, cols:List[str]) -> Tuple[pd.Series,pd.DataFrame]:
-    unique_values = joined_dh.extract_unique_values(cols[1])
-    joined_dh.map_values_to_indices(cols[1],unique_values)
-    df = joined_dh.create_many_to_many_reliationship_df(cols)
-    return (unique_values,df)
+def create_many_to_many_reliationship_df(joined_dh: CsvDataHandler, cols:List[str], value_to_index: Optional[Dict[str,int]] = None) -> Tuple[pd.Series,pd.DataFrame]:
+    unique_values, df = joined_dh.factorize_list_column(cols,value_to_index)
+    return (unique_values,df.drop_duplicates())
 
 def from_series_to_df(series:pd.Series, col_name:str) -> pd.DataFrame:
-    return pd.DataFrame({'id':range(1,len(series)+1), col_name:list(series)})
+    return pd.DataFrame({'id':list(series.index), col_name:list(series)})
+
+def load_frames(engine: Engine, frames: Dict[str,pd.DataFrame], delta: bool, ingest_workers: int,
+                link_owners: Optional[Dict[str,pd.Series]] = None) -> None:
+    if delta:
+        load_tables_delta(engine, Base.metadata, frames, link_owners)
+    else:
+        load_tables_concurrently(engine, Base.metadata, frames, max_workers=ingest_workers)
+        record_row_hashes(engine, Base.metadata, frames)
+
+def title_aligned_chunks(chunks: Iterator[CsvDataHandler]) -> Iterator[CsvDataHandler]:
+    # Holds back the rows of the last title of every chunk, so all the credits of a title are loaded together
+    carried_df = None
+    for chunk_dh in chunks:
+        chunk_df = chunk_dh.get_df() if carried_df is None else pd.concat([carried_df, chunk_dh.get_df()])
+        is_last_title = (chunk_df['id'] == chunk_df['id'].iloc[-1]).to_numpy()
+        carried_df = chunk_df[is_last_title]
+        if not is_last_title.all():
+            yield CsvDataHandler(df=chunk_df[~is_last_title])
+    if carried_df is not None:
+        yield CsvDataHandler(df=carried_df)
+
+def transform_credits_chunk(credits_dh: CsvDataHandler, name_to_index: Dict[str,int], role_to_index: Dict[str,int],
+                            movie_ids: pd.Series, show_ids: pd.Series) -> Dict[str,pd.DataFrame]:
+    credits_dh.rename_columns({
+        'id'   : 'movie_id',
+        'index': 'id'
+    })
+    new_names, credits_movie_id_name_df = credits_dh.factorize_list_column(['movie_id','name'],name_to_index)
+    new_roles, credits_movie_id_role_df = credits_dh.factorize_list_column(['movie_id','role'],role_to_index)
+    credits_many_to_many_df = credits_movie_id_name_df.join(credits_movie_id_role_df['role'], how='inner')
+
+    movie_actors_df = credits_many_to_many_df[credits_many_to_many_df['movie_id'].isin(movie_ids)]
+    show_actors_df = credits_many_to_many_df[credits_many_to_many_df['movie_id'].isin(show_ids)].rename(columns={'movie_id':'show_id'})
+    return {
+        'actor'      : from_series_to_df(new_names,'name'),
+        'role'       : from_series_to_df(new_roles,'role'),
+        'credit'     : credits_dh.get_df()[['id','character']].dropna(),
+        'movie_actor': movie_actors_df[['movie_id','name','role']],
+        'show_actor' : show_actors_df[['show_id','name','role']],
+    }
 
 if __name__ == "__main__":
     postgres_connection: PostgresConnection = PostgresConnection()
@@ -32,6 +73,14 @@ if __name__ == "__main__":
 
     Base.metadata.create_all(engine)
 
+    delta = os.getenv('INGEST_MODE', 'full').lower() == 'delta'
+    value_indexes: Dict[Tuple[str,str],Dict[str,int]] = {
+        (table_name, column): read_value_index(engine, Base.metadata, table_name, column) if delta else {}
+        for table_name, column in [('movie_genre','genre'), ('movie_production_country','production_country'),
+                                   ('show_genre','genre'), ('show_production_country','production_country'),
+                                   ('actor','name'), ('role','role')]
+    }
+
     file_paths = {
         'best_movie_by_year_netflix': "./Best Movie by Year Netflix.csv",
         'best_movies_netflix'       : "./Best Movies Netflix.csv",
@@ -40,12 +89,13 @@ if __name__ == "__main__":
         'raw_credits'               : "./raw_credits.csv",
         'raw_titles'                : "./raw_titles.csv",
     }
-    best_movies_by_year_netflix_dh: CsvDataHandler = CsvDataHandler(file_paths['best_movie_by_year_netflix'])
-    best_movies_netflix_dh: CsvDataHandler = CsvDataHandler(file_paths['best_movies_netflix'])
-    best_show_by_year_netflix_dh: CsvDataHandler = CsvDataHandler(file_paths['best_show_by_year_netflix'])
-    best_shows_netflix_dh: CsvDataHandler = CsvDataHandler(file_paths['best_shows_netflix'])
-    raw_credits_dh: CsvDataHandler = CsvDataHandler(file_paths['raw_credits'])
-    raw_titles_dh: CsvDataHandler = CsvDataHandler(file_paths['raw_titles'])
+    staging_cache_dir: Optional[str] = os.getenv('STAGING_CACHE_DIR')
+    best_movies_by_year_netflix_dh: CsvDataHandler = CsvDataHandler(file_paths['best_movie_by_year_netflix'], cache_dir=staging_cache_dir)
+    best_movies_netflix_dh: CsvDataHandler = CsvDataHandler(file_paths['best_movies_netflix'], cache_dir=staging_cache_dir)
+    best_show_by_year_netflix_dh: CsvDataHandler = CsvDataHandler(file_paths['best_show_by_year_netflix'], cache_dir=staging_cache_dir)
+    best_shows_netflix_dh: CsvDataHandler = CsvDataHandler(file_paths['best_shows_netflix'], cache_dir=staging_cache_dir)
+    raw_credits_dh: CsvDataHandler = CsvDataHandler(file_paths['raw_credits'], cache_dir=staging_cache_dir)
+    raw_titles_dh: CsvDataHandler = CsvDataHandler(file_paths['raw_titles'], cache_dir=staging_cache_dir)
 
     raw_titles_df: pd.DataFrame = raw_titles_dh.read_data_to_df()
     movies_df,shows_df = raw_titles_dh.seperate_dfs_by_column_values('type',['MOVIE','SHOW'])
@@ -65,8 +115,6 @@ if __name__ == "__main__":
     best_show_by_year_netflix_df: pd.DataFrame = best_show_by_year_netflix_dh.read_data_to_df()
     best_show_by_year_netflix_dh.columns_to_lowercase()
 
-    raw_credits_df: pd.DataFrame = raw_credits_dh.read_data_to_df()
-
     movies_df_col_to_rename={
         'main_genre_y':'main_genre',
         'main_production_y':'main_production',
@@ -79,7 +127,7 @@ if __name__ == "__main__":
     joined_movie_df = create_joined_df(movies_dh,best_movies_netflix_df,best_movies_by_year_netflix_df,
                                     movies_df_columns_to_drop,movies_df_col_to_rename)
     joined_movie_dh: CsvDataHandler = CsvDataHandler(df=joined_movie_df)
-    unique_movie_genres, movie_id_genres_df = create_many_to_many_reliationship_df(joined_movie_dh,['id','genres'])
+    unique_movie_genres, movie_id_genres_df = create_many_to_many_reliationship_df(joined_movie_dh,['id','genres'],value_indexes[('movie_genre','genre')])
     unique_movie_genres_df = from_series_to_df(unique_movie_genres,'genre')
 
     movie_id_genres_df.rename(columns={
@@ -87,7 +135,7 @@ if __name__ == "__main__":
         'genres': 'genre_id'
     },inplace=True)
 
-    unique_production_countries, movie_id_production_countries_df = create_many_to_many_reliationship_df(joined_movie_dh,['id','production_countries'])
+    unique_production_countries, movie_id_production_countries_df = create_many_to_many_reliationship_df(joined_movie_dh,['id','production_countries'],value_indexes[('movie_production_country','production_country')])
     unique_production_countries_df = from_series_to_df(unique_production_countries,'production_country')
 
     movie_id_production_countries_df.rename(columns={
@@ -104,8 +152,8 @@ if __name__ == "__main__":
     joined_show_df: pd.DataFrame = create_joined_df(shows_dh,best_shows_netflix_df,best_show_by_year_netflix_df,movies_df_columns_to_drop,movies_df_col_to_rename)
     joined_show_dh: CsvDataHandler = CsvDataHandler(df=joined_show_df)
 
-    unique_shows_genres, show_id_genres_df = create_many_to_many_reliationship_df(joined_show_dh,['id','genres'])
-    unique_shows_production_countries ,show_id_production_countries_df = create_many_to_many_reliationship_df(joined_show_dh,['id','production_countries'])
+    unique_shows_genres, show_id_genres_df = create_many_to_many_reliationship_df(joined_show_dh,['id','genres'],value_indexes[('show_genre','genre')])
+    unique_shows_production_countries ,show_id_production_countries_df = create_many_to_many_reliationship_df(joined_show_dh,['id','production_countries'],value_indexes[('show_production_country','production_country')])
     unique_shows_genres_df = from_series_to_df(unique_shows_genres,'genre')
     unique_shows_production_countries_df = from_series_to_df(unique_shows_production_countries,'production_country')
     show_id_genres_df.rename(columns={
@@ -119,52 +167,42 @@ if __name__ == "__main__":
 
     joined_show_dh.drop_columns(['genres','production_countries'])
 
-    raw_credits_dh.rename_columns({
-        'id'   : 'movie_id',
-        'index': 'id'
-    })
-
-    unqiue_credits_name, credits_movie_id_name_df = create_many_to_many_reliationship_df(raw_credits_dh,['movie_id','name'])
-    unqiue_credits_role, credits_movie_id_role_df = create_many_to_many_reliationship_df(raw_credits_dh,['movie_id','role'])
-    unqiue_credits_name_df = from_series_to_df(unqiue_credits_name,'name')
-    unqiue_credits_role_df = from_series_to_df(unqiue_credits_role,'role')
-    credits_many_to_many_df = pd.concat([credits_movie_id_name_df, credits_movie_id_role_df], axis=1)
-    credits_many_to_many_df = credits_many_to_many_df.loc[:, ~credits_many_to_many_df.columns.duplicated()].dropna()
-
-    for table_tuple in [(joined_movie_df,'movie'),(unique_movie_genres_df,'movie_genre'),(movie_id_genres_df,'movie_genre_link'),
-                  (unique_production_countries_df,'movie_production_country'),(movie_id_production_countries_df,'movie_production_country_link'),
-                  (joined_show_df,'show'),(unique_shows_genres_df,'show_genre'),(unique_shows_production_countries_df,'show_production_country'),
-                  (show_id_genres_df,'show_genre_link'),(show_id_production_countries_df,'show_production_country_link')]:
-        dbt: DatabaseTableManager = DatabaseTableManager(engine,table_tuple[0],table_tuple[1])
-        dbt.insert_df_into_database()
-
-    raw_credits_dh.drop_columns(['name','role','person_id','movie_id'])
-    raw_credits_df.dropna(inplace=True)
-    raw_credit_dbt: DatabaseTableManager = DatabaseTableManager(engine,raw_credits_df,'credit')
-    raw_credit_dbt.insert_df_into_database()
-
-    credits_many_to_many_copy_df = credits_many_to_many_df.copy()
-    movie_actors_credits_dh: CsvDataHandler = CsvDataHandler(df=credits_many_to_many_df)
-    movie_actors_credits_dh.rename_columns({
-        'movie_id':'id'
+    ingest_workers = int(os.getenv('INGEST_WORKERS', '4'))
+    load_frames(engine, {
+        'movie'                         : joined_movie_df,
+        'movie_genre'                   : unique_movie_genres_df,
+        'movie_genre_link'              : movie_id_genres_df,
+        'movie_production_country'      : unique_production_countries_df,
+        'movie_production_country_link' : movie_id_production_countries_df,
+        'show'                          : joined_show_df,
+        'show_genre'                    : unique_shows_genres_df,
+        'show_production_country'       : unique_shows_production_countries_df,
+        'show_genre_link'               : show_id_genres_df,
+        'show_production_country_link'  : show_id_production_countries_df,
+    }, delta, ingest_workers, {
+        'movie_genre_link'              : joined_movie_df['id'],
+        'movie_production_country_link' : joined_movie_df['id'],
+        'show_genre_link'               : joined_show_df['id'],
+        'show_production_country_link'  : joined_show_df['id'],
     })
-    movie_actors_df = movie_actors_credits_dh.joining_dfs(joined_movie_df,'id','inner')
 
-    show_actors_credits_dh: CsvDataHandler = CsvDataHandler(df=credits_many_to_many_copy_df)
-    show_actors_credits_dh.rename_columns({
-        'movie_id':'id'
-    })
-    show_actors_df = show_actors_credits_dh.joining_dfs(joined_show_df,'id','inner')
-
-    movie_actors_dh: CsvDataHandler = CsvDataHandler(df=movie_actors_df)
-    show_actors_dh: CsvDataHandler = CsvDataHandler(df=show_actors_df)
-    movie_actors_dh.rename_columns({
-        'id':'movie_id'
-    })
-    show_actors_dh.rename_columns({
-        'id':'show_id'
-    })
-    for table_tuple in [(unqiue_credits_name_df,'actor'),(unqiue_credits_role_df,'role'),(movie_actors_df[['movie_id','name','role']],'movie_actor'),
-                        (show_actors_df[['show_id','name','role']],'show_actor')]:
-        dbt: DatabaseTableManager = DatabaseTableManager(engine,table_tuple[0],table_tuple[1])
-        dbt.insert_df_into_database()
\ No newline at end of file
+    credits_name_to_index = value_indexes[('actor','name')]
+    credits_role_to_index = value_indexes[('role','role')]
+    credited_title_ids = set()
+    for credits_chunk_dh in title_aligned_chunks(raw_credits_dh.read_data_in_chunks(int(os.getenv('CREDITS_CHUNKSIZE', '100000')))):
+        chunk_title_ids = credits_chunk_dh.get_df()['id'].unique()
+        credited_title_ids.update(chunk_title_ids)
+        credits_frames = transform_credits_chunk(credits_chunk_dh, credits_name_to_index, credits_role_to_index,
+                                                 joined_movie_df['id'], joined_show_df['id'])
+        load_frames(engine, credits_frames, delta, ingest_workers, {'movie_actor': chunk_title_ids, 'show_actor': chunk_title_ids})
+    if delta:
+        # Titles without any credit left lose the actors of the previous load
+        load_frames(engine, {
+            'movie_actor': pd.DataFrame(columns=['movie_id','name','role']),
+            'show_actor' : pd.DataFrame(columns=['show_id','name','role']),
+        }, delta, ingest_workers, {
+            'movie_actor': joined_movie_df['id'][~joined_movie_df['id'].isin(credited_title_ids)],
+            'show_actor' : joined_show_df['id'][~joined_show_df['id'].isin(credited_title_ids)],
+        })
+
+    synchronize_id_sequences(engine, Base.metadata)
@@ -0,0 +1,87 @@
+import statistics
+import time
+from typing import Any, Dict, List, Tuple
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from src.database.Models import Base
+from src.database.PostgresConnection import PostgresConnection
+from src.database.DatabaseManager import create_indexes_concurrently
+
+sample_size = 50
+repeats = 5
+
+# The lookups served by the new indexes, with the parameter each one is run with
+benchmark_queries: Dict[str, Tuple[str, str]] = {
+    'movie genres'               : ('SELECT g.genre FROM movie_genre g JOIN movie_genre_link l ON l.genre_id = g.id WHERE l.movie_id = :movie_id', 'movie_id'),
+    'movie production countries' : ('SELECT p.production_country FROM movie_production_country p JOIN movie_production_country_link l '
+                                    'ON l.production_country_id = p.id WHERE l.movie_id = :movie_id', 'movie_id'),
+    'movie actors'               : ('SELECT a.name, r.role FROM movie_actor m JOIN actor a ON a.id = m.name JOIN role r ON r.id = m.role '
+                                    'WHERE m.movie_id = :movie_id', 'movie_id'),
+    'show genres'                : ('SELECT g.genre FROM show_genre g JOIN show_genre_link l ON l.genre_id = g.id WHERE l.show_id = :show_id', 'show_id'),
+    'show production countries'  : ('SELECT p.production_country FROM show_production_country p JOIN show_production_country_link l '
+                                    'ON l.production_country_id = p.id WHERE l.show_id = :show_id', 'show_id'),
+    'show actors'                : ('SELECT a.name, r.role FROM show_actor s JOIN actor a ON a.id = s.name JOIN role r ON r.id = s.role '
+                                    'WHERE s.show_id = :show_id', 'show_id'),
+    'actor movies'               : ('SELECT movie_id FROM movie_actor WHERE name = :actor_id', 'actor_id'),
+    'actor shows'                : ('SELECT show_id FROM show_actor WHERE name = :actor_id', 'actor_id'),
+    'actor by name'              : ('SELECT id FROM actor WHERE name = :name', 'name'),
+    'genre by name'              : ('SELECT id FROM movie_genre WHERE genre = :genre', 'genre'),
+    'production country by name' : ('SELECT id FROM movie_production_country WHERE production_country = :production_country', 'production_country'),
+}
+
+# Where the sample parameter values are drawn from
+parameter_sources: Dict[str, str] = {
+    'movie_id'           : 'SELECT id FROM movie',
+    'show_id'            : 'SELECT id FROM show',
+    'actor_id'           : 'SELECT id FROM actor',
+    'name'               : 'SELECT name FROM actor',
+    'genre'              : 'SELECT genre FROM movie_genre',
+    'production_country' : 'SELECT production_country FROM movie_production_country',
+}
+
+def sample_parameters(engine: Engine) -> Dict[str, List[Any]]:
+    with engine.connect() as connection:
+        return {
+            name: connection.execute(text(f'{source} ORDER BY random() LIMIT :limit'), {'limit': sample_size}).scalars().all()
+            for name, source in parameter_sources.items()
+        }
+
+def scan_nodes(plan: Dict[str, Any]) -> List[str]:
+    nodes = [f"{plan['Node Type']} on {plan['Relation Name']}"] if 'Relation Name' in plan else []
+    for child in plan.get('Plans', []):
+        nodes.extend(scan_nodes(child))
+    return nodes
+
+def run_benchmark(engine: Engine, parameters: Dict[str, List[Any]]) -> Dict[str, Tuple[float, List[str]]]:
+    results = {}
+    with engine.connect() as connection:
+        for query_name, (query, parameter) in benchmark_queries.items():
+            values = parameters[parameter]
+            if not values:
+                continue
+            timings = []
+            for _ in range(repeats):
+                for value in values:
+                    started = time.perf_counter()
+                    connection.execute(text(query), {parameter: value}).all()
+                    timings.append((time.perf_counter() - started) * 1000)
+            plan = connection.execute(text(f'EXPLAIN (FORMAT JSON) {query}'), {parameter: values[0]}).scalar()
+            results[query_name] = (statistics.median(timings), scan_nodes(plan[0]['Plan']))
+    return results
+
+if __name__ == "__main__":
+    postgres_connection: PostgresConnection = PostgresConnection()
+    engine: Engine = postgres_connection.get_engine()
+
+    parameters = sample_parameters(engine)
+    before = run_benchmark(engine, parameters)
+    built_indexes = create_indexes_concurrently(engine, Base.metadata)
+    after = run_benchmark(engine, parameters)
+
+    print(f"Built {len(built_indexes)} indexes: {', '.join(built_indexes) or '-'}")
+    print(f"{'query':<28} {'before ms':>10} {'after ms':>10} {'speedup':>8}")
+    for query_name, (before_ms, before_scans) in before.items():
+        after_ms, after_scans = after[query_name]
+        print(f"{query_name:<28} {before_ms:>10.3f} {after_ms:>10.3f} {before_ms / after_ms:>7.1f}x")
+        print(f"    before: {', '.join(before_scans)}")
+        print(f"    after : {', '.join(after_scans)}")
@@ -0,0 +1,18 @@
+import logging
+import os
+from sqlalchemy.engine import Engine
+from src.database.Models import Base
+from src.database.PostgresConnection import PostgresConnection
+from src.database.DatabaseManager import convert_title_column_types, create_indexes_concurrently, synchronize_id_sequences
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    postgres_connection: PostgresConnection = PostgresConnection()
+    engine: Engine = postgres_connection.get_engine()
+
+    converted_columns = convert_title_column_types(engine)
+    print(f"Converted {len(converted_columns)} columns: {', '.join(converted_columns) or '-'}")
+    synchronize_id_sequences(engine, Base.metadata)
+    remove_duplicates = os.getenv('REMOVE_DUPLICATE_LINKS', 'false').lower() in ('1', 'true', 'yes')
+    built_indexes = create_indexes_concurrently(engine, Base.metadata, remove_duplicates)
+    print(f"Built {len(built_indexes)} indexes: {', '.join(built_indexes) or '-'}")
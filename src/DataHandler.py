@@ -1,5 +1,43 @@
+import hashlib
+import logging
+import os
 import pandas as pd
-from typing import Optional, Tuple, List, Dict
+from typing import Optional, Tuple, List, Dict, Iterator
+
+logger = logging.getLogger(__name__)
+
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+    import pyarrow.ipc
+except ImportError as e:
+    logger.warning("pyarrow cannot be imported (%s); the staging cache is disabled and strings use pandas' string dtype", e)
+    pa = None
+
+# Arrow-backed strings when pyarrow is installed, pandas' own string dtype otherwise
+STRING_DTYPE: str = 'string[pyarrow]' if pa is not None else 'string'
+
+# The dtype of every known column, applied by lowercase column name when a CSV is read
+DTYPE_PLAN: Dict[str, str] = {
+    'type'                 : 'category',
+    'age_certification'    : 'category',
+    'main_genre'           : 'category',
+    'main_production'      : 'category',
+    'role'                 : 'category',
+    'title'                : STRING_DTYPE,
+    'description'          : STRING_DTYPE,
+    'genres'               : STRING_DTYPE,
+    'production_countries' : STRING_DTYPE,
+    'name'                 : STRING_DTYPE,
+    'character'            : STRING_DTYPE,
+    'release_year'         : 'Int16',
+    'runtime'              : 'Int16',
+    'duration'             : 'Int16',
+    'seasons'              : 'Int8',
+    'number_of_seasons'    : 'Int8',
+    'imdb_votes'           : 'Int32',
+    'number_of_votes'      : 'Int32',
+}
 
 class CsvDataHandler:
     """
@@ -11,9 +49,14 @@ class CsvDataHandler:
         The path to the CSV file.
     df : Optional[pd.DataFrame]
         The DataFrame to store the data.
+    cache_dir : Optional[str]
+        The directory of the columnar staging cache, or None to always parse the CSV.
+    dtype_plan : Dict[str, str]
+        The dtype of every known column by lowercase column name.
     """
 
-    def __init__(self, file_path: str = None, df: Optional[pd.DataFrame] = None) -> None:
+    def __init__(self, file_path: str = None, df: Optional[pd.DataFrame] = None, cache_dir: Optional[str] = None,
+                 dtype_plan: Optional[Dict[str, str]] = None) -> None:
         """
         Initializes the CsvDataHandler with a file path and an optional DataFrame.
 
@@ -23,22 +66,135 @@ class CsvDataHandler:
             The path to the CSV file (default is None).
         df : Optional[pd.DataFrame], optional
             A pandas DataFrame (default is None).
+        cache_dir : Optional[str], optional
+            The directory of the columnar staging cache (default is None, no cache).
+        dtype_plan : Optional[Dict[str, str]], optional
+            The dtype of every known column by lowercase column name (default is ``DTYPE_PLAN``).
         """
         self.file_path = file_path
         self.df: Optional[pd.DataFrame] = df
+        self.cache_dir = cache_dir
+        self.dtype_plan: Dict[str, str] = DTYPE_PLAN if dtype_plan is None else dtype_plan
+
+    def read_dtypes(self) -> Dict[str, str]:
+        """
+        Matches the dtype plan against the header of the CSV file.
+
+        Returns:
+        --------
+        Dict[str, str]
+            The dtype of every planned column of the file, by its name in the file.
+        """
+        columns = pd.read_csv(self.file_path, header=0, nrows=0).columns
+        return {column: self.dtype_plan[column.lower()] for column in columns if column.lower() in self.dtype_plan}
+
+    def file_content_hash(self) -> str:
+        """
+        Hashes the contents of the CSV file.
+
+        Returns:
+        --------
+        str
+            The hex digest of the file contents.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        with open(self.file_path, 'rb') as file:
+            for block in iter(lambda: file.read(1 << 20), b''):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def staging_path(self) -> Optional[str]:
+        """
+        Returns the path of the Arrow staging file for the current contents of the CSV file and dtype plan.
+
+        Returns:
+        --------
+        Optional[str]
+            The staging file path, or None if no cache directory is set or pyarrow is not installed.
+        """
+        if self.cache_dir is None or self.file_path is None or pa is None:
+            return None
+        file_name = os.path.splitext(os.path.basename(self.file_path))[0]
+        plan_hash = hashlib.blake2b(repr(sorted(self.dtype_plan.items())).encode('utf-8'), digest_size=4).hexdigest()
+        return os.path.join(self.cache_dir, f"{file_name}-{self.file_content_hash()}-{plan_hash}.arrow")
 
     def read_data_to_df(self) -> pd.DataFrame:
         """
-        Reads data from a CSV file into a DataFrame.
+        Reads data from a CSV file into a DataFrame, applying the dtype plan while parsing.
+
+        With a staging cache, an unchanged file is memory-mapped from its Arrow staging file instead
+        of being parsed again, and a new or changed file is staged after it is parsed.
 
         Returns:
         --------
         pd.DataFrame
             The DataFrame containing the data read from the CSV file.
         """
-        self.df = pd.read_csv(self.file_path, header=0)
+        staging_path = self.staging_path()
+        if staging_path is not None and os.path.exists(staging_path):
+            self.df = feather.read_table(staging_path, memory_map=True).to_pandas()
+            return self.df
+        self.df = pd.read_csv(self.file_path, header=0, dtype=self.read_dtypes())
+        if staging_path is not None:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            feather.write_feather(self.df, f"{staging_path}.tmp", compression='uncompressed')
+            os.replace(f"{staging_path}.tmp", staging_path)
         return self.df
     
+    def read_data_in_chunks(self, chunksize: int) -> Iterator["CsvDataHandler"]:
+        """
+        Reads data from a CSV file in chunks of at most ``chunksize`` rows.
+
+        With a staging cache, an unchanged file is sliced from its memory-mapped Arrow staging file.
+        Otherwise the CSV is parsed chunk by chunk and the chunks are staged as they are read; if a
+        later chunk cannot be cast to the types of the first one, a warning is logged and the file is
+        not staged. Categorical columns are read and staged as strings, since the categories of every
+        chunk differ, and are cast to categories chunk by chunk.
+
+        Parameters:
+        -----------
+        chunksize : int
+            The number of rows per chunk.
+
+        Yields:
+        -------
+        Iterator[CsvDataHandler]
+            A CsvDataHandler wrapping each chunk's DataFrame.
+        """
+        dtypes = self.read_dtypes()
+        categorical_dtypes = {column: dtype for column, dtype in dtypes.items() if dtype == 'category'}
+        read_dtypes = {column: STRING_DTYPE if dtype == 'category' else dtype for column, dtype in dtypes.items()}
+        staging_path = self.staging_path()
+        if staging_path is not None and os.path.exists(staging_path):
+            for batch in feather.read_table(staging_path, memory_map=True).to_batches(max_chunksize=chunksize):
+                yield CsvDataHandler(self.file_path, df=batch.to_pandas().astype(categorical_dtypes))
+            return
+        writer, schema, staged = None, None, False
+        tmp_path = f"{staging_path}.tmp"
+        try:
+            with pd.read_csv(self.file_path, header=0, dtype=read_dtypes, chunksize=chunksize) as reader:
+                for chunk in reader:
+                    if staging_path is not None:
+                        try:
+                            table = pa.Table.from_pandas(chunk, preserve_index=False)
+                            if writer is None:
+                                os.makedirs(self.cache_dir, exist_ok=True)
+                                schema = table.schema
+                                writer = pa.ipc.new_file(tmp_path, schema)
+                            writer.write_table(table.cast(schema))
+                        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError) as e:
+                            logger.warning("Not staging %s: %s", self.file_path, e)
+                            staging_path = None
+                    yield CsvDataHandler(self.file_path, df=chunk.astype(categorical_dtypes))
+            staged = staging_path is not None and writer is not None
+        finally:
+            if writer is not None:
+                writer.close()
+                if staged:
+                    os.replace(tmp_path, staging_path)
+                else:
+                    os.remove(tmp_path)
+    
     def get_df(self) -> Optional[pd.DataFrame]:
         """
         Returns the current DataFrame.
@@ -137,32 +293,73 @@ class CsvDataHandler:
         col : str
             The column to modify.
         """
-        self.df[col] = self.df[col].apply(lambda x: 'N' if pd.isna(x) else 'Y')
+        self.df[col] = self.df[col].notna().map({True: 'Y', False: 'N'})
+
+    def change_values_to_bool(self, col: str) -> None:
+        """
+        Changes the values in a column to booleans based on their presence.
+
+        Parameters:
+        -----------
+        col : str
+            The column to modify.
+        """
+        self.df[col] = self.df[col].notna()
+
+    def change_column_type_to_numeric(self, col: str, dtype: str) -> None:
+        """
+        Changes the data type of a specified column to a nullable numeric type.
+
+        Values that cannot be parsed as numbers become missing values.
+
+        Parameters:
+        -----------
+        col : str
+            The column to change.
+        dtype : str
+            The nullable numeric dtype, such as ``'Float64'`` or ``'Int16'``.
+        """
+        self.df[col] = pd.to_numeric(self.df[col], errors='coerce').astype(dtype)
     
-    def extract_unique_values(self, column: str) -> pd.Series:
+    def explode_list_column(self, column: str) -> pd.Series:
         """
-        Extracts unique values from a specified column.
+        Parses a column of list-like strings such as ``"['drama', 'comedy']"`` into one row per value.
 
         Parameters:
         -----------
         column : str
-            The column to extract unique values from.
+            The column to parse.
 
         Returns:
         --------
         pd.Series
-            A Series of unique values.
+            The stripped, non-empty values, indexed by the position of the row they came from.
         """
         values_series = (
             self.df[column]
+            .reset_index(drop=True)
             .str.replace(r"[\[\]']", "", regex=True)
             .str.split(',')
             .explode()
-            .dropna()
             .str.strip()
         )
-        unique_values = pd.Series(values_series[values_series != ""].unique())
-        return unique_values
+        return values_series[values_series.notna() & (values_series != "")]
+
+    def extract_unique_values(self, column: str) -> pd.Series:
+        """
+        Extracts unique values from a specified column.
+
+        Parameters:
+        -----------
+        column : str
+            The column to extract unique values from.
+
+        Returns:
+        --------
+        pd.Series
+            A Series of unique values.
+        """
+        return pd.Series(self.explode_list_column(column).unique())
 
     def map_values_to_indices(self, column: str, unique_values: pd.Series) -> None:
         """
@@ -175,15 +372,93 @@ class CsvDataHandler:
         unique_values : pd.Series
             A Series of unique values to map to indices.
         """
-        value_to_index = {value: index + 1 for index, value in unique_values.items()}
-        
-        self.df[column] = (
-            self.df[column]
-            .str.replace(r"[\[\]']", "", regex=True)
-            .str.split(',')
-            .apply(lambda values: [value_to_index[value.strip()] for value in values if value.strip() in value_to_index])
-        )
-        
+        value_to_index = pd.Series(unique_values.index + 1, index=unique_values.values)
+        indices = self.explode_list_column(column).map(value_to_index).dropna().astype('int64')
+        self.df[column] = indices.groupby(level=0).agg(list).reindex(range(len(self.df))).values
+
+    def factorize_list_column(self, cols: List[str], value_to_index: Optional[Dict[str, int]] = None) -> Tuple[pd.Series, pd.DataFrame]:
+        """
+        Builds a many-to-many DataFrame of keys and value indices from a column of list-like strings.
+
+        The column is parsed and exploded once and its values are factorized, so each distinct value
+        is looked up once rather than once per row. Values missing from ``value_to_index`` get
+        consecutive indices after the largest existing one, in the order they first appear, which keeps the
+        indices stable when a file is processed chunk by chunk with the same mapping.
+
+        Parameters:
+        -----------
+        cols : List[str]
+            The key column and the list-like value column.
+        value_to_index : Optional[Dict[str, int]], optional
+            A running value to index mapping, extended in place (default is None, a fresh mapping).
+
+        Returns:
+        --------
+        Tuple[pd.Series, pd.DataFrame]
+            The newly indexed values, indexed by their new indices, and the many-to-many DataFrame.
+        """
+        if value_to_index is None:
+            value_to_index = {}
+        values_series = self.explode_list_column(cols[1])
+        codes, uniques = pd.factorize(values_series)
+        indices = pd.Series(uniques).map(value_to_index)
+        is_new = indices.isna().to_numpy()
+        start = max(value_to_index.values(), default=0) + 1
+        new_values = pd.Series(uniques[is_new], index=range(start, start + int(is_new.sum())), dtype=object)
+        indices[is_new] = new_values.index.to_numpy()
+        value_to_index.update(zip(new_values.values, new_values.index))
+        many_to_many_df = pd.DataFrame({
+            cols[0]: self.df[cols[0]].to_numpy()[values_series.index],
+            cols[1]: indices.to_numpy(dtype='int64')[codes],
+        }, index=values_series.index)
+        return new_values, many_to_many_df
+
+    def hash_rows(self, key_columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Computes a key and a content hash for every row of the DataFrame.
+
+        Values are normalized to strings before hashing so the same row hashes the same way
+        regardless of the dtype pandas inferred for the file or chunk it was read from.
+
+        Parameters:
+        -----------
+        key_columns : Optional[List[str]], optional
+            The columns identifying a row (default is None, the row is identified by its hash).
+
+        Returns:
+        --------
+        pd.DataFrame
+            The ``row_key`` and ``row_hash`` of every row, indexed like the DataFrame.
+        """
+        normalized_df = self.df.astype('string')
+        row_hash = pd.util.hash_pandas_object(normalized_df, index=False).astype(str)
+        if not key_columns:
+            return pd.DataFrame({'row_key': row_hash, 'row_hash': row_hash})
+        row_key = normalized_df[key_columns[0]].fillna('')
+        for column in key_columns[1:]:
+            row_key = row_key.str.cat(normalized_df[column].fillna(''), sep='|')
+        return pd.DataFrame({'row_key': row_key.astype(str), 'row_hash': row_hash})
+
+    def hash_groups(self, key_column: str) -> pd.DataFrame:
+        """
+        Computes one content hash per group of rows sharing a key, independent of the row order.
+
+        Parameters:
+        -----------
+        key_column : str
+            The column identifying a group, such as the title ID of link rows.
+
+        Returns:
+        --------
+        pd.DataFrame
+            The ``row_key`` and ``row_hash`` of every group.
+        """
+        row_hashes = self.hash_rows()
+        row_keys = self.df[key_column].astype('string').fillna('').astype(str)
+        group_rows = row_hashes['row_hash'].groupby(row_keys.to_numpy()).agg(lambda hashes: ','.join(sorted(hashes)))
+        group_hash = pd.util.hash_pandas_object(group_rows, index=False).astype(str)
+        return pd.DataFrame({'row_key': group_rows.index.astype(str), 'row_hash': group_hash.to_numpy()})
+
     def create_many_to_many_reliationship_df(self, cols: List[str]) -> pd.DataFrame:
         """
         Creates a DataFrame representing a many-to-many relationship based on specified columns.
@@ -1,18 +1,51 @@
+import csv
+import logging
 import pandas as pd
-from sqlalchemy.engine import Engine
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from io import StringIO
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from sqlalchemy import Column, Integer, MetaData, Table, UniqueConstraint, delete, insert, select, text, tuple_
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import DBAPIError
+from src.DataHandler import CsvDataHandler
+from src.database.Models import ingest_row_hash
+
+logger = logging.getLogger(__name__)
+
+def copy_from_stdin(table: Any, conn: Any, keys: List[str], data_iter: Iterable[tuple]) -> None:
+    """
+    A ``DataFrame.to_sql`` insertion method that streams rows through PostgreSQL ``COPY FROM STDIN``.
+
+    Args:
+        table (Any): The pandas SQL table being written.
+        conn (Any): The SQLAlchemy connection.
+        keys (List[str]): The column names.
+        data_iter (Iterable[tuple]): The rows of the current chunk.
+    """
+    buffer = StringIO()
+    csv.writer(buffer).writerows(data_iter)
+    buffer.seek(0)
+    columns = ', '.join(f'"{key}"' for key in keys)
+    table_name = f'"{table.schema}"."{table.name}"' if table.schema else f'"{table.name}"'
+    with conn.connection.cursor() as cursor:
+        cursor.copy_expert(f'COPY {table_name} ({columns}) FROM STDIN WITH (FORMAT csv)', buffer)
 
 class DatabaseTableManager:
     """
-    A manager class for handling database table operations such as inserting a DataFrame into a table 
+    A manager class for handling database table operations such as inserting a DataFrame into a table
     and dropping specified columns from a table.
-    
+
     Attributes:
         engine (Engine): The SQLAlchemy engine connected to the database.
         df (pd.DataFrame): The DataFrame to be inserted into the database.
         table_name (str): The name of the table in the database.
+        method (str): The load method, ``'copy'`` for PostgreSQL COPY or ``'insert'`` for INSERT statements.
+        chunksize (Optional[int]): The number of rows written per COPY or INSERT batch.
     """
 
-    def __init__(self, engine: Engine, df: pd.DataFrame, table_name: str) -> None:
+    def __init__(self, engine: Engine, df: pd.DataFrame, table_name: str, method: str = 'copy', chunksize: Optional[int] = 50000) -> None:
         """
         Initializes the DatabaseTableManager with a database engine, a DataFrame, and a table name.
 
@@ -20,15 +53,519 @@ class DatabaseTableManager:
             engine (Engine): The SQLAlchemy engine connected to the database.
             df (pd.DataFrame): The DataFrame to be inserted into the database.
             table_name (str): The name of the table in the database.
+            method (str, optional): ``'copy'`` or ``'insert'`` (default is ``'copy'``).
+            chunksize (Optional[int], optional): The number of rows per batch (default is 50000).
         """
         self.engine = engine
         self.df = df
         self.table_name = table_name
+        self.method = method
+        self.chunksize = chunksize
 
     def insert_df_into_database(self) -> None:
         """
         Inserts the DataFrame into the specified table in the database.
 
-        If the table already exists, the DataFrame will be appended to it.
+        If the table already exists, the DataFrame will be appended to it. On PostgreSQL the rows are
+        streamed with ``COPY FROM STDIN`` in chunks; other backends fall back to plain ``to_sql`` inserts.
         """
-        self.df.to_sql(self.table_name, self.engine, if_exists='append',index=False)
\ No newline at end of file
+        method = copy_from_stdin if self.method == 'copy' and self.engine.dialect.name == 'postgresql' else None
+        self.df.to_sql(self.table_name, self.engine, if_exists='append', index=False, method=method, chunksize=self.chunksize)
+
+
+def table_dependencies(metadata: MetaData, table_names: Iterable[str]) -> Dict[str, Set[str]]:
+    """
+    Derives, for each table, the other given tables it references through foreign keys.
+
+    Args:
+        metadata (MetaData): The metadata describing the tables.
+        table_names (Iterable[str]): The tables being loaded.
+
+    Returns:
+        Dict[str, Set[str]]: The tables each table must wait for.
+    """
+    names = set(table_names)
+    return {
+        name: {fk.column.table.name for fk in metadata.tables[name].foreign_keys if fk.column.table.name in names and fk.column.table.name != name}
+        for name in names
+    }
+
+
+def load_tables_concurrently(engine: Engine, metadata: MetaData, frames: Dict[str, pd.DataFrame], max_workers: int = 4, method: str = 'copy', chunksize: Optional[int] = 50000) -> None:
+    """
+    Loads DataFrames into their tables, running independent tables in parallel.
+
+    The foreign key graph in ``metadata`` decides the order: a table starts as soon as every
+    table it references has finished loading. Each worker checks out its own pooled connection.
+
+    Args:
+        engine (Engine): The SQLAlchemy engine connected to the database.
+        metadata (MetaData): The metadata describing the tables.
+        frames (Dict[str, pd.DataFrame]): The DataFrame to load into each table, keyed by table name.
+        max_workers (int, optional): The number of tables loaded at the same time (default is 4).
+        method (str, optional): The load method passed to DatabaseTableManager (default is ``'copy'``).
+        chunksize (Optional[int], optional): The number of rows per batch (default is 50000).
+
+    Raises:
+        ValueError: If the foreign keys between the given tables form a cycle.
+    """
+    pending = table_dependencies(metadata, frames)
+    loaded: Set[str] = set()
+    running: Dict[Future, str] = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while pending or running:
+            for name in [name for name, dependencies in pending.items() if dependencies <= loaded]:
+                manager = DatabaseTableManager(engine, frames[name], name, method, chunksize)
+                running[executor.submit(manager.insert_df_into_database)] = name
+                del pending[name]
+            if not running:
+                raise ValueError(f"Circular foreign keys between tables: {sorted(pending)}")
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                name = running.pop(future)
+                future.result()
+                loaded.add(name)
+
+
+def synchronize_id_sequences(engine: Engine, metadata: MetaData) -> None:
+    """
+    Moves the sequence behind every integer ``id`` column past the largest stored ID.
+
+    The CSV ingest writes explicit IDs, which leaves the sequences behind the data. Running this
+    afterwards lets new rows take their IDs from the sequence instead of ``SELECT max(id) + 1``.
+    A sequence is never moved backwards, so IDs it already handed out are not reused. It is a no-op
+    on databases other than PostgreSQL.
+
+    Args:
+        engine (Engine): The SQLAlchemy engine connected to the database.
+        metadata (MetaData): The metadata describing the tables to synchronize.
+    """
+    if engine.dialect.name != 'postgresql':
+        return
+    with engine.begin() as connection:
+        for table in metadata.sorted_tables:
+            id_column = table.c.get('id')
+            if id_column is None or not isinstance(id_column.type, Integer):
+                continue
+            connection.execute(text(
+                f"SELECT setval(pg_get_serial_sequence(:table_name, 'id'), "
+                f"GREATEST(MAX(id) + 1, nextval(pg_get_serial_sequence(:table_name, 'id'))), false) FROM \"{table.name}\""
+            ), {'table_name': table.name})
+
+
+def read_value_index(engine: Engine, metadata: MetaData, table_name: str, column: str) -> Dict[str, int]:
+    """
+    Reads the stored ID of every value of a dimension table.
+
+    Args:
+        engine (Engine): The SQLAlchemy engine connected to the database.
+        metadata (MetaData): The metadata describing the tables.
+        table_name (str): The name of the dimension table.
+        column (str): The value column of the dimension table.
+
+    Returns:
+        Dict[str, int]: The ID of every stored value.
+    """
+    table = metadata.tables[table_name]
+    with engine.connect() as connection:
+        rows = connection.execute(select(table.c[column], table.c.id).where(table.c[column].is_not(None))).all()
+    return dict(rows)
+
+
+def table_key_columns(table: Table, columns: Iterable[str]) -> Optional[List[str]]:
+    """
+    Returns the primary key columns of a table if a DataFrame provides all of them.
+
+    Link tables are loaded without their generated ``id``; their rows are identified by their content instead.
+
+    Args:
+        table (Table): The table being loaded.
+        columns (Iterable[str]): The columns of the DataFrame.
+
+    Returns:
+        Optional[List[str]]: The primary key columns, or None if the DataFrame does not provide them.
+    """
+    key_columns = [column.name for column in table.primary_key.columns]
+    return key_columns if set(key_columns) <= set(columns) else None
+
+
+def upsert_rows(connection: Connection, table: Table, df: pd.DataFrame, key_columns: Optional[List[str]]) -> None:
+    """
+    Inserts DataFrame rows into a table, updating the rows whose key already exists.
+
+    On PostgreSQL this is a single ``INSERT ... ON CONFLICT DO UPDATE``; other backends delete the
+    existing keys first. Without key columns the rows are plainly inserted.
+
+    Args:
+        connection (Connection): The connection of the running transaction.
+        table (Table): The table to write.
+        df (pd.DataFrame): The rows to write.
+        key_columns (Optional[List[str]]): The columns identifying a row.
+    """
+    if df.empty:
+        return
+    rows = df.astype(object).where(df.notna(), None).to_dict('records')
+    if not key_columns:
+        connection.execute(insert(table), rows)
+        return
+    if connection.dialect.name == 'postgresql':
+        statement = pg_insert(table)
+        update_columns = {column: statement.excluded[column] for column in df.columns if column not in key_columns}
+        if update_columns:
+            statement = statement.on_conflict_do_update(index_elements=key_columns, set_=update_columns)
+        else:
+            statement = statement.on_conflict_do_nothing(index_elements=key_columns)
+        connection.execute(statement, rows)
+        return
+    keys = list(df[key_columns].astype(object).itertuples(index=False, name=None))
+    connection.execute(delete(table).where(tuple_(*[table.c[column] for column in key_columns]).in_(keys)))
+    connection.execute(insert(table), rows)
+
+
+def link_owner_column(table: Table) -> str:
+    """
+    Returns the column of a link table that points to the title owning each link row.
+
+    Args:
+        table (Table): The link table.
+
+    Returns:
+        str: The first foreign key column of the table, e.g. ``movie_id``.
+    """
+    return next(column.name for column in table.columns if column.foreign_keys)
+
+
+def row_hashes(table: Table, df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Computes the ``ingest_row_hash`` rows of a DataFrame loaded into a table.
+
+    Rows of tables whose primary key is in the DataFrame are hashed one by one. Link rows have no
+    key of their own, so all the link rows of a title are hashed together under the title ID.
+
+    Args:
+        table (Table): The table the DataFrame is loaded into.
+        df (pd.DataFrame): The rows being loaded.
+
+    Returns:
+        pd.DataFrame: The table name, row key and row hash of every row or title.
+    """
+    key_columns = table_key_columns(table, df.columns)
+    if key_columns is None:
+        hashes_df = CsvDataHandler(df=df.drop_duplicates()).hash_groups(link_owner_column(table))
+    else:
+        hashes_df = CsvDataHandler(df=df).hash_rows(key_columns)
+    hashes_df.insert(0, 'table_name', table.name)
+    return hashes_df
+
+
+# The number of row keys sent in one IN (...) list
+ROW_KEY_BATCH_SIZE: int = 10000
+
+
+def read_row_hashes(connection: Connection, table_name: str, row_keys: Iterable[str]) -> Dict[str, str]:
+    """
+    Reads the stored hashes of the given rows of a table.
+
+    Only the requested keys are read, in batches of ``ROW_KEY_BATCH_SIZE``, so the cost follows the
+    size of the load rather than the size of the table.
+
+    Args:
+        connection (Connection): The connection of the running transaction.
+        table_name (str): The table the rows belong to.
+        row_keys (Iterable[str]): The row keys to look up.
+
+    Returns:
+        Dict[str, str]: The stored hash of every requested key that has one.
+    """
+    row_keys = list(dict.fromkeys(row_keys))
+    stored_hashes: Dict[str, str] = {}
+    for start in range(0, len(row_keys), ROW_KEY_BATCH_SIZE):
+        stored_hashes.update(connection.execute(
+            select(ingest_row_hash.c.row_key, ingest_row_hash.c.row_hash)
+            .where(ingest_row_hash.c.table_name == table_name, ingest_row_hash.c.row_key.in_(row_keys[start:start + ROW_KEY_BATCH_SIZE]))
+        ).all())
+    return stored_hashes
+
+
+def replace_changed_links(connection: Connection, table: Table, df: pd.DataFrame, hashes_df: pd.DataFrame,
+                          owner_ids: Optional[Iterable[str]] = None) -> int:
+    """
+    Replaces the link rows of every title whose set of links changed since the last load.
+
+    Titles listed in ``owner_ids`` but absent from the DataFrame have no links anymore: their old link
+    rows and stored hashes are deleted.
+
+    Args:
+        connection (Connection): The connection of the running transaction.
+        table (Table): The link table.
+        df (pd.DataFrame): The link rows being loaded.
+        hashes_df (pd.DataFrame): The hash of the link rows of every title, from ``row_hashes``.
+        owner_ids (Optional[Iterable[str]], optional): Every title whose complete set of links is in the
+            DataFrame (default is the titles present in the DataFrame).
+
+    Returns:
+        int: The number of link rows written.
+    """
+    owner_column = link_owner_column(table)
+    loaded_keys = set(hashes_df['row_key'])
+    stored_hashes = read_row_hashes(connection, table.name, loaded_keys.union(map(str, owner_ids if owner_ids is not None else ())))
+    changed_hashes_df = hashes_df[hashes_df['row_key'].map(stored_hashes) != hashes_df['row_hash']]
+    emptied_keys = sorted(set(stored_hashes) - loaded_keys)
+    changed_keys = changed_hashes_df['row_key'].tolist() + emptied_keys
+    if not changed_keys:
+        return 0
+    df = df.drop_duplicates()
+    changed_df = df[df[owner_column].astype('string').fillna('').astype(str).isin(changed_keys).to_numpy()]
+    for start in range(0, len(changed_keys), ROW_KEY_BATCH_SIZE):
+        batch = changed_keys[start:start + ROW_KEY_BATCH_SIZE]
+        connection.execute(delete(table).where(table.c[owner_column].in_(batch)))
+        connection.execute(delete(ingest_row_hash).where(ingest_row_hash.c.table_name == table.name, ingest_row_hash.c.row_key.in_(batch)))
+    upsert_rows(connection, table, changed_df, None)
+    upsert_rows(connection, ingest_row_hash, changed_hashes_df, ['table_name', 'row_key'])
+    return len(changed_df)
+
+
+def record_row_hashes(engine: Engine, metadata: MetaData, frames: Dict[str, pd.DataFrame]) -> None:
+    """
+    Stores the hash of every row of a full load, so a later delta load can skip unchanged rows.
+
+    Args:
+        engine (Engine): The SQLAlchemy engine connected to the database.
+        metadata (MetaData): The metadata describing the tables.
+        frames (Dict[str, pd.DataFrame]): The DataFrame loaded into each table, keyed by table name.
+    """
+    hashes_df = pd.concat([row_hashes(metadata.tables[name], df) for name, df in frames.items()], ignore_index=True)
+    hashes_df = hashes_df.drop_duplicates(['table_name', 'row_key'], keep='last')
+    with engine.begin() as connection:
+        upsert_rows(connection, ingest_row_hash, hashes_df, ['table_name', 'row_key'])
+
+
+def load_tables_delta(engine: Engine, metadata: MetaData, frames: Dict[str, pd.DataFrame],
+                      link_owners: Optional[Dict[str, Iterable[str]]] = None) -> Dict[str, int]:
+    """
+    Upserts only the rows that are new or changed since the last load.
+
+    Every row is hashed and compared against the hashes stored in ``ingest_row_hash``. Rows of tables
+    whose primary key is in the DataFrame are matched by key and updated in place when their hash
+    differs. Link rows are compared per title: when the links of a title changed, its old link rows
+    are deleted and the new set is inserted. Titles listed in ``link_owners`` without any link row in
+    the DataFrame lose their old links. Only the stored hashes of the loaded keys are read. Each table
+    and its hashes are written in one transaction, in foreign key order, so a failed run can simply be
+    repeated. The link rows of a title must all be in the same call.
+
+    Args:
+        engine (Engine): The SQLAlchemy engine connected to the database.
+        metadata (MetaData): The metadata describing the tables.
+        frames (Dict[str, pd.DataFrame]): The DataFrame to load into each table, keyed by table name.
+        link_owners (Optional[Dict[str, Iterable[str]]], optional): For link tables, every title whose
+            complete set of links is in the DataFrame (default is the titles present in the DataFrame).
+
+    Returns:
+        Dict[str, int]: The number of rows written to each table.
+    """
+    written: Dict[str, int] = {}
+    for table in metadata.sorted_tables:
+        if table.name not in frames:
+            continue
+        df = frames[table.name]
+        key_columns = table_key_columns(table, df.columns)
+        hashes_df = row_hashes(table, df)
+        with engine.begin() as connection:
+            if key_columns is None:
+                written[table.name] = replace_changed_links(connection, table, df, hashes_df, (link_owners or {}).get(table.name))
+                continue
+            is_last = ~hashes_df['row_key'].duplicated(keep='last')
+            df, hashes_df = df[is_last.to_numpy()], hashes_df[is_last]
+            stored_hashes = read_row_hashes(connection, table.name, hashes_df['row_key'])
+            is_changed = (hashes_df['row_key'].map(stored_hashes) != hashes_df['row_hash']).to_numpy()
+            upsert_rows(connection, table, df[is_changed], key_columns)
+            upsert_rows(connection, ingest_row_hash, hashes_df[is_changed], ['table_name', 'row_key'])
+        written[table.name] = int(is_changed.sum())
+    return written
+
+
+def index_definitions(table: Table) -> List[Tuple[str, List[str], bool, bool, str]]:
+    """
+    Lists the indexes and unique constraints declared on a table.
+
+    Args:
+        table (Table): The table.
+
+    Returns:
+        List[Tuple[str, List[str], bool, bool, str]]: The name, columns, uniqueness, whether it is a constraint,
+        and the PostgreSQL access method and column list, of each. Ordered columns such as
+        ``imdb_score DESC NULLS LAST`` are listed with their order.
+    """
+    definitions = []
+    for index in table.indexes:
+        columns = [column.name for column in index.columns]
+        options = index.dialect_options['postgresql']
+        operator_classes = options['ops'] or {}
+        column_list = ', '.join(
+            f'"{expression.name}" {operator_classes.get(expression.name, "")}'.rstrip() if isinstance(expression, Column)
+            else str(expression.compile(dialect=postgresql.dialect(), compile_kwargs={'include_table': False}))
+            for expression in index.expressions
+        )
+        using = f'USING {options["using"]} ' if options['using'] else ''
+        definitions.append((index.name, columns, bool(index.unique), False, f'{using}({column_list})'))
+    for constraint in table.constraints:
+        if isinstance(constraint, UniqueConstraint):
+            columns = [column.name for column in constraint.columns]
+            definitions.append((constraint.name, columns, True, True, '(' + ', '.join(f'"{column}"' for column in columns) + ')'))
+    return definitions
+
+
+# Indexes replaced by the ones declared on the models, dropped once the new ones are built
+SUPERSEDED_INDEXES: List[str] = [
+    'ix_movie_imdb_score_id', 'ix_movie_release_year_imdb_score',
+    'ix_show_imdb_score_id', 'ix_show_release_year_imdb_score',
+]
+
+
+def find_duplicate_keys(connection: Connection, table_name: str, columns: List[str], limit: int = 5) -> Tuple[int, List[tuple]]:
+    """
+    Finds the keys stored more than once in columns that are about to get a unique index.
+
+    Rows with a NULL in any of the columns are ignored, as a unique index allows them.
+
+    Args:
+        connection (Connection): The connection to the database.
+        table_name (str): The table to check.
+        columns (List[str]): The columns of the unique index.
+        limit (int, optional): The maximum number of example keys returned (default is 5).
+
+    Returns:
+        Tuple[int, List[tuple]]: The number of duplicated keys and up to ``limit`` of them.
+    """
+    column_list = ', '.join(f'"{column}"' for column in columns)
+    not_null = ' AND '.join(f'"{column}" IS NOT NULL' for column in columns)
+    rows = connection.execute(text(
+        f'SELECT {column_list}, COUNT(*) OVER () FROM "{table_name}" WHERE {not_null} '
+        f'GROUP BY {column_list} HAVING COUNT(*) > 1 ORDER BY {column_list} LIMIT :limit'
+    ), {'limit': limit}).all()
+    return (rows[0][-1] if rows else 0), [tuple(row[:-1]) for row in rows]
+
+
+def create_indexes_concurrently(engine: Engine, metadata: MetaData, remove_duplicates: bool = False) -> List[str]:
+    """
+    Builds the indexes and unique constraints declared on the models in an existing PostgreSQL database.
+
+    Indexes are built with ``CREATE INDEX CONCURRENTLY`` so reads and writes continue during the
+    build, and unique indexes are then attached as constraints. Indexes left invalid by an
+    interrupted build are dropped and rebuilt, and existing ones are skipped, so the migration can be
+    re-run. A build that fails drops the invalid index it leaves behind before the error is raised.
+
+    Before anything is built, every missing unique index is checked for duplicate keys. Nothing is
+    deleted unless ``remove_duplicates`` is set, and then only from tables that no other table
+    references, keeping the row with the lowest ``id``; the removals are logged. Any other duplicate
+    aborts the migration. The ``pg_trgm`` extension is created for the trigram indexes, and the
+    ``SUPERSEDED_INDEXES`` are dropped at the end.
+
+    Args:
+        engine (Engine): The SQLAlchemy engine connected to the database.
+        metadata (MetaData): The metadata describing the tables.
+        remove_duplicates (bool, optional): Whether to delete duplicate link rows (default is False).
+
+    Returns:
+        List[str]: The names of the indexes that were built.
+
+    Raises:
+        ValueError: If the database is not PostgreSQL, or if a unique index would cover duplicate keys.
+    """
+    if engine.dialect.name != 'postgresql':
+        raise ValueError("Concurrent index builds require PostgreSQL")
+    referenced = {fk.column.table.name for table in metadata.tables.values() for fk in table.foreign_keys}
+    built: List[str] = []
+    with engine.connect().execution_options(isolation_level='AUTOCOMMIT') as connection:
+        connection.execute(text('CREATE EXTENSION IF NOT EXISTS pg_trgm'))
+        pending = []
+        for table in metadata.sorted_tables:
+            for definition in index_definitions(table):
+                is_valid = connection.execute(text(
+                    "SELECT i.indisvalid FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid WHERE c.relname = :name"
+                ), {'name': definition[0]}).scalar()
+                pending.append((table, definition, is_valid))
+
+        duplicates: List[str] = []
+        for table, (name, columns, unique, _, _), is_valid in pending:
+            if not unique or is_valid is True:
+                continue
+            count, examples = find_duplicate_keys(connection, table.name, columns)
+            if count == 0:
+                continue
+            if remove_duplicates and table.name not in referenced and 'id' in table.c:
+                matches = ' AND '.join(f'a."{column}" = b."{column}"' for column in columns)
+                deleted = connection.execute(text(f'DELETE FROM "{table.name}" a USING "{table.name}" b WHERE a.id > b.id AND {matches}')).rowcount
+                logger.warning("Removed %d duplicate rows of %s (%s) before building %s", deleted, table.name, ', '.join(columns), name)
+            else:
+                duplicates.append(f"{table.name} ({', '.join(columns)}): {count} duplicated keys, e.g. {examples}")
+        if duplicates:
+            raise ValueError("Cannot build unique indexes over duplicate keys: " + '; '.join(duplicates))
+
+        analyzed_tables: List[str] = []
+        for table, (name, columns, unique, is_constraint, column_list), is_valid in pending:
+            if is_valid is not True:
+                if is_valid is False:
+                    connection.execute(text(f'DROP INDEX CONCURRENTLY IF EXISTS "{name}"'))
+                try:
+                    connection.execute(text(
+                        f'CREATE {"UNIQUE " if unique else ""}INDEX CONCURRENTLY IF NOT EXISTS "{name}" ON "{table.name}" {column_list}'
+                    ))
+                except DBAPIError:
+                    connection.execute(text(f'DROP INDEX CONCURRENTLY IF EXISTS "{name}"'))
+                    logger.error("Building %s failed; dropped the invalid index it left behind", name)
+                    raise
+                built.append(name)
+                if table.name not in analyzed_tables:
+                    analyzed_tables.append(table.name)
+            if is_constraint and connection.execute(text("SELECT 1 FROM pg_constraint WHERE conname = :name"), {'name': name}).scalar() is None:
+                connection.execute(text(f'ALTER TABLE "{table.name}" ADD CONSTRAINT "{name}" UNIQUE USING INDEX "{name}"'))
+        for table_name in analyzed_tables:
+            connection.execute(text(f'ANALYZE "{table_name}"'))
+        for name in SUPERSEDED_INDEXES:
+            connection.execute(text(f'DROP INDEX CONCURRENTLY IF EXISTS "{name}"'))
+    return built
+
+
+# The USING expression converting each text title column to its typed column
+TITLE_COLUMN_CONVERSIONS: Dict[str, Tuple[str, str]] = {
+    'imdb_score'                    : ('double precision', "NULLIF(imdb_score, '')::double precision"),
+    'release_year'                  : ('integer', "NULLIF(release_year, '')::numeric::integer"),
+    'is_movie_best_in_release_year' : ('boolean', "is_movie_best_in_release_year = 'Y'"),
+}
+
+
+def convert_title_column_types(engine: Engine, table_names: Iterable[str] = ('movie', 'show')) -> List[str]:
+    """
+    Converts the score, year and best-in-year columns of title tables created as text to their typed columns.
+
+    Each table is rewritten once, in its own transaction, and only columns that are still text are
+    converted, so the migration can be re-run. The rewrite locks the table while it runs.
+
+    Args:
+        engine (Engine): The SQLAlchemy engine connected to the database.
+        table_names (Iterable[str], optional): The title tables (default is movie and show).
+
+    Returns:
+        List[str]: The converted columns, as ``table.column``.
+
+    Raises:
+        ValueError: If the database is not PostgreSQL.
+    """
+    if engine.dialect.name != 'postgresql':
+        raise ValueError("Column type conversion requires PostgreSQL")
+    converted: List[str] = []
+    for table_name in table_names:
+        with engine.begin() as connection:
+            text_columns = set(connection.execute(text(
+                "SELECT column_name FROM information_schema.columns "
+                "WHERE table_name = :table_name AND data_type IN ('text', 'character varying')"
+            ), {'table_name': table_name}).scalars())
+            alterations = [
+                f'ALTER COLUMN "{column}" TYPE {column_type} USING {expression}'
+                for column, (column_type, expression) in TITLE_COLUMN_CONVERSIONS.items() if column in text_columns
+            ]
+            if alterations:
+                connection.execute(text(f'ALTER TABLE "{table_name}" {", ".join(alterations)}'))
+                converted.extend(f'{table_name}.{column}' for column in TITLE_COLUMN_CONVERSIONS if column in text_columns)
+    return converted
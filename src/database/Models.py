@@ -1,18 +1,23 @@
 from __future__ import annotations
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy import Column, Table, ForeignKey, Integer
+from sqlalchemy import DDL, Column, Table, ForeignKey, Index, Integer, String, UniqueConstraint, event
 from typing import Optional, List
 
 Base = declarative_base()
 
-# Association tables for many-to-many relationships
+# The trigram indexes on titles and actor names need pg_trgm
+event.listen(Base.metadata, 'before_create', DDL('CREATE EXTENSION IF NOT EXISTS pg_trgm').execute_if(dialect='postgresql'))
+
+# Association tables for many-to-many relationships. The unique pair leads with the title ID,
+# so it also serves title lookups; the dimension ID is indexed for the reverse direction.
 movie_genres = Table(
     "movie_genre_link",
     Base.metadata,
     Column('id', Integer, primary_key=True, autoincrement=True),
     Column("movie_id", ForeignKey("movie.id")),
-    Column("genre_id", ForeignKey("movie_genre.id")),
+    Column("genre_id", ForeignKey("movie_genre.id"), index=True),
+    UniqueConstraint("movie_id", "genre_id", name='uq_movie_genre_link_pair'),
 )
 
 movie_production_country = Table(
@@ -20,7 +25,8 @@ movie_production_country = Table(
     Base.metadata,
     Column('id', Integer, primary_key=True, autoincrement=True),
     Column("movie_id", ForeignKey("movie.id")),
-    Column("production_country_id", ForeignKey("movie_production_country.id")),    
+    Column("production_country_id", ForeignKey("movie_production_country.id"), index=True),    
+    UniqueConstraint("movie_id", "production_country_id", name='uq_movie_production_country_link_pair'),
 )
 
 show_genres = Table(
@@ -28,7 +34,8 @@ show_genres = Table(
     Base.metadata,
     Column('id', Integer, primary_key=True, autoincrement=True),
     Column("show_id", ForeignKey("show.id")),
-    Column("genre_id", ForeignKey("show_genre.id")),
+    Column("genre_id", ForeignKey("show_genre.id"), index=True),
+    UniqueConstraint("show_id", "genre_id", name='uq_show_genre_link_pair'),
 )
 
 show_production_country = Table(
@@ -36,7 +43,17 @@ show_production_country = Table(
     Base.metadata,
     Column('id', Integer, primary_key=True, autoincrement=True),
     Column("show_id", ForeignKey("show.id")),
-    Column("production_country_id", ForeignKey("show_production_country.id")),    
+    Column("production_country_id", ForeignKey("show_production_country.id"), index=True),    
+    UniqueConstraint("show_id", "production_country_id", name='uq_show_production_country_link_pair'),
+)
+
+# Hash of every ingested row, used by the delta ingest to skip unchanged rows
+ingest_row_hash = Table(
+    'ingest_row_hash',
+    Base.metadata,
+    Column('table_name', String, primary_key=True),
+    Column('row_key', String, primary_key=True),
+    Column('row_hash', String, nullable=False),
 )
 
 
@@ -58,15 +75,15 @@ class Movie(Base):
         The runtime of the movie.
     imdb_id : Mapped[Optional[str]]
         The IMDb ID of the movie.
-    imdb_score : Mapped[Optional[str]]
+    imdb_score : Mapped[Optional[float]]
         The IMDb score of the movie.
     imdb_votes : Mapped[Optional[int]]
         The number of IMDb votes for the movie.
-    release_year : Mapped[Optional[str]]
+    release_year : Mapped[Optional[int]]
         The release year of the movie.
     duration : Mapped[Optional[int]]
         The duration of the movie.
-    is_movie_best_in_release_year : Mapped[str]
+    is_movie_best_in_release_year : Mapped[bool]
         Indicates if the movie is the best in its release year.
     main_genre : Mapped[Optional[str]]
         The main genre of the movie.
@@ -80,27 +97,35 @@ class Movie(Base):
         The actors associated with the movie.
     """
     __tablename__ = 'movie'
+    __table_args__ = (
+        Index('ix_movie_title_trgm', 'title', postgresql_using='gin', postgresql_ops={'title': 'gin_trgm_ops'}),
+    )
     id: Mapped[str] = mapped_column(primary_key=True)
     title: Mapped[Optional[str]] = mapped_column(nullable=True)
     type: Mapped[str]
     age_certification: Mapped[Optional[str]] = mapped_column(nullable=True)
     runtime: Mapped[int]
     imdb_id: Mapped[Optional[str]] = mapped_column(nullable=True)
-    imdb_score: Mapped[Optional[str]] = mapped_column(nullable=True)
+    imdb_score: Mapped[Optional[float]] = mapped_column(nullable=True)
     imdb_votes: Mapped[Optional[int]] = mapped_column(nullable=True)
-    release_year: Mapped[Optional[str]] = mapped_column(nullable=True)
+    release_year: Mapped[Optional[int]] = mapped_column(nullable=True)
     duration: Mapped[Optional[int]] = mapped_column(nullable=True)
-    is_movie_best_in_release_year: Mapped[str]
+    is_movie_best_in_release_year: Mapped[bool]
     main_genre: Mapped[Optional[str]] = mapped_column(nullable=True)
     main_production: Mapped[Optional[str]] = mapped_column(nullable=True)
 
     movie_genres: Mapped[List[MovieGenres]] = relationship(secondary=movie_genres, back_populates='movie')
     movie_production_countries: Mapped[List[MovieProductionCountry]] = relationship(secondary=movie_production_country, back_populates='movie')
-    movie_actor: Mapped[List[MovieActor]] = relationship()
+    movie_actor: Mapped[List[MovieActor]] = relationship(back_populates='movie')
 
     def __repr__(self):
         return f'{self.id}, {self.main_genre}, {self.main_production}'
 
+# The orders of descending score and year searches. PostgreSQL sorts NULLs first in descending
+# indexes, so the null order is spelled out; other databases do not accept it and skip these indexes.
+Index('ix_movie_imdb_score_desc_id', Movie.imdb_score.desc().nulls_last(), Movie.id.desc()).ddl_if(dialect='postgresql')
+Index('ix_movie_release_year_desc_id', Movie.release_year.desc().nulls_last(), Movie.id.desc()).ddl_if(dialect='postgresql')
+
 
 class MovieActor(Base):
     """
@@ -116,13 +141,23 @@ class MovieActor(Base):
         The ID of the actor.
     role : Mapped[int]
         The ID of the role.
+    movie : Mapped[Movie]
+        The movie the actor appears in.
+    actor : Mapped[Actor]
+        The actor appearing in the movie.
+    actor_role : Mapped[Role]
+        The role the actor plays in the movie.
     """
     __tablename__ = 'movie_actor'
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
-    movie_id: Mapped[str] = mapped_column(ForeignKey('movie.id'))
-    name: Mapped[int] = mapped_column(ForeignKey('actor.id'))
+    movie_id: Mapped[str] = mapped_column(ForeignKey('movie.id'), index=True)
+    name: Mapped[int] = mapped_column(ForeignKey('actor.id'), index=True)
     role: Mapped[int] = mapped_column(ForeignKey('role.id'))
 
+    movie: Mapped[Movie] = relationship(back_populates='movie_actor')
+    actor: Mapped[Actor] = relationship(back_populates='movie_actor')
+    actor_role: Mapped[Role] = relationship(back_populates='movie_actor')
+
 
 class ShowActor(Base):
     """
@@ -138,13 +173,23 @@ class ShowActor(Base):
         The ID of the actor.
     role : Mapped[int]
         The ID of the role.
+    show : Mapped[Show]
+        The show the actor appears in.
+    actor : Mapped[Actor]
+        The actor appearing in the show.
+    actor_role : Mapped[Role]
+        The role the actor plays in the show.
     """
     __tablename__ = 'show_actor'
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
-    show_id: Mapped[str] = mapped_column(ForeignKey('show.id'))
-    name: Mapped[int] = mapped_column(ForeignKey('actor.id'))
+    show_id: Mapped[str] = mapped_column(ForeignKey('show.id'), index=True)
+    name: Mapped[int] = mapped_column(ForeignKey('actor.id'), index=True)
     role: Mapped[int] = mapped_column(ForeignKey('role.id'))
 
+    show: Mapped[Show] = relationship(back_populates='show_actor')
+    actor: Mapped[Actor] = relationship(back_populates='show_actor')
+    actor_role: Mapped[Role] = relationship(back_populates='show_actor')
+
 
 class Show(Base):
     """
@@ -168,15 +213,15 @@ class Show(Base):
         The number of seasons of the show (nullable).
     imdb_id : Mapped[Optional[str]]
         The IMDb ID of the show.
-    imdb_score : Mapped[Optional[str]]
+    imdb_score : Mapped[Optional[float]]
         The IMDb score of the show.
     imdb_votes : Mapped[Optional[int]]
         The number of IMDb votes for the show.
-    release_year : Mapped[Optional[str]]
+    release_year : Mapped[Optional[int]]
         The release year of the show.
     duration : Mapped[Optional[int]]
         The duration of the show.
-    is_movie_best_in_release_year : Mapped[str]
+    is_movie_best_in_release_year : Mapped[bool]
         Indicates if the show is the best in its release year.
     main_genre : Mapped[Optional[str]]
         The main genre of the show.
@@ -190,6 +235,9 @@ class Show(Base):
         The actors associated with the show.
     """
     __tablename__ = 'show'
+    __table_args__ = (
+        Index('ix_show_title_trgm', 'title', postgresql_using='gin', postgresql_ops={'title': 'gin_trgm_ops'}),
+    )
     id: Mapped[str] = mapped_column(primary_key=True)
     title: Mapped[str]
     type: Mapped[str]
@@ -198,17 +246,20 @@ class Show(Base):
     seasons: Mapped[int]
     number_of_seasons: Mapped[int] = mapped_column(nullable=True)
     imdb_id: Mapped[Optional[str]] = mapped_column(nullable=True)
-    imdb_score: Mapped[Optional[str]] = mapped_column(nullable=True)
+    imdb_score: Mapped[Optional[float]] = mapped_column(nullable=True)
     imdb_votes: Mapped[Optional[int]] = mapped_column(nullable=True)
-    release_year: Mapped[Optional[str]] = mapped_column(nullable=True)
+    release_year: Mapped[Optional[int]] = mapped_column(nullable=True)
     duration: Mapped[Optional[int]] = mapped_column(nullable=True)
-    is_movie_best_in_release_year: Mapped[str]
+    is_movie_best_in_release_year: Mapped[bool]
     main_genre: Mapped[Optional[str]] = mapped_column(nullable=True)
     main_production: Mapped[Optional[str]] = mapped_column(nullable=True)
 
     show_genres: Mapped[List[ShowGenres]] = relationship(secondary=show_genres, back_populates='show')
     show_production_countries: Mapped[List[ShowProductionCountry]] = relationship(secondary=show_production_country, back_populates='show')
-    show_actor: Mapped[List[ShowActor]] = relationship()
+    show_actor: Mapped[List[ShowActor]] = relationship(back_populates='show')
+
+Index('ix_show_imdb_score_desc_id', Show.imdb_score.desc().nulls_last(), Show.id.desc()).ddl_if(dialect='postgresql')
+Index('ix_show_release_year_desc_id', Show.release_year.desc().nulls_last(), Show.id.desc()).ddl_if(dialect='postgresql')
 
 
 class MovieGenres(Base):
@@ -225,7 +276,8 @@ class MovieGenres(Base):
         The movies associated with this genre.
     """
     __tablename__ = 'movie_genre'
-    id: Mapped[int] = mapped_column(primary_key=True)
+    __table_args__ = (UniqueConstraint('genre', name='uq_movie_genre_genre'),)
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     genre: Mapped[str]
     movie: Mapped[List[Movie]] = relationship(secondary=movie_genres, back_populates='movie_genres')
 
@@ -244,7 +296,8 @@ class MovieProductionCountry(Base):
         The movies associated with this production country.
     """
     __tablename__ = 'movie_production_country'
-    id: Mapped[int] = mapped_column(primary_key=True)
+    __table_args__ = (UniqueConstraint('production_country', name='uq_movie_production_country_production_country'),)
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     production_country: Mapped[str]
     movie: Mapped[List[Movie]] = relationship(secondary=movie_production_country, back_populates='movie_production_countries')
 
@@ -263,7 +316,8 @@ class ShowGenres(Base):
         The shows associated with this genre.
     """
     __tablename__ = 'show_genre'
-    id: Mapped[int] = mapped_column(primary_key=True)
+    __table_args__ = (UniqueConstraint('genre', name='uq_show_genre_genre'),)
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     genre: Mapped[str]
     show: Mapped[List[Show]] = relationship(secondary=show_genres, back_populates='show_genres')
 
@@ -282,7 +336,8 @@ class ShowProductionCountry(Base):
         The shows associated with this production country.
     """
     __tablename__ = 'show_production_country'
-    id: Mapped[int] = mapped_column(primary_key=True)
+    __table_args__ = (UniqueConstraint('production_country', name='uq_show_production_country_production_country'),)
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     production_country: Mapped[str]
     show: Mapped[List[Show]] = relationship(secondary=show_production_country, back_populates='show_production_countries')
 
@@ -319,10 +374,14 @@ class Actor(Base):
         The show actor associations.
     """
     __tablename__ = 'actor'
-    id: Mapped[int] = mapped_column(primary_key=True)
+    __table_args__ = (
+        UniqueConstraint('name', name='uq_actor_name'),
+        Index('ix_actor_name_trgm', 'name', postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'}),
+    )
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     name: Mapped[Optional[str]] = mapped_column(nullable=True)
-    movie_actor: Mapped[List[MovieActor]] = relationship()  
-    show_actor: Mapped[List[ShowActor]] = relationship()  
+    movie_actor: Mapped[List[MovieActor]] = relationship(back_populates='actor')
+    show_actor: Mapped[List[ShowActor]] = relationship(back_populates='actor')
 
 
 class Role(Base):
@@ -341,7 +400,8 @@ class Role(Base):
         The show actor associations.
     """
     __tablename__ = 'role'
+    __table_args__ = (UniqueConstraint('role', name='uq_role_role'),)
     id: Mapped[int] = mapped_column(primary_key=True)
     role: Mapped[str]
-    movie_actor: Mapped[List[MovieActor]] = relationship()
-    show_actor: Mapped[List[ShowActor]] = relationship()    
+    movie_actor: Mapped[List[MovieActor]] = relationship(back_populates='actor_role')
+    show_actor: Mapped[List[ShowActor]] = relationship(back_populates='actor_role')
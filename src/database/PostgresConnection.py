@@ -1,37 +1,94 @@
 from dotenv import load_dotenv
 import os
+import threading
 from sqlalchemy import create_engine
 from sqlalchemy.engine import Engine
-from sqlalchemy.pool import StaticPool
-from typing import Optional
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from typing import Optional, Dict, Any
 
 load_dotenv()
 
+# Process-wide registry of engines keyed by database URL, so every caller shares one connection pool
+_engines: Dict[str, Engine] = {}
+_async_engines: Dict[str, AsyncEngine] = {}
+_engines_lock = threading.Lock()
+
 class PostgresConnection:
     """
     A class to manage PostgreSQL database connection using SQLAlchemy.
 
     Attributes:
         url (str): The database URL constructed from environment variables.
+        async_url (str): The database URL for the asyncpg driver.
         engine (Optional[Engine]): The SQLAlchemy engine connected to the database.
+        async_engine (Optional[AsyncEngine]): The asyncio SQLAlchemy engine connected to the database.
+        pool_options (Dict[str, Any]): The connection pool settings passed to the engine.
     """
 
     def __init__(self) -> None:
         """
-        Initializes the PostgresConnection with the database URL.
+        Initializes the PostgresConnection with the database URL and pool settings.
 
         The database URL is constructed using environment variables: DB_USER, DB_PASSWORD, DB_HOST, and DB_DATABASE.
+        The pool is configured with DB_POOL_SIZE, DB_MAX_OVERFLOW, DB_POOL_TIMEOUT, DB_POOL_RECYCLE and DB_POOL_PRE_PING.
         """
         self.url: str = f"postgresql://{os.getenv('DB_USER')}:{os.getenv('DB_PASSWORD')}@{os.getenv('DB_HOST')}/{os.getenv('DB_DATABASE')}"
+        self.async_url: str = self.url.replace('postgresql://', 'postgresql+asyncpg://', 1)
         self.engine: Optional[Engine] = None
+        self.async_engine: Optional[AsyncEngine] = None
+        self.pool_options: Dict[str, Any] = {
+            'pool_size': int(os.getenv('DB_POOL_SIZE', '10')),
+            'max_overflow': int(os.getenv('DB_MAX_OVERFLOW', '20')),
+            'pool_timeout': float(os.getenv('DB_POOL_TIMEOUT', '30')),
+            'pool_recycle': int(os.getenv('DB_POOL_RECYCLE', '1800')),
+            'pool_pre_ping': os.getenv('DB_POOL_PRE_PING', 'true').lower() in ('1', 'true', 'yes'),
+        }
 
     def get_engine(self) -> Engine:
         """
-        Creates and returns a SQLAlchemy engine for the PostgreSQL database.
+        Returns the shared SQLAlchemy engine for the PostgreSQL database, creating it on first use.
 
         Returns:
             Engine: The SQLAlchemy engine connected to the PostgreSQL database.
         """
-        self.engine = create_engine(self.url, poolclass=StaticPool)
+        with _engines_lock:
+            if self.url not in _engines:
+                _engines[self.url] = create_engine(self.url, **self.pool_options)
+            self.engine = _engines[self.url]
         return self.engine
 
+    def get_async_engine(self) -> AsyncEngine:
+        """
+        Returns the shared asyncio SQLAlchemy engine for the PostgreSQL database, creating it on first use.
+
+        The engine uses the asyncpg driver and the same pool settings as the synchronous engine.
+
+        Returns:
+            AsyncEngine: The asyncio SQLAlchemy engine connected to the PostgreSQL database.
+        """
+        with _engines_lock:
+            if self.async_url not in _async_engines:
+                _async_engines[self.async_url] = create_async_engine(self.async_url, **self.pool_options)
+            self.async_engine = _async_engines[self.async_url]
+        return self.async_engine
+
+    @staticmethod
+    def dispose_engines() -> None:
+        """
+        Disposes every registered synchronous engine and closes their pooled connections.
+        """
+        with _engines_lock:
+            for engine in _engines.values():
+                engine.dispose()
+            _engines.clear()
+
+    @staticmethod
+    async def dispose_async_engines() -> None:
+        """
+        Disposes every registered asyncio engine and closes their pooled connections.
+        """
+        with _engines_lock:
+            async_engines = list(_async_engines.values())
+            _async_engines.clear()
+        for async_engine in async_engines:
+            await async_engine.dispose()
@@ -0,0 +1,162 @@
+import pytest
+
+sqlalchemy = pytest.importorskip('sqlalchemy')
+
+from sqlalchemy import event, insert, select
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+from app.common.CrudOperations import CrudOperations
+from app.common.cache import TTLCache
+from app.common.dimension import DimensionCache
+from app.movie_endpoint.model import MovieModel
+from src.database.Models import Actor, Base, Movie, MovieActor, MovieGenres, MovieProductionCountry, Role, movie_genres, movie_production_country
+
+
+@pytest.fixture
+def engine():
+    engine = sqlalchemy.create_engine('sqlite://', poolclass=StaticPool, connect_args={'check_same_thread': False})
+    Base.metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.execute(insert(Role), [{'id': 1, 'role': 'ACTOR'}, {'id': 2, 'role': 'DIRECTOR'}])
+    yield engine
+    engine.dispose()
+
+
+def movie_row(id, **columns):
+    return {'id': id, 'title': f'Title {id}', 'type': 'MOVIE', 'runtime': 90, 'imdb_score': None, 'is_movie_best_in_release_year': False, **columns}
+
+
+def get_movie(crud, id):
+    return crud.get_item_by_id(Movie, id, Movie.movie_actor, Movie.movie_genres, Movie.movie_production_countries)
+
+
+def test_get_item_by_id_loads_the_detail_in_one_statement(engine):
+    with engine.begin() as connection:
+        connection.execute(insert(Movie), [movie_row('tm1', imdb_score=7.5)])
+        connection.execute(insert(Actor), [{'id': 1, 'name': 'Ann'}, {'id': 2, 'name': 'Bob'}])
+        connection.execute(insert(MovieActor), [{'movie_id': 'tm1', 'name': 1, 'role': 1}, {'movie_id': 'tm1', 'name': 2, 'role': 2}])
+        connection.execute(insert(MovieGenres), [{'id': 1, 'genre': 'drama'}, {'id': 2, 'genre': 'comedy'}])
+        connection.execute(movie_genres.insert(), [{'movie_id': 'tm1', 'genre_id': 1}, {'movie_id': 'tm1', 'genre_id': 2}])
+        connection.execute(insert(MovieProductionCountry), [{'id': 1, 'production_country': 'US'}])
+        connection.execute(movie_production_country.insert(), [{'movie_id': 'tm1', 'production_country_id': 1}])
+    statements = []
+    event.listen(engine, 'before_cursor_execute', lambda *args: statements.append(args[2]))
+
+    movie = get_movie(CrudOperations(engine), 'tm1')
+
+    assert len(statements) == 1
+    assert movie['imdb_score'] == 7.5
+    assert movie['actors'] == [{'id': 1, 'name': 'Ann', 'role': 'ACTOR'}, {'id': 2, 'name': 'Bob', 'role': 'DIRECTOR'}]
+    assert movie['genres'] == [{'id': 1, 'genre': 'drama'}, {'id': 2, 'genre': 'comedy'}]
+    assert movie['production_countries'] == [{'id': 1, 'production_country': 'US'}]
+
+
+def test_get_item_by_id_returns_items_without_related_rows_and_none_for_unknown_ids(engine):
+    with engine.begin() as connection:
+        connection.execute(insert(Movie), [movie_row('tm1')])
+    crud = CrudOperations(engine)
+
+    movie = get_movie(crud, 'tm1')
+
+    assert movie['title'] == 'Title tm1'
+    assert (movie['actors'], movie['genres'], movie['production_countries']) == ([], [], [])
+    assert get_movie(crud, 'tm2') is None
+
+
+def test_search_items_sorts_descending_with_missing_values_last(engine):
+    with engine.begin() as connection:
+        connection.execute(insert(Movie), [movie_row('tm1', imdb_score=6.0), movie_row('tm2'), movie_row('tm3', imdb_score=8.0),
+                                           movie_row('tm4', imdb_score=8.0)])
+    crud = CrudOperations(engine)
+
+    assert [movie['id'] for movie in crud.search_items(Movie, {}, '-imdb_score', 10)] == ['tm4', 'tm3', 'tm1', 'tm2']
+    assert [movie['id'] for movie in crud.search_items(Movie, {'min_score': 7}, 'imdb_score', 10)] == ['tm3', 'tm4']
+
+
+def test_get_items_version_changes_when_rows_are_added(engine):
+    crud = CrudOperations(engine)
+    assert crud.get_items_version(Movie) == [0, None]
+
+    with engine.begin() as connection:
+        connection.execute(insert(Movie), [movie_row('tm1')])
+
+    assert crud.get_items_version(Movie) == [1, 'tm1']
+
+
+def movie_model(id, **fields):
+    return MovieModel(**{**movie_row(id), 'imdb_id': None, **fields})
+
+
+def insert_movies(crud, movies):
+    return crud.bulk_insert_items(movies, Movie, MovieActor, MovieGenres, movie_genres, MovieProductionCountry, movie_production_country)
+
+
+def test_writes_invalidate_the_cached_details_of_the_written_items(engine):
+    cache = TTLCache(max_size=10, ttl=300)
+    crud = CrudOperations(engine, cache=cache)
+    for id in ('tm1', 'tm2', 'tm3'):
+        cache.set(('movie', id), {'id': id, 'stale': True})
+
+    crud.insert_item_into_database(movie_model('tm1'), Movie, MovieActor, MovieGenres, movie_genres, MovieProductionCountry, movie_production_country)
+    insert_movies(crud, [movie_model('tm2')])
+
+    assert get_movie(crud, 'tm1')['title'] == 'Title tm1'
+    assert get_movie(crud, 'tm2')['title'] == 'Title tm2'
+    assert cache.get(('movie', 'tm3')) == {'id': 'tm3', 'stale': True}
+
+
+def test_bulk_insert_reports_database_errors_per_item_and_keeps_the_valid_rows(engine):
+    crud = CrudOperations(engine)
+    invalid = MovieModel.model_construct(**{**movie_model('tm2').model_dump(), 'runtime': None})
+
+    result = insert_movies(crud, [movie_model('tm1', actors=[{'name': 'Ann'}]), invalid, movie_model('tm3'), movie_model('tm1')])
+
+    assert result['inserted'] == ['tm1', 'tm3']
+    assert [(error['index'], error['id']) for error in result['errors']] == [(1, 'tm2'), (3, 'tm1')]
+    assert 'NOT NULL' in result['errors'][0]['error']
+    assert get_movie(crud, 'tm1')['actors'] == [{'id': 1, 'name': 'Ann', 'role': 'ACTOR'}]
+    assert get_movie(crud, 'tm2') is None
+    assert get_movie(crud, 'tm3')['title'] == 'Title tm3'
+
+
+def test_bulk_insert_writes_the_resolved_role_of_each_actor(engine):
+    crud = CrudOperations(engine)
+
+    insert_movies(crud, [movie_model('tm1', actors=[{'name': 'Ann', 'role': 'DIRECTOR'}, {'name': 'Bob'}, {'name': 'Cid', 'role': 'WRITER'}])])
+
+    assert [(actor['name'], actor['role']) for actor in get_movie(crud, 'tm1')['actors']] == [('Ann', 'DIRECTOR'), ('Bob', 'ACTOR'), ('Cid', 'WRITER')]
+    with engine.connect() as connection:
+        assert connection.execute(select(Role.role, Role.id).order_by(Role.id)).all() == [('ACTOR', 1), ('DIRECTOR', 2), ('WRITER', 3)]
+
+
+def test_resolve_names_reads_back_names_inserted_concurrently(engine):
+    crud = CrudOperations(engine)
+
+    def insert_concurrently(connection, cursor, statement, *args):
+        if statement.startswith('INSERT INTO actor '):
+            cursor.connection.execute("INSERT INTO actor (id, name) VALUES (7, 'Ann')")
+    event.listen(engine, 'before_cursor_execute', insert_concurrently)
+    with Session(engine) as session:
+        ids = crud.resolve_names(session, Actor, Actor.name, {'Ann', 'Bob'})
+        session.commit()
+
+    assert ids == {'Ann': 7, 'Bob': 8}
+    with engine.connect() as connection:
+        assert connection.execute(select(Actor.name, Actor.id).order_by(Actor.id)).all() == [('Ann', 7), ('Bob', 8)]
+
+
+def test_committed_writes_publish_resolved_ids_to_the_dimension_cache(engine):
+    dimension_cache = DimensionCache()
+    crud = CrudOperations(engine, dimension_cache=dimension_cache)
+
+    insert_movies(crud, [movie_model('tm1', actors=[{'name': 'Ann'}], genres=[{'genre': 'drama'}])])
+    with engine.connect() as connection:
+        ann_id = connection.scalar(select(Actor.id).where(Actor.name == 'Ann'))
+
+    assert dimension_cache.lookup('actor', ['Ann', 'Bob']) == ({'Ann': ann_id}, ['Bob'])
+    assert dimension_cache.lookup('role', ['ACTOR']) == ({'ACTOR': 1}, [])
+    assert dimension_cache.lookup('movie_genre', ['drama']) == ({'drama': 1}, [])
+
+    insert_movies(crud, [movie_model('tm2', actors=[{'name': 'Ann'}])])
+
+    assert get_movie(crud, 'tm2')['actors'] == [{'id': ann_id, 'name': 'Ann', 'role': 'ACTOR'}]
@@ -0,0 +1,34 @@
+import pytest
+
+pd = pytest.importorskip('pandas')
+
+from src.DataHandler import CsvDataHandler
+
+
+def test_factorize_list_column_assigns_ids_to_new_and_repeated_values():
+    df = pd.DataFrame({
+        'id': ['tm1', 'tm2', 'tm3'],
+        'genres': ["['drama', 'comedy']", "['comedy']", "['drama', 'horror']"],
+    })
+    value_to_index = {'comedy': 7}
+
+    new_values, many_to_many_df = CsvDataHandler(df=df).factorize_list_column(['id', 'genres'], value_to_index)
+
+    assert value_to_index == {'comedy': 7, 'drama': 8, 'horror': 9}
+    assert list(new_values.index) == [8, 9]
+    assert list(new_values) == ['drama', 'horror']
+    assert list(many_to_many_df.itertuples(index=False, name=None)) == [
+        ('tm1', 8), ('tm1', 7), ('tm2', 7), ('tm3', 8), ('tm3', 9),
+    ]
+
+
+def test_factorize_list_column_keeps_ids_across_calls():
+    value_to_index = {}
+    first = CsvDataHandler(df=pd.DataFrame({'id': ['tm1'], 'genres': ["['drama']"]}))
+    second = CsvDataHandler(df=pd.DataFrame({'id': ['tm2'], 'genres': ["['drama', 'crime']"]}))
+
+    first.factorize_list_column(['id', 'genres'], value_to_index)
+    new_values, many_to_many_df = second.factorize_list_column(['id', 'genres'], value_to_index)
+
+    assert list(new_values) == ['crime']
+    assert list(many_to_many_df['genres']) == [1, 2]
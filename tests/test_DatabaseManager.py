@@ -0,0 +1,108 @@
+import pytest
+
+pd = pytest.importorskip('pandas')
+sqlalchemy = pytest.importorskip('sqlalchemy')
+
+from sqlalchemy import Column, ForeignKey, Integer, MetaData, Table, event, insert, select
+from sqlalchemy.pool import StaticPool
+from src.database.DatabaseManager import create_indexes_concurrently, find_duplicate_keys, load_tables_concurrently, load_tables_delta
+from src.database.Models import Base, Movie, MovieActor, MovieGenres, ingest_row_hash, movie_genres
+
+
+@pytest.fixture
+def engine():
+    engine = sqlalchemy.create_engine('sqlite://')
+    Base.metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.execute(insert(Movie), [
+            {'id': id, 'type': 'MOVIE', 'runtime': 90, 'is_movie_best_in_release_year': False} for id in ('tm1', 'tm2', 'tm3')
+        ])
+        connection.execute(insert(MovieGenres), [{'id': 1, 'genre': 'drama'}, {'id': 2, 'genre': 'comedy'}])
+    yield engine
+    engine.dispose()
+
+
+def stored_links(engine):
+    with engine.connect() as connection:
+        return sorted(connection.execute(select(movie_genres.c.movie_id, movie_genres.c.genre_id)).all())
+
+
+def stored_hash_keys(engine):
+    with engine.connect() as connection:
+        return sorted(connection.execute(select(ingest_row_hash.c.row_key).where(ingest_row_hash.c.table_name == 'movie_genre_link')).scalars())
+
+
+def links_df(pairs):
+    return pd.DataFrame(pairs, columns=['movie_id', 'genre_id'])
+
+
+def test_load_tables_delta_replaces_the_links_of_changed_titles_only(engine):
+    load_tables_delta(engine, Base.metadata, {'movie_genre_link': links_df([('tm1', 1), ('tm1', 2), ('tm2', 1)])})
+
+    written = load_tables_delta(engine, Base.metadata, {'movie_genre_link': links_df([('tm2', 1), ('tm1', 2)])})
+
+    assert written == {'movie_genre_link': 1}
+    assert stored_links(engine) == [('tm1', 2), ('tm2', 1)]
+    assert load_tables_delta(engine, Base.metadata, {'movie_genre_link': links_df([('tm1', 2), ('tm2', 1)])}) == {'movie_genre_link': 0}
+
+
+def test_load_tables_delta_deletes_the_links_of_titles_missing_from_the_frame(engine):
+    load_tables_delta(engine, Base.metadata, {'movie_genre_link': links_df([('tm1', 1), ('tm2', 1), ('tm2', 2), ('tm3', 2)])})
+
+    load_tables_delta(engine, Base.metadata, {'movie_genre_link': links_df([('tm1', 1)])},
+                      link_owners={'movie_genre_link': ['tm1', 'tm2']})
+
+    assert stored_links(engine) == [('tm1', 1), ('tm3', 2)]
+    assert stored_hash_keys(engine) == ['tm1', 'tm3']
+    assert load_tables_delta(engine, Base.metadata, {'movie_genre_link': links_df([])},
+                             link_owners={'movie_genre_link': ['tm2']}) == {'movie_genre_link': 0}
+
+
+def test_find_duplicate_keys_reports_repeated_keys(engine):
+    with engine.begin() as connection:
+        connection.execute(insert(MovieActor), [{'movie_id': 'tm1', 'name': 1, 'role': 1}] * 3 + [{'movie_id': 'tm2', 'name': 1, 'role': 1}])
+
+    with engine.connect() as connection:
+        assert find_duplicate_keys(connection, 'movie_actor', ['movie_id', 'name']) == (1, [('tm1', 1)])
+        assert find_duplicate_keys(connection, 'movie', ['id']) == (0, [])
+
+
+def test_create_indexes_concurrently_requires_postgresql(engine):
+    with pytest.raises(ValueError):
+        create_indexes_concurrently(engine, Base.metadata)
+
+
+def chain_metadata():
+    metadata = MetaData()
+    Table('country', metadata, Column('id', Integer, primary_key=True))
+    Table('city', metadata, Column('id', Integer, primary_key=True), Column('country_id', ForeignKey('country.id'), nullable=False))
+    Table('street', metadata, Column('id', Integer, primary_key=True), Column('city_id', ForeignKey('city.id'), nullable=False))
+    return metadata
+
+
+def test_load_tables_concurrently_loads_referenced_tables_first():
+    engine = sqlalchemy.create_engine('sqlite://', poolclass=StaticPool, connect_args={'check_same_thread': False})
+    event.listen(engine, 'connect', lambda connection, _: connection.execute('PRAGMA foreign_keys=ON'))
+    metadata = chain_metadata()
+    metadata.create_all(engine)
+    inserted = []
+    event.listen(engine, 'before_cursor_execute', lambda connection, cursor, statement, *args: statement.startswith('INSERT') and inserted.append(statement.split()[2]))
+
+    load_tables_concurrently(engine, metadata, {
+        'street': pd.DataFrame({'id': [1, 2], 'city_id': [1, 1]}),
+        'city': pd.DataFrame({'id': [1], 'country_id': [1]}),
+        'country': pd.DataFrame({'id': [1]}),
+    }, method='insert')
+
+    assert inserted == ['country', 'city', 'street']
+    with engine.connect() as connection:
+        assert connection.execute(select(metadata.tables['street'].c.id)).scalars().all() == [1, 2]
+    engine.dispose()
+
+
+def test_load_tables_concurrently_rejects_circular_foreign_keys():
+    metadata = chain_metadata()
+    metadata.tables['country'].append_column(Column('capital_id', ForeignKey('street.id')))
+
+    with pytest.raises(ValueError, match='Circular foreign keys'):
+        load_tables_concurrently(sqlalchemy.create_engine('sqlite://'), metadata, {name: pd.DataFrame() for name in metadata.tables})
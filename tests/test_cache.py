@@ -0,0 +1,71 @@
+import pytest
+
+from app.common import cache as cache_module
+from app.common.cache import TTLCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(cache_module.time, 'monotonic', clock)
+    return clock
+
+
+def test_entries_expire_after_their_ttl(clock):
+    cache = TTLCache(max_size=10, ttl=30)
+    cache.set('tm1', {'id': 'tm1'})
+
+    clock.now += 30
+    assert cache.get('tm1') == {'id': 'tm1'}
+    clock.now += 0.5
+    assert cache.get('tm1') is None
+    assert cache.stats() == {'size': 0, 'hits': 1, 'misses': 1, 'evictions': 1}
+
+
+def test_storing_a_key_again_restarts_its_ttl(clock):
+    cache = TTLCache(max_size=10, ttl=30)
+    cache.set('tm1', 'old')
+    clock.now += 20
+    cache.set('tm1', 'new')
+    clock.now += 20
+
+    assert cache.get('tm1') == 'new'
+
+
+def test_the_least_recently_used_entry_is_evicted_at_capacity(clock):
+    cache = TTLCache(max_size=2, ttl=30)
+    cache.set('tm1', 1)
+    cache.set('tm2', 2)
+    assert cache.get('tm1') == 1
+    cache.set('tm3', 3)
+
+    assert cache.get('tm2') is None
+    assert (cache.get('tm1'), cache.get('tm3')) == (1, 3)
+    assert cache.stats()['evictions'] == 1
+
+
+def test_invalidate_and_clear_remove_entries(clock):
+    cache = TTLCache(max_size=10, ttl=30)
+    cache.set('tm1', 1)
+    cache.set('tm2', 2)
+
+    cache.invalidate('tm1')
+    cache.invalidate('missing')
+    assert (cache.get('tm1'), cache.get('tm2')) == (None, 2)
+    cache.clear()
+    assert cache.stats()['size'] == 0
+
+
+def test_a_cache_without_capacity_stores_nothing(clock):
+    cache = TTLCache(max_size=0, ttl=30)
+    cache.set('tm1', 1)
+
+    assert cache.get('tm1') is None
@@ -0,0 +1,29 @@
+import json
+
+import pytest
+
+pytest.importorskip('fastapi')
+
+from starlette.requests import Request
+from app.common.etag import compute_etag, conditional_response, not_modified
+
+
+def request_with(if_none_match=None):
+    headers = [(b'if-none-match', if_none_match.encode('ascii'))] if if_none_match else []
+    return Request({'type': 'http', 'method': 'GET', 'path': '/movie/all', 'headers': headers})
+
+
+def test_conditional_response_tags_the_encoded_body():
+    response = conditional_response(request_with(), [{'id': 'tm1', 'imdb_score': 7.5}])
+
+    assert json.loads(response.body) == [{'id': 'tm1', 'imdb_score': 7.5}]
+    assert response.headers['etag'] == compute_etag(response.body)
+    assert conditional_response(request_with(response.headers['etag']), [{'id': 'tm1', 'imdb_score': 7.5}]).status_code == 304
+
+
+def test_not_modified_answers_from_the_version_key_alone():
+    etag = compute_etag([3, 'tm3'])
+
+    assert not_modified(request_with(f'W/{etag}'), etag).status_code == 304
+    assert not_modified(request_with(compute_etag([4, 'tm4'])), etag) is None
+    assert not_modified(request_with(), etag) is None
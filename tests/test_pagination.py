@@ -0,0 +1,13 @@
+import pytest
+
+from app.common.pagination import decode_cursor, encode_cursor
+
+
+def test_decode_cursor_round_trips_title_ids():
+    assert decode_cursor(encode_cursor('tm1234')) == 'tm1234'
+
+
+def test_decode_cursor_rejects_keys_of_another_type():
+    with pytest.raises(ValueError):
+        decode_cursor(encode_cursor(1234))
+    assert decode_cursor(encode_cursor([2001, 'tm1234', 'ACTOR']), list) == [2001, 'tm1234', 'ACTOR']
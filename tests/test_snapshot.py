@@ -0,0 +1,27 @@
+from app.common.snapshot import CatalogSnapshot
+
+
+def test_catalog_snapshot_is_stale_until_loaded():
+    snapshot = CatalogSnapshot(ttl=300)
+    assert snapshot.is_stale()
+    snapshot.load([{'id': 'tm1', 'title': 'A'}])
+    assert not snapshot.is_stale()
+    assert snapshot.listing() == b'[{"id":"tm1","title":"A"}]'
+
+
+def test_catalog_snapshot_expires_after_its_ttl():
+    snapshot = CatalogSnapshot(ttl=-1)
+    snapshot.load([{'id': 'tm1', 'title': 'A'}])
+    snapshot.set_detail('tm1', {'id': 'tm1', 'title': 'A', 'actors': []})
+    assert snapshot.is_stale()
+    assert snapshot.get_detail('tm1') is None
+
+
+def test_catalog_snapshot_lists_titles_by_id_whatever_the_load_order():
+    snapshot = CatalogSnapshot(ttl=300)
+    snapshot.load([{'id': 'tm2'}, {'id': 'tm1'}])
+    first_listing = snapshot.listing()
+    snapshot.upsert({'id': 'tm0'})
+
+    assert first_listing == b'[{"id":"tm1"},{"id":"tm2"}]'
+    assert snapshot.listing() == b'[{"id":"tm0"},{"id":"tm1"},{"id":"tm2"}]'